@@ -1,12 +1,17 @@
 from .. import binding_config
 from .api_backend import ApiBackend
 from .api_get_only_backend import ApiGetOnlyBackend
+from .async_api_backend import AsyncApiBackend
 from .backend import Backend
+from .csv_backend import CsvBackend
 from .cursor_backend import CursorBackend
 from .example_backend import ExampleBackend
 from .file_backend import FileBackend
+from .http_cache import HttpCache
 from .json_backend import JsonBackend
+from .json_lines_backend import JsonLinesBackend
 from .memory_backend import MemoryBackend
+from .memory_snapshot import MemorySnapshot
 from .restful_api_advanced_search_backend import RestfulApiAdvancedSearchBackend
 from .secrets_backend import SecretsBackend
 
@@ -18,13 +23,18 @@ def example_backend(data):
 __all__ = [
     "ApiBackend",
     "ApiGetOnlyBackend",
+    "AsyncApiBackend",
     "Backend",
+    "CsvBackend",
     "CursorBackend",
     "ExampleBackend",
     "example_backend",
     "FileBackend",
+    "HttpCache",
     "JsonBackend",
+    "JsonLinesBackend",
     "MemoryBackend",
+    "MemorySnapshot",
     "RestfulApiAdvancedSearchBackend",
     "SecretsBackend",
 ]
@@ -1,4 +1,9 @@
+from concurrent.futures import Future
+import hashlib
+import json
 import re
+import threading
+import time
 from typing import Any, Callable, Dict, List, Tuple
 
 from requests import Session
@@ -8,6 +13,8 @@ from .. import model
 from ..autodoc.schema import Integer as AutoDocInteger
 from ..column_types import JSON, DateTime
 from .backend import Backend
+from .http_cache import request_key
+from .json_stream import JsonStream
 
 
 class NullAuth(AuthBase):
@@ -32,6 +39,14 @@ class ApiBackend(Backend):
     _requests: Session
     _auth = None
     _records = None
+    _cache = None
+    _prefetch_batch_size = 0
+    _prefetch_ttl = 5
+    _stream_records = False
+    _stream_chunk_size = 65536
+    _prefetched = None
+    _in_flight = None
+    _in_flight_lock = None
 
     _allowed_configs = [
         "select_all",
@@ -51,10 +66,23 @@ class ApiBackend(Backend):
 
     def __init__(self, requests):
         self._requests = requests
+        self._in_flight_lock = threading.Lock()
 
-    def configure(self, url=None, auth=None):
+    def configure(self, url=None, auth=None, cache=None, prefetch_batch_size=0, prefetch_ttl=5, stream_records=False):
+        """
+        Configures the backend.
+
+        Pass an HttpCache as `cache` to cache the responses of records and count requests according to the caching
+        headers returned by the API.  Set `prefetch_batch_size` to batch up relationship lookups, and `prefetch_ttl`
+        to control how long the results are used for (see `prefetch`).  Set `stream_records` for APIs that return a
+        lot of records at once (see `_stream_records_response`).
+        """
         self.url = url
         self._auth = auth
+        self._cache = cache
+        self._prefetch_batch_size = prefetch_batch_size
+        self._prefetch_ttl = prefetch_ttl
+        self._stream_records = stream_records
 
     def records_url(self, configuration: Dict[str, Any]) -> str:
         return self.url
@@ -89,6 +117,7 @@ class ApiBackend(Backend):
     def update(self, id, data, model):
         [url, method, json_data, headers] = self._build_update_request(id, data, model)
         response = self._execute_request(url, method, json=json_data, headers=headers)
+        self._forget_prefetched(model)
         if not response.content:
             return {**model.data, **data}
         return self._map_update_response(response.json())
@@ -105,6 +134,7 @@ class ApiBackend(Backend):
     def create(self, data, model):
         [url, method, json_data, headers] = self._build_create_request(data, model)
         response = self._execute_request(url, method, json=json_data, headers=headers)
+        self._forget_prefetched(model)
         return self._map_create_response(response.json())
 
     def _build_create_request(self, data, model):
@@ -119,6 +149,7 @@ class ApiBackend(Backend):
     def delete(self, id, model):
         [url, method, json_data, headers] = self._build_delete_request(id, model)
         response = self._execute_request(url, method, json=json_data, headers=headers)
+        self._forget_prefetched(model)
         return self._validate_delete_response(response.json())
 
     def _build_delete_request(self, id, model):
@@ -134,7 +165,7 @@ class ApiBackend(Backend):
     def count(self, configuration, model):
         configuration = self._check_query_configuration(configuration)
         [url, method, json_data, headers] = self._build_count_request(configuration)
-        response = self._execute_request(url, method, json=json_data, headers=headers)
+        response = self._execute_request(url, method, json=json_data, headers=headers, cacheable=True)
         return self._map_count_response(response.json())
 
     def _build_count_request(self, configuration):
@@ -153,16 +184,128 @@ class ApiBackend(Backend):
 
     def records(self, configuration, model, next_page_data=None):
         configuration = self._check_query_configuration(configuration)
+        prefetched = self._prefetched_records(configuration)
+        if prefetched is not None:
+            return prefetched
         [url, method, json_data, headers] = self._build_records_request(configuration)
-        response = self._execute_request(url, method, json=json_data, headers=headers)
-        records = self._map_records_response(response.json())
+        if self._stream_records:
+            response = self._execute_request(url, method, json=json_data, headers=headers, stream=True)
+            return self._stream_records_response(configuration, response, next_page_data)
+        response = self._execute_request(url, method, json=json_data, headers=headers, cacheable=True)
+        response_json = response.json()
+        records = self._map_records_response(response_json)
         if type(next_page_data) == dict:
-            limit = configuration.get("limit", None)
-            start = configuration.get("pagination", {}).get("start", 0)
-            if limit and len(records) == limit:
-                next_page_data["start"] = start + limit
+            self._populate_next_page_data(configuration, response_json, len(records), next_page_data)
         return records
 
+    def _stream_records_response(self, configuration, response, next_page_data):
+        """
+        Yields the records from the `data` key of the response as they are downloaded and decoded.
+
+        This is used instead of `_map_records_response` when `stream_records` is set, so that large responses never
+        have to be held in memory all at once.  The rest of the response is still decoded normally and, once all the
+        records have been read, is used to populate next_page_data.  Since the response is consumed as it is
+        read, it isn't cached.
+        """
+        stream = JsonStream(response.iter_content(self._stream_chunk_size), "data")
+        number_records = 0
+        try:
+            for record in stream.items():
+                number_records += 1
+                yield record
+        finally:
+            response.close()
+        if not stream.array_found:
+            raise ValueError("Unexpected response from records request")
+        if type(next_page_data) == dict:
+            self._populate_next_page_data(configuration, stream.envelope, number_records, next_page_data)
+
+    def _populate_next_page_data(self, configuration, response_json, number_records, next_page_data):
+        limit = configuration.get("limit", None)
+        start = configuration.get("pagination", {}).get("start", 0)
+        if limit and number_records == limit:
+            next_page_data["start"] = start + limit
+
+    def prefetch(self, model, column_name, values):
+        """
+        Fetches the records matching the given values with `IN` queries, for the individual lookups that follow.
+
+        Without this, rendering a page of records with a BelongsTo column pointing at an API-backed model makes
+        one request per record.  Instead, when `prefetch_batch_size` is configured, the values are looked up in
+        batches of that size with a `column_name IN (...)` condition (see `_build_records_request` to point these at
+        a different endpoint), and for the next `prefetch_ttl` seconds any records request that is just a
+        `column_name=value` lookup for one of the values that came back is answered from the results without
+        contacting the API.  Values that didn't come back (e.g. because the API paginated the response or ignored
+        the condition) are still looked up individually.  The results are kept separately for each set of
+        credentials (see `_auth_identity`), and are thrown away whenever a record in the same table is created,
+        updated, or deleted through this backend.
+        """
+        if not self._prefetch_batch_size:
+            return
+        now = time.monotonic()
+        if self._prefetched is None:
+            self._prefetched = {}
+        self._prefetched = {
+            key: prefetched for (key, prefetched) in self._prefetched.items() if prefetched["expires_at"] > now
+        }
+        table_name = model.table_name()
+        identity = self._auth_identity()
+        values = list(dict.fromkeys(str(value) for value in values if value is not None and value != ""))
+        values = [value for value in values if (identity, table_name, column_name, value) not in self._prefetched]
+        for start in range(0, len(values), self._prefetch_batch_size):
+            batch = values[start : start + self._prefetch_batch_size]
+            records = self.records(
+                {
+                    "table_name": table_name,
+                    "wheres": [{"table": "", "column": column_name, "operator": "in", "values": batch}],
+                    "sorts": [],
+                    "pagination": {},
+                    "limit": "",
+                    "select_all": True,
+                    "model_columns": model.columns(),
+                },
+                model,
+            )
+            expires_at = time.monotonic() + self._prefetch_ttl
+            batch_values = set(batch)
+            matches = {}
+            for record in records:
+                value = str(record.get(column_name))
+                if value in batch_values:
+                    matches.setdefault(value, []).append(record)
+            for value, matching_records in matches.items():
+                self._prefetched[(identity, table_name, column_name, value)] = {
+                    "records": matching_records,
+                    "expires_at": expires_at,
+                }
+
+    def _prefetched_records(self, configuration):
+        """
+        Returns the prefetched records for a simple `column=value` lookup, or None if we don't have them
+        """
+        if not self._prefetched or len(configuration["wheres"]) != 1:
+            return None
+        if configuration["sorts"] or configuration["pagination"] or configuration["limit"]:
+            return None
+        where = configuration["wheres"][0]
+        if where["operator"] != "=" or where.get("table") or len(where["values"]) != 1:
+            return None
+        prefetched = self._prefetched.get(
+            (self._auth_identity(), configuration["table_name"], where["column"], str(where["values"][0]))
+        )
+        if not prefetched or prefetched["expires_at"] <= time.monotonic():
+            return None
+        return [{**record} for record in prefetched["records"]]
+
+    def _forget_prefetched(self, model):
+        """
+        Throws away the prefetched records for the table of the given model, since they may now be out of date
+        """
+        if not self._prefetched:
+            return
+        table_name = model.table_name()
+        self._prefetched = {key: prefetched for (key, prefetched) in self._prefetched.items() if key[1] != table_name}
+
     def _build_records_request(self, configuration):
         (url, configuration) = self._finalize_url_and_configuration(self.records_url(configuration), configuration)
         return [url, self.records_method(configuration), self._as_post_data(configuration), {}]
@@ -173,25 +316,94 @@ class ApiBackend(Backend):
         return json["data"]
 
     def _execute_request(
-        self, url: str, method: str, json: dict[str, Any] = {}, headers: dict[str, Any] = {}, is_retry: bool = False
+        self,
+        url: str,
+        method: str,
+        json: dict[str, Any] = {},
+        headers: dict[str, Any] = {},
+        is_retry: bool = False,
+        cacheable: bool = False,
+        stream: bool = False,
     ):
+        if cacheable:
+            identity = self._auth_identity()
+            # identical reads that are already in flight (e.g. from other threads) share the same response
+            return self._coalesce(
+                request_key(method, url, json, headers, identity=identity),
+                lambda: self._cache.fetch(
+                    method,
+                    url,
+                    json,
+                    headers,
+                    lambda headers: self._execute_request(url, method, json=json, headers=headers, is_retry=is_retry),
+                    identity=identity,
+                )
+                if self._cache
+                else self._execute_request(url, method, json=json, headers=headers, is_retry=is_retry),
+            )
+
         # the requests library seems to build a slightly different request if you specify the json parameter,
         # even if it is null, and this causes trouble for some picky servers
+        extra_kwargs = {"stream": True} if stream else {}
         if not json:
-            response = self._requests.request(method, url, headers=headers, auth=self._auth if self._auth else NullAuth())
+            response = self._requests.request(
+                method, url, headers=headers, auth=self._auth if self._auth else NullAuth(), **extra_kwargs
+            )
         else:
             response = self._requests.request(
-                method, url, headers=headers, json=json, auth=self._auth if self._auth else NullAuth()
+                method, url, headers=headers, json=json, auth=self._auth if self._auth else NullAuth(), **extra_kwargs
             )
 
         if not response.ok:
-            if self._auth and self._auth.has_dynamic_credentials and not is_retry:
-                return self._execute_request(url, method, json=json, headers=headers, is_retry=True)
+            # only an authentication failure might be fixed by fresh credentials: anything else (e.g. rate limiting)
+            # is already retried by the transport, as appropriate
+            is_auth_failure = response.status_code in [401, 403]
+            if is_auth_failure and self._auth and self._auth.has_dynamic_credentials and not is_retry:
+                return self._execute_request(url, method, json=json, headers=headers, is_retry=True, stream=stream)
             if not response.ok:
                 raise ValueError(f"Failed request.  Status code: {response.status_code}, message: {response.content!r}")
 
         return response
 
+    def _auth_identity(self):
+        """
+        Returns a hash of the credentials we send, so that cached responses are never shared between credentials.
+        """
+        if not self._auth:
+            return ""
+        try:
+            identity = json.dumps(self._auth.headers(), sort_keys=True, default=str)
+        except Exception:
+            # we can't tell what this auth object will send, so don't share its responses with anyone else
+            identity = f"{self._auth.__class__.__name__}:{id(self._auth)}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _coalesce(self, key, execute):
+        """
+        Calls `execute` unless a call with the same key is already running, in which case we wait for its result
+        """
+        with self._in_flight_lock:
+            if self._in_flight is None:
+                self._in_flight = {}
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[key] = future
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = execute()
+            future.set_result(result)
+            return result
+        except Exception as exception:
+            future.set_exception(exception)
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
     def _check_query_configuration(self, configuration):
         for key in configuration.keys():
             if key not in self._allowed_configs and configuration[key]:
@@ -237,6 +449,22 @@ class ApiBackend(Backend):
     def allowed_pagination_keys(self) -> List[str]:
         return ["start"]
 
+    def predict_next_pages(
+        self, configuration: Dict[str, Any], next_page_data: Dict[str, Any], number_pages: int
+    ) -> List[Dict[str, Any]]:
+        limit = configuration.get("limit")
+        if not limit or set(next_page_data.keys()) != {"start"}:
+            return None
+        try:
+            start = int(next_page_data["start"])
+            current_start = int((configuration.get("pagination") or {}).get("start", 0) or 0)
+        except (TypeError, ValueError):
+            return None
+        # if the API isn't simply moving forward by one page, then we can't guess where it's going next
+        if start != current_start + limit:
+            return None
+        return [{"start": start + index * limit} for index in range(number_pages)]
+
     def documentation_pagination_next_page_response(self, case_mapping: Callable) -> List[Any]:
         return [AutoDocInteger(case_mapping("start"), example=0)]
 
@@ -1,3 +1,5 @@
+import threading
+import time
 import unittest
 from types import SimpleNamespace
 from unittest.mock import MagicMock, call
@@ -182,3 +184,126 @@ class ApiBackendTest(unittest.TestCase):
 
         self.assertEqual({"id": 5}, records[0])
         self.assertEqual({"id": 10}, records[1])
+
+    def test_stream_records(self):
+        body = b'{"data": [{"id": 5}, {"id": 10}], "total_matches": 2}'
+        response = MagicMock(ok=True)
+        response.iter_content = lambda chunk_size: iter([body[:20], body[20:]])
+        self.requests.request = MagicMock(return_value=response)
+        self.backend.configure(url="https://example.com", auth=self.auth, stream_records=True)
+        next_page_data = {}
+        records = self.backend.records(
+            {"wheres": [], "sorts": [], "pagination": {"start": 0}, "limit": 2}, "model", next_page_data=next_page_data
+        )
+        self.requests.request.assert_called_with(
+            "GET", "https://example.com", headers={}, json={"limit": 2}, auth=self.auth, stream=True
+        )
+        self.assertEqual({}, next_page_data)
+        self.assertEqual([{"id": 5}, {"id": 10}], list(records))
+        self.assertEqual({"start": 2}, next_page_data)
+        response.close.assert_called_once()
+
+    def test_prefetch(self):
+        response = type("", (), {"ok": True, "json": lambda: {"data": [{"id": 5}, {"id": 10}]}})
+        self.requests.request = MagicMock(return_value=response)
+        model = SimpleNamespace(table_name=lambda: "users", columns=lambda: {})
+        self.backend.configure(url="https://example.com", auth=self.auth, prefetch_batch_size=2)
+        self.backend.prefetch(model, "id", [5, "10", 5, None, 15])
+        self.assertEqual(2, self.requests.request.call_count)
+        self.assertEqual(
+            call(
+                "GET",
+                "https://example.com",
+                headers={},
+                auth=self.auth,
+                json={"where": [{"column": "id", "operator": "in", "values": ["5", "10"]}]},
+            ),
+            self.requests.request.call_args_list[0],
+        )
+
+        def lookup(id, **configuration):
+            return self.backend.records(
+                {
+                    "table_name": "users",
+                    "wheres": [{"table": "", "column": "id", "operator": "=", "values": [id]}],
+                    "sorts": [],
+                    "pagination": {},
+                    **configuration,
+                },
+                model,
+            )
+
+        self.assertEqual([{"id": 10}], lookup("10"))
+        self.assertEqual([{"id": 5}], lookup(5))
+        self.assertEqual(2, self.requests.request.call_count)
+
+        # 15 didn't come back (the API may have paginated or ignored the condition), so it is looked up directly
+        lookup(15)
+        self.assertEqual(3, self.requests.request.call_count)
+
+        # anything else still goes to the API
+        lookup(20)
+        lookup(5, limit=1)
+        self.assertEqual(5, self.requests.request.call_count)
+
+    def test_prefetch_per_credentials_and_writes(self):
+        self.api_response = {"status": "success", "data": [{"id": 5}]}
+        model = SimpleNamespace(table_name=lambda: "users", columns=lambda: {}, id_column_name="id", data={})
+        self.backend.configure(url="https://example.com", auth=self.auth, prefetch_batch_size=2)
+        self.backend.prefetch(model, "id", [5])
+        self.assertEqual(1, self.requests.request.call_count)
+
+        def lookup():
+            return self.backend.records(
+                {
+                    "table_name": "users",
+                    "wheres": [{"table": "", "column": "id", "operator": "=", "values": [5]}],
+                    "sorts": [],
+                    "pagination": {},
+                },
+                model,
+            )
+
+        lookup()
+        self.assertEqual(1, self.requests.request.call_count)
+
+        # other credentials never see what was fetched with ours
+        self.auth.headers.return_value = {"Authorization": "Bearer: qwerty"}
+        lookup()
+        self.assertEqual(2, self.requests.request.call_count)
+        self.auth.headers.return_value = {"Authorization": "Bearer: asdfer"}
+        lookup()
+        self.assertEqual(2, self.requests.request.call_count)
+
+        # and writes to the table throw away what we fetched
+        self.backend.update(5, {"name": "bob"}, model)
+        lookup()
+        self.assertEqual(4, self.requests.request.call_count)
+
+    def test_prefetch_is_opt_in(self):
+        self.requests.request = MagicMock()
+        model = SimpleNamespace(table_name=lambda: "users", columns=lambda: {})
+        self.backend.configure(url="https://example.com", auth=self.auth)
+        self.backend.prefetch(model, "id", [5, 10])
+        self.requests.request.assert_not_called()
+
+    def test_coalesce_identical_requests(self):
+        def slow_request(*args, **kwargs):
+            time.sleep(0.05)
+            return type("", (), {"ok": True, "json": lambda: {"data": [{"id": 5}]}})
+
+        self.requests.request = MagicMock(side_effect=slow_request)
+        results = []
+        configuration = {"wheres": [], "sorts": [], "pagination": {}, "limit": 10}
+        threads = [
+            threading.Thread(target=lambda: results.append(self.backend.records({**configuration}, "model")))
+            for i in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([[{"id": 5}]] * 3, results)
+        self.requests.request.assert_called_once()
+        # other backends don't wait on our requests
+        self.assertIsNot(self.backend._in_flight_lock, ApiBackend(self.requests)._in_flight_lock)
@@ -14,11 +14,9 @@ class ApiGetOnlyBackend(ApiBackend):
         "select_all",
     ]
 
-    def __init__(self, requests):
-        self._requests = requests
-
-    def configure(self, auth=None, origin="", id_column_name="id"):
+    def configure(self, auth=None, origin="", id_column_name="id", cache=None):
         self._auth = auth
+        self._cache = cache
         self._origin = origin
         self._id_column_name = id_column_name
 
@@ -41,6 +39,10 @@ class ApiGetOnlyBackend(ApiBackend):
     def records_method(self, configuration: Dict[str, Any]) -> str:
         return "GET"
 
+    def prefetch(self, model, column_name, values):
+        # we can only fetch one record at a time, so there's nothing to batch
+        pass
+
     def _map_records_response(self, json):
         response = super()._map_records_response(json)
         if isinstance(response, dict):
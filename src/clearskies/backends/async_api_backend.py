@@ -0,0 +1,176 @@
+import asyncio
+import threading
+from typing import Any
+
+from .api_backend import ApiBackend
+
+
+class AsyncApiBackend(ApiBackend):
+    """
+    An ApiBackend that can be awaited.
+
+    It builds requests and maps responses with exactly the same hooks as the ApiBackend (`records_url`,
+    `records_method`, `_build_records_request`, `_map_records_response`, etc...), so subclasses work the same way,
+    but also provides `records_async`, `count_async`, `create_async`, `update_async`, and `delete_async`.  Models
+    use these from `await models.fetch_async()` and `await models.count_async()`, so several API calls can be run
+    concurrently with `asyncio.gather`.
+
+    By default, the requests are executed by the (thread-safe) requests session in a worker thread, so connection
+    pooling, retries, the HttpCache, and request coalescing all behave as they do for the ApiBackend.  Alternatively,
+    pass an async HTTP client as `client` (e.g. an `httpx.AsyncClient`, or anything else with an awaitable
+    `request(method, url, headers=..., json=...)` method) and requests will be made on the event loop itself.  In
+    that case the synchronous methods (used by regular code, like handlers) run the async ones on a single event
+    loop that lives in a background thread.  It is shared by all instances and kept for the life of the process,
+    since clients like `httpx.AsyncClient` can only be used from the event loop they started on.
+    """
+
+    _client = None
+    _sync_loop = None
+    _sync_loop_lock = threading.Lock()
+
+    def configure(
+        self,
+        url=None,
+        auth=None,
+        cache=None,
+        prefetch_batch_size=0,
+        prefetch_ttl=5,
+        stream_records=False,
+        client=None,
+    ):
+        """
+        Configures the backend.
+
+        See ApiBackend.configure for the other options.  Note that the cache and `stream_records` are not used with
+        an async `client`.
+        """
+        super().configure(
+            url=url,
+            auth=auth,
+            cache=cache,
+            prefetch_batch_size=prefetch_batch_size,
+            prefetch_ttl=prefetch_ttl,
+            stream_records=stream_records,
+        )
+        self._client = client
+
+    def records(self, configuration, model, next_page_data=None):
+        if not self._client:
+            return super().records(configuration, model, next_page_data=next_page_data)
+        return self._run_sync(self.records_async(configuration, model, next_page_data=next_page_data))
+
+    def count(self, configuration, model):
+        if not self._client:
+            return super().count(configuration, model)
+        return self._run_sync(self.count_async(configuration, model))
+
+    def create(self, data, model):
+        if not self._client:
+            return super().create(data, model)
+        return self._run_sync(self.create_async(data, model))
+
+    def update(self, id, data, model):
+        if not self._client:
+            return super().update(id, data, model)
+        return self._run_sync(self.update_async(id, data, model))
+
+    def delete(self, id, model):
+        if not self._client:
+            return super().delete(id, model)
+        return self._run_sync(self.delete_async(id, model))
+
+    async def records_async(self, configuration, model, next_page_data=None):
+        configuration = self._check_query_configuration(configuration)
+        prefetched = self._prefetched_records(configuration)
+        if prefetched is not None:
+            return prefetched
+        [url, method, json_data, headers] = self._build_records_request(configuration)
+        response = await self._execute_request_async(url, method, json=json_data, headers=headers, cacheable=True)
+        response_json = response.json()
+        records = self._map_records_response(response_json)
+        if type(next_page_data) == dict:
+            self._populate_next_page_data(configuration, response_json, len(records), next_page_data)
+        return records
+
+    async def count_async(self, configuration, model):
+        configuration = self._check_query_configuration(configuration)
+        [url, method, json_data, headers] = self._build_count_request(configuration)
+        response = await self._execute_request_async(url, method, json=json_data, headers=headers, cacheable=True)
+        return self._map_count_response(response.json())
+
+    async def create_async(self, data, model):
+        [url, method, json_data, headers] = self._build_create_request(data, model)
+        response = await self._execute_request_async(url, method, json=json_data, headers=headers)
+        self._forget_prefetched(model)
+        return self._map_create_response(response.json())
+
+    async def update_async(self, id, data, model):
+        [url, method, json_data, headers] = self._build_update_request(id, data, model)
+        response = await self._execute_request_async(url, method, json=json_data, headers=headers)
+        self._forget_prefetched(model)
+        if not response.content:
+            return {**model.data, **data}
+        return self._map_update_response(response.json())
+
+    async def delete_async(self, id, model):
+        [url, method, json_data, headers] = self._build_delete_request(id, model)
+        response = await self._execute_request_async(url, method, json=json_data, headers=headers)
+        self._forget_prefetched(model)
+        return self._validate_delete_response(response.json())
+
+    async def _execute_request_async(
+        self,
+        url: str,
+        method: str,
+        json: dict[str, Any] = {},
+        headers: dict[str, Any] = {},
+        is_retry: bool = False,
+        cacheable: bool = False,
+    ):
+        if not self._client:
+            return await asyncio.to_thread(
+                self._execute_request, url, method, json=json, headers=headers, is_retry=is_retry, cacheable=cacheable
+            )
+
+        request_headers = {**headers, **(self._auth.headers(retry_auth=is_retry) if self._auth else {})}
+        # same as with requests: don't send a body at all unless we actually have one
+        if not json:
+            response = await self._client.request(method, url, headers=request_headers)
+        else:
+            response = await self._client.request(method, url, headers=request_headers, json=json)
+
+        if response.status_code >= 400:
+            # only an authentication failure might be fixed by fresh credentials
+            is_auth_failure = response.status_code in [401, 403]
+            if is_auth_failure and self._auth and self._auth.has_dynamic_credentials and not is_retry:
+                return await self._execute_request_async(url, method, json=json, headers=headers, is_retry=True)
+            raise ValueError(f"Failed request.  Status code: {response.status_code}, message: {response.content!r}")
+
+        return response
+
+    def _run_sync(self, coroutine):
+        """
+        Runs the coroutine to completion, on the background event loop, for a synchronous caller
+        """
+        loop = self._get_sync_loop()
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            coroutine.close()
+            raise RuntimeError(
+                f"The synchronous methods of {self.__class__.__name__} can't be called from its own event loop: "
+                + "use the async methods instead"
+            )
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    @staticmethod
+    def _get_sync_loop():
+        # the loop is shared by every instance (and subclass), so it lives on this class
+        with AsyncApiBackend._sync_loop_lock:
+            if AsyncApiBackend._sync_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="async-api-backend", daemon=True).start()
+                AsyncApiBackend._sync_loop = loop
+            return AsyncApiBackend._sync_loop
@@ -0,0 +1,97 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from .async_api_backend import AsyncApiBackend
+
+
+class AsyncApiBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.api_response = {"data": [{"id": 5}]}
+        response = type("", (), {"ok": True, "json": lambda: self.api_response, "content": "sup"})
+        self.requests = type("", (), {"request": MagicMock(return_value=response)})()
+        self.configuration = {"table_name": "users", "pagination": {}, "limit": 1}
+
+    def client_response(self, status_code=200, json=None):
+        return SimpleNamespace(status_code=status_code, content=b"sup", json=lambda: json)
+
+    def test_records_with_requests(self):
+        backend = AsyncApiBackend(self.requests)
+        backend.configure(url="https://example.com")
+        next_page_data = {}
+        records = asyncio.run(backend.records_async(self.configuration, "model", next_page_data=next_page_data))
+        self.assertEqual([{"id": 5}], records)
+        self.assertEqual({"start": 1}, next_page_data)
+        self.requests.request.assert_called_once()
+
+        # the sync methods don't go through an event loop at all
+        self.assertEqual([{"id": 5}], backend.records({"table_name": "users", "pagination": {}}, "model"))
+
+    def test_concurrent_records_with_client(self):
+        client = SimpleNamespace(request=AsyncMock(return_value=self.client_response(json=self.api_response)))
+        auth = SimpleNamespace(
+            headers=MagicMock(return_value={"Authorization": "Bearer: asdfer"}), has_dynamic_credentials=False
+        )
+        backend = AsyncApiBackend(self.requests)
+        backend.configure(url="https://example.com", auth=auth, client=client)
+
+        async def fetch_both():
+            return await asyncio.gather(
+                backend.records_async({"table_name": "users", "pagination": {}}, "model"),
+                backend.create_async({"name": "bob"}, "model"),
+            )
+
+        [records, created] = asyncio.run(fetch_both())
+        self.assertEqual([{"id": 5}], records)
+        self.assertEqual([{"id": 5}], created)
+        client.request.assert_any_call(
+            "POST", "https://example.com", headers={"Authorization": "Bearer: asdfer"}, json={"name": "bob"}
+        )
+        self.requests.request.assert_not_called()
+
+    def test_sync_bridge(self):
+        client = SimpleNamespace(request=AsyncMock(return_value=self.client_response(json={"total_matches": 10})))
+        backend = AsyncApiBackend(self.requests)
+        backend.configure(url="https://example.com", client=client)
+        self.assertEqual(10, backend.count({"table_name": "users", "pagination": {}}, "model"))
+
+        # and from inside a running event loop
+        async def count():
+            return backend.count({"table_name": "users", "pagination": {}}, "model")
+
+        self.assertEqual(10, asyncio.run(count()))
+
+    def test_sync_calls_share_one_event_loop(self):
+        # clients like httpx.AsyncClient only work on the event loop they started on
+        loops = []
+
+        async def request(*args, **kwargs):
+            loops.append(asyncio.get_running_loop())
+            return self.client_response(json={"total_matches": 10})
+
+        backend = AsyncApiBackend(self.requests)
+        backend.configure(url="https://example.com", client=SimpleNamespace(request=request))
+        for i in range(3):
+            self.assertEqual(10, backend.count({"table_name": "users", "pagination": {}}, "model"))
+        self.assertEqual(3, len(loops))
+        self.assertEqual(1, len(set(loops)))
+
+    def test_stream_records_configuration(self):
+        backend = AsyncApiBackend(self.requests)
+        backend.configure(url="https://example.com", stream_records=True)
+        self.assertTrue(backend._stream_records)
+
+    def test_retry_and_failure(self):
+        client = SimpleNamespace(
+            request=AsyncMock(
+                side_effect=[self.client_response(status_code=401), self.client_response(status_code=500)]
+            )
+        )
+        auth = SimpleNamespace(headers=MagicMock(return_value={}), has_dynamic_credentials=True)
+        backend = AsyncApiBackend(self.requests)
+        backend.configure(url="https://example.com", auth=auth, client=client)
+        with self.assertRaises(ValueError):
+            asyncio.run(backend.count_async({"table_name": "users", "pagination": {}}, "model"))
+        self.assertEqual(2, client.request.call_count)
+        auth.headers.assert_called_with(retry_auth=True)
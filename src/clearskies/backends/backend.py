@@ -21,6 +21,15 @@ class Backend(ABC):
         """
         pass
 
+    def create_many(self, records: List[Dict[str, Any]], model: model.Model) -> List[Dict[str, Any]]:
+        """
+        Creates a record for each of the data dictionaries and returns the new records, in the same order.
+
+        By default this just calls `create` for each one.  Backends that can insert several records at once
+        (e.g. the cursor backend) override this.
+        """
+        return [self.create(data, model) for data in records]
+
     @abstractmethod
     def delete(self, id: str, model: model.Model) -> bool:
         """
@@ -45,6 +54,9 @@ class Backend(ABC):
         next_page_data is used to return data to the caller.  Pass in an empty dictionary, and it will be populated
         with the data needed to return the next page of results.  If it is still an empty dictionary when returned,
         then there is no additional data.
+
+        Backends may also return a generator that yields records as they arrive (see ApiBackend), in which case
+        next_page_data is populated once the generator is exhausted.
         """
         pass
 
@@ -92,6 +104,46 @@ class Backend(ABC):
         """
         pass
 
+    def predict_next_pages(
+        self, configuration: Dict[str, Any], next_page_data: Dict[str, Any], number_pages: int
+    ) -> Union[List[Dict[str, Any]], None]:
+        """
+        Returns the pagination kwargs for the next `number_pages` pages, starting with the one in next_page_data.
+
+        `configuration` is the query configuration for the page that returned next_page_data.  This is used to fetch
+        several pages at once (see Models.paginate_all), so it should only return something if the pages after the
+        next one can be known ahead of time (e.g. offset-based pagination).  Otherwise, return None and pages will
+        be fetched one after another.
+        """
+        return None
+
+    async def records_async(
+        self, configuration: Dict[str, Any], model: model.Model, next_page_data: Dict[str, str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Awaitable version of `records`.
+
+        By default this just calls `records`, which blocks the event loop.  Backends that can do their I/O without
+        blocking (see AsyncApiBackend) override this.
+        """
+        return self.records(configuration, model, next_page_data=next_page_data)
+
+    async def count_async(self, configuration: Dict[str, Any], model: model.Model) -> int:
+        """
+        Awaitable version of `count`.  See `records_async`
+        """
+        return self.count(configuration, model)
+
+    def prefetch(self, model: model.Model, column_name: str, values: List[Any]) -> None:
+        """
+        Hints that records where `column_name` matches each of the given values are about to be looked up one by one.
+
+        This happens when rendering a page of records with relationships (e.g. one parent lookup per record for
+        a BelongsTo column).  Backends where each lookup is expensive can fetch all of them at once and serve the
+        individual lookups from that.  By default this does nothing.
+        """
+        pass
+
     def create_record_with_class(
         self, model_or_class: Union[model.Model, Type[model.Model]], data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -0,0 +1,403 @@
+from functools import cmp_to_key
+from .memory_backend import MemoryTable, _sort, gentle_float_conversion
+
+
+class ColumnarMemoryTable(MemoryTable):
+    """
+    A MemoryTable that stores its data by column instead of by row.
+
+    Each column lives in a NumPy array along with a boolean null mask.  Columns that contain only ints, floats, or
+    booleans get a typed array and everything else falls back to an object array.  Conditions are evaluated as
+    vectorized boolean masks, sorting happens via `lexsort`, and counting is just the sum of a mask.  Rows are
+    only turned back into dictionaries for the records that are actually returned.
+
+    New records are buffered and only merged into the column arrays when the table is next read, so that loading
+    a table record-by-record doesn't have to re-allocate every array for every record.
+
+    The intention is for the results to match the plain MemoryTable.  Conditions that don't have a vectorized
+    implementation (or which are used on columns whose data doesn't allow one) are checked with the same
+    lambdas that the MemoryTable uses, one value at a time.
+    """
+
+    _columns = None
+    _nulls = None
+    _deleted = None
+    _pending = None
+    _size = 0
+    _views = None
+
+    def __init__(self, model):
+        super().__init__(model)
+        try:
+            import numpy
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                "You must install numpy to use columnar storage in the MemoryBackend.  Try `pip install numpy`"
+            )
+
+        self._numpy = numpy
+        self._rows = None
+        self._columns = {}
+        self._nulls = {}
+        self._deleted = numpy.zeros(0, dtype=bool)
+        self._pending = []
+        self._size = 0
+        self._views = {}
+
+    def fork(self):
+        # flush first so that forks never share a list of pending records
+        self._flush()
+        return super().fork()
+
+    def _unshare(self):
+        if not self._shared:
+            return
+        self._id_index = {**self._id_index}
+        self._columns = {column_name: values.copy() for (column_name, values) in self._columns.items()}
+        self._nulls = {column_name: nulls.copy() for (column_name, nulls) in self._nulls.items()}
+        self._deleted = self._deleted.copy()
+        self._pending = [*self._pending]
+        self._views = {}
+        self._shared = False
+
+    def __getstate__(self):
+        self._flush()
+        state = super().__getstate__()
+        del state["_numpy"]
+        state["_views"] = {}
+        return state
+
+    def __setstate__(self, state):
+        import numpy
+
+        self.__dict__.update(state)
+        self._numpy = numpy
+
+    def add_like_index(self, column_name, gram_size=3):
+        # LIKE conditions are already vectorized for columnar tables, so there's nothing for an index to do.
+        pass
+
+    def seal(self):
+        # buffered records are merged in when the table is read, which is a change we can't make once readers are
+        # sharing the table
+        self._flush()
+
+    def load(self, rows, id_index):
+        self._columns = {}
+        self._nulls = {}
+        self._deleted = self._numpy.zeros(0, dtype=bool)
+        self._size = 0
+        self._pending = [*rows]
+        self._id_index = id_index
+        self._shared = False
+        self._advance_next_id()
+        self._flush()
+
+    def all_rows(self):
+        self._flush()
+        rows = self._materialize(self._numpy.arange(self._size))
+        return [None if deleted else row for (row, deleted) in zip(rows, self._deleted.tolist())]
+
+    def update(self, id, data):
+        if id not in self._id_index:
+            raise ValueError(f"Attempt to update non-existent record with '{self.id_column_name}' of '{id}'")
+        self._flush()
+        index = self._id_index[id]
+        if self._deleted[index]:
+            raise ValueError(
+                f"Cannot update record with '{self.id_column_name}' of '{id}' because it was already deleted"
+            )
+        for column_name in data.keys():
+            if column_name not in self._column_names:
+                raise ValueError(
+                    f"Cannot update record: column '{column_name}' does not exist in table '{self._table_name}'"
+                )
+        self._unshare()
+        for column_name, value in data.items():
+            self._set_value(column_name, index, value)
+        self._views = {}
+        return self._materialize(self._numpy.array([index]))[0]
+
+    def delete(self, id):
+        if id not in self._id_index:
+            return True
+        self._flush()
+        self._unshare()
+        self._deleted[self._id_index[id]] = True
+        self._views = {}
+        return True
+
+    def _append(self, data):
+        self._pending.append({**data})
+        self._views = {}
+        return self._size + len(self._pending) - 1
+
+    def _row_exists(self, index):
+        if index >= self._size:
+            return True
+        return not self._deleted[index]
+
+    def count(self, configuration, wheres):
+        return int(self._matching_mask(wheres).sum())
+
+    def rows(self, configuration, wheres, filter_only=False, next_page_data=None):
+        indexes = self._numpy.flatnonzero(self._matching_mask(wheres))
+        if filter_only:
+            return self._materialize(indexes)
+        if "sorts" in configuration and configuration["sorts"]:
+            indexes = indexes[self._sort_order(indexes, configuration["sorts"])]
+        if "limit" in configuration or ("pagination" in configuration and configuration["pagination"].get("start")):
+            [start, end] = self._page_bounds(configuration, len(indexes), next_page_data)
+            indexes = indexes[start:end]
+        return self._materialize(indexes)
+
+    def _matching_mask(self, wheres):
+        self._flush()
+        mask = ~self._deleted
+        for where in wheres:
+            mask &= self._where_as_mask(where)
+        return mask
+
+    def _flush(self):
+        """
+        Merges any buffered records into the column arrays
+        """
+        if not self._pending:
+            return
+
+        numpy = self._numpy
+        pending = self._pending
+        self._pending = []
+        column_names = [*self._column_names]
+        for row in pending:
+            for column_name in row.keys():
+                if column_name not in column_names:
+                    column_names.append(column_name)
+
+        for column_name in column_names:
+            [values, nulls] = self._build_column([row.get(column_name) for row in pending])
+            if column_name not in self._columns:
+                self._add_empty_column(column_name, values.dtype)
+            existing = self._columns[column_name]
+            if existing.dtype != values.dtype:
+                existing = existing.astype(object)
+                values = values.astype(object)
+            self._columns[column_name] = numpy.concatenate([existing, values])
+            self._nulls[column_name] = numpy.concatenate([self._nulls[column_name], nulls])
+
+        self._deleted = numpy.concatenate([self._deleted, numpy.zeros(len(pending), dtype=bool)])
+        self._size += len(pending)
+        self._views = {}
+
+    def _build_column(self, values):
+        """
+        Returns the array and null mask for a list of values, using a typed array when the data allows it
+        """
+        numpy = self._numpy
+        nulls = numpy.fromiter((value is None for value in values), dtype=bool, count=len(values))
+        types = {type(value) for value in values if value is not None}
+        dtype = None
+        if types == {bool}:
+            [dtype, filler] = [bool, False]
+        elif types == {int}:
+            [dtype, filler] = [numpy.int64, 0]
+        elif types == {float}:
+            [dtype, filler] = [numpy.float64, 0.0]
+
+        if dtype is not None:
+            try:
+                filled = [filler if value is None else value for value in values]
+                return [numpy.array(filled, dtype=dtype), nulls]
+            except OverflowError:
+                pass
+        return [self._object_array(values), nulls]
+
+    def _add_empty_column(self, column_name, dtype=object):
+        """
+        Adds a column where every existing record is null
+        """
+        if dtype == object:
+            self._columns[column_name] = self._object_array([None] * self._size)
+        else:
+            self._columns[column_name] = self._numpy.zeros(self._size, dtype=dtype)
+        self._nulls[column_name] = self._numpy.ones(self._size, dtype=bool)
+
+    def _object_array(self, values):
+        return self._numpy.fromiter(values, dtype=object, count=len(values))
+
+    def _is_typed(self, column_name):
+        return self._columns[column_name].dtype != object
+
+    def _set_value(self, column_name, index, value):
+        if column_name not in self._columns:
+            self._add_empty_column(column_name)
+        if value is None:
+            self._nulls[column_name][index] = True
+            return
+
+        column = self._columns[column_name]
+        if column.dtype != object:
+            [new_column, nulls] = self._build_column([value])
+            if new_column.dtype != column.dtype:
+                column = column.astype(object)
+                self._columns[column_name] = column
+        column[index] = value
+        self._nulls[column_name][index] = False
+
+    def _materialize(self, indexes):
+        """
+        Converts the rows at the given indexes back into dictionaries
+        """
+        columns = {}
+        for column_name, values in self._columns.items():
+            nulls = self._nulls[column_name][indexes].tolist()
+            columns[column_name] = [
+                None if is_null else value for (value, is_null) in zip(values[indexes].tolist(), nulls)
+            ]
+        column_names = list(columns.keys())
+        return [dict(zip(column_names, row_values)) for row_values in zip(*columns.values())]
+
+    def _string_view(self, column_name):
+        """
+        Returns (and caches) the column as an array of strings, which is how the `=` operator compares values
+        """
+        key = ("string", column_name)
+        if key not in self._views:
+            values = self._columns[column_name].tolist()
+            nulls = self._nulls[column_name].tolist()
+            self._views[key] = self._numpy.array(
+                [str(None) if is_null else str(value) for (value, is_null) in zip(values, nulls)], dtype=str
+            )
+        return self._views[key]
+
+    def _lower_view(self, column_name):
+        key = ("lower", column_name)
+        if key not in self._views:
+            self._views[key] = self._numpy.char.lower(self._string_view(column_name))
+        return self._views[key]
+
+    def _float_view(self, column_name):
+        """
+        Returns (and caches) the column as floats, or None if some non-null values can't be converted
+        """
+        key = ("float", column_name)
+        if key not in self._views:
+            column = self._columns[column_name]
+            if column.dtype != object:
+                self._views[key] = column.astype(float)
+            else:
+                nulls = self._nulls[column_name].tolist()
+                converted = [
+                    0.0 if is_null else gentle_float_conversion(value)
+                    for (value, is_null) in zip(column.tolist(), nulls)
+                ]
+                all_floats = all(type(value) == float for value in converted)
+                self._views[key] = self._numpy.array(converted, dtype=float) if all_floats else None
+        return self._views[key]
+
+    def _where_as_mask(self, where):
+        numpy = self._numpy
+        column_name = where["column"]
+        values = where["values"]
+        operator = where["operator"].lower()
+        if column_name not in self._columns:
+            return self._fallback_mask(where)
+        nulls = self._nulls[column_name]
+
+        if operator == "is null":
+            return nulls.copy()
+        if operator == "is not null":
+            return ~nulls
+        if operator == "=":
+            return self._string_view(column_name) == str(values[0])
+        if operator in ["<", ">", "<=", ">="]:
+            value = gentle_float_conversion(values[0])
+            column = self._float_view(column_name)
+            if type(value) != float or column is None:
+                return self._fallback_mask(where)
+            comparisons = {
+                "<": numpy.less,
+                ">": numpy.greater,
+                "<=": numpy.less_equal,
+                ">=": numpy.greater_equal,
+            }
+            return comparisons[operator](column, value) & ~nulls
+        if operator in ["<=>", "!="] and self._is_typed(column_name) and type(values[0]) in [int, float, bool]:
+            matches = (self._columns[column_name] == values[0]) & ~nulls
+            return matches if operator == "<=>" else ~matches
+        if operator == "in" and self._is_typed(column_name):
+            numbers = [value for value in values if type(value) in [int, float, bool]]
+            matches = numpy.isin(self._columns[column_name], numbers) & ~nulls
+            if None in values:
+                matches |= nulls
+            return matches
+        if operator == "like" and not self._is_typed(column_name):
+            search = values[0].lower()
+            term = search.strip("%")
+            if len(search) > 1 and search[0] == "%" and search[-1] == "%" and "%" not in term:
+                # the row-based check considers every empty value to be a match, so we have to too.
+                empty = nulls | (self._string_view(column_name) == "")
+                return numpy.where(empty, bool(search), numpy.char.find(self._lower_view(column_name), term) >= 0)
+
+        return self._fallback_mask(where)
+
+    def _fallback_mask(self, where):
+        """
+        Checks a condition one value at a time, using the same lambdas as the row-based MemoryTable
+        """
+        matches = self._where_as_filter(where)
+        column_name = where["column"]
+        if column_name in self._columns:
+            values = self._columns[column_name].tolist()
+            nulls = self._nulls[column_name].tolist()
+            rows = ({column_name: None if is_null else value} for (value, is_null) in zip(values, nulls))
+        else:
+            rows = ({} for i in range(self._size))
+
+        def check(row):
+            # the row-based table would raise an exception when comparing (e.g.) None and a float.  Since it
+            # can't match in that case, just treat it as a non-match
+            try:
+                return bool(matches(row))
+            except TypeError:
+                return False
+
+        return self._numpy.fromiter((check(row) for row in rows), dtype=bool, count=self._size)
+
+    def _sort_order(self, indexes, sorts):
+        """
+        Returns the order (as positions in `indexes`) that the rows should be returned in.
+        """
+        numpy = self._numpy
+        keys = []
+        for sort in reversed(sorts):
+            column_name = sort["column"]
+            descending = sort["direction"].lower() != "asc"
+            if column_name not in self._columns:
+                continue
+            nulls = self._nulls[column_name][indexes]
+            values = self._columns[column_name][indexes]
+            if values.dtype == object:
+                ranks = numpy.zeros(len(indexes), dtype=numpy.int64)
+                try:
+                    [unique, inverse] = numpy.unique(values[~nulls], return_inverse=True)
+                except TypeError:
+                    # mixed types that numpy can't order: let python figure it out the same way the MemoryTable does
+                    rows = self._materialize(indexes)
+                    return numpy.array(
+                        sorted(
+                            range(len(rows)),
+                            key=cmp_to_key(lambda index_a, index_b: _sort(rows[index_a], rows[index_b], sorts)),
+                        ),
+                        dtype=numpy.int64,
+                    )
+                ranks[~nulls] = inverse.reshape(-1)
+                values = ranks
+            elif values.dtype == bool:
+                values = values.astype(numpy.int64)
+            # nulls come first when sorting ascending and last when sorting descending, just like the MemoryTable
+            keys.append(-values if descending else values)
+            keys.append(nulls if descending else ~nulls)
+        if not keys:
+            return numpy.arange(len(indexes))
+        return numpy.lexsort(keys)
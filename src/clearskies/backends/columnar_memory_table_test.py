@@ -0,0 +1,102 @@
+import importlib.util
+import unittest
+from .memory_backend import MemoryBackend
+from . import memory_backend_test
+from types import SimpleNamespace
+
+
+@unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy is not installed")
+class ColumnarMemoryBackendTest(memory_backend_test.MemoryBackendTest):
+    def setUp(self):
+        super().setUp()
+        self.memory_backend = MemoryBackend()
+        self.memory_backend.columnar()
+        self.memory_backend.create_table(self.user_model)
+        self.memory_backend.create_table(self.reviews_model)
+        self.stats_model = SimpleNamespace(
+            table_name=lambda: "stats",
+            columns_configuration=lambda: {"name": "", "score": "", "active": ""},
+            id_column_name="id",
+        )
+        self.memory_backend.create_table(self.stats_model)
+        for data in [
+            {"id": 1, "name": "Conor", "score": 5, "active": True},
+            {"id": 2, "name": "Ronoc", "score": None, "active": False},
+            {"id": 3, "name": "Jane", "score": 12, "active": True},
+            {"id": 4, "name": None, "score": 7, "active": True},
+        ]:
+            self.memory_backend.create(data, self.stats_model)
+
+    def stats_ids(self, wheres=None, sorts=None, **kwargs):
+        return [
+            record["id"]
+            for record in self.memory_backend.records(
+                {"table_name": "stats", "wheres": wheres if wheres else [], "sorts": sorts if sorts else [], **kwargs},
+                self.stats_model,
+            )
+        ]
+
+    def test_typed_columns(self):
+        table = self.memory_backend._tables["stats"]
+        table._flush()
+        self.assertEqual("int64", str(table._columns["score"].dtype))
+        self.assertEqual("bool", str(table._columns["active"].dtype))
+        self.assertEqual("object", str(table._columns["name"].dtype))
+        self.assertEqual(
+            [{"id": 2, "name": "Ronoc", "score": None, "active": False}],
+            self.memory_backend.records(
+                {"table_name": "stats", "wheres": [{"column": "id", "operator": "=", "values": ["2"]}]},
+                self.stats_model,
+            ),
+        )
+
+    def test_vectorized_filters(self):
+        self.assertEqual([3, 4], self.stats_ids([{"column": "score", "operator": ">", "values": ["5"]}]))
+        self.assertEqual([1, 4], self.stats_ids([{"column": "score", "operator": "in", "values": [5, 7]}]))
+        self.assertEqual([2], self.stats_ids([{"column": "score", "operator": "is null", "values": []}]))
+        self.assertEqual([1, 2, 3, 4], self.stats_ids([{"column": "name", "operator": "like", "values": ["%n%"]}]))
+        # like the row-based table, null values match any non-empty search
+        self.assertEqual([3, 4], self.stats_ids([{"column": "name", "operator": "like", "values": ["%JAN%"]}]))
+        self.assertEqual(
+            [3],
+            self.stats_ids(
+                [
+                    {"column": "active", "operator": "=", "values": ["True"]},
+                    {"column": "score", "operator": ">=", "values": [10]},
+                ]
+            ),
+        )
+
+    def test_sort_with_nulls(self):
+        self.assertEqual([2, 1, 4, 3], self.stats_ids(sorts=[{"column": "score", "direction": "ASC"}]))
+        self.assertEqual([3, 4, 1, 2], self.stats_ids(sorts=[{"column": "score", "direction": "DESC"}]))
+        self.assertEqual(
+            [2, 3, 1],
+            self.stats_ids(
+                sorts=[{"column": "name", "direction": "DESC"}],
+                wheres=[{"column": "name", "operator": "is not null", "values": []}],
+            ),
+        )
+
+    def test_update_changes_column_type(self):
+        self.memory_backend.update(1, {"score": "high"}, self.stats_model)
+        self.assertEqual("object", str(self.memory_backend._tables["stats"]._columns["score"].dtype))
+        self.assertEqual([1], self.stats_ids([{"column": "score", "operator": "=", "values": ["high"]}]))
+        self.assertEqual([3, 4], self.stats_ids([{"column": "score", "operator": ">", "values": [5]}]))
+
+    def test_count_and_pagination_after_delete(self):
+        self.memory_backend.delete(3, self.stats_model)
+        self.assertEqual(3, self.memory_backend.count({"table_name": "stats", "wheres": []}, self.stats_model))
+        next_page_data = {}
+        records = self.memory_backend.records(
+            {
+                "table_name": "stats",
+                "sorts": [{"column": "id", "direction": "DESC"}],
+                "pagination": {"start": 0},
+                "limit": 2,
+            },
+            self.stats_model,
+            next_page_data=next_page_data,
+        )
+        self.assertEqual([4, 2], [record["id"] for record in records])
+        self.assertEqual({"start": 2}, next_page_data)
@@ -0,0 +1,222 @@
+from collections.abc import Mapping
+import csv
+import io
+from . import memory_backend
+from .file_backend import FileBackend
+from ..autodoc.schema import Boolean as AutoDocBoolean
+from ..autodoc.schema import Integer as AutoDocInteger
+from ..autodoc.schema import Number as AutoDocNumber
+
+
+def _to_bool(value):
+    normalized = value.strip().lower()
+    if normalized in ["1", "true", "t", "yes", "y"]:
+        return True
+    if normalized in ["0", "false", "f", "no", "n"]:
+        return False
+    raise ValueError(f"'{value}' is not a boolean")
+
+
+def _converter(convert):
+    """
+    Wraps a conversion function so that empty cells become None and unconvertable values are left as-is
+    """
+
+    def converter(value):
+        if value == "":
+            return None
+        if convert is None:
+            return value
+        try:
+            return convert(value)
+        except ValueError:
+            return value
+
+    return converter
+
+
+class CsvRow(Mapping):
+    """
+    A read-only, dictionary-like view of a row loaded from a CSV file.
+
+    Values are fetched from the table, which converts them one column at a time the first time the column is needed.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, column_name):
+        return self._table._value(self._index, column_name)
+
+    def __iter__(self):
+        return iter(self._table._column_names)
+
+    def __len__(self):
+        return len(self._table._column_names)
+
+
+class CsvTable(memory_backend.MemoryTable):
+    """
+    A MemoryTable that keeps the raw strings from a CSV file and converts them lazily.
+
+    Each line of the file is kept as the list of strings produced by the csv reader.  Columns are converted to the
+    type of the corresponding model column (integers, floats, booleans, or strings, with empty cells becoming None)
+    the first time a query needs them, and the converted column is kept for later queries.  As a result, loading the
+    file only has to split lines and find ids, and columns which are never filtered, sorted, or returned are never
+    converted at all.  Rows that are created or updated are stored as regular dictionaries.
+    """
+
+    _raw_rows = None
+    _positions = None
+    _converters = None
+    _typed_columns = None
+
+    def __init__(self, model):
+        super().__init__(model)
+        self._raw_rows = []
+        self._positions = {}
+        self._typed_columns = {}
+        self._converters = {}
+        columns_configuration = model.columns_configuration()
+        for column_name in self._column_names:
+            column_class = None
+            if type(columns_configuration.get(column_name)) == dict:
+                column_class = columns_configuration[column_name].get("class")
+            auto_doc_class = getattr(column_class, "_auto_doc_class", None)
+            convert = None
+            if auto_doc_class == AutoDocInteger:
+                convert = int
+            elif auto_doc_class == AutoDocNumber:
+                convert = float
+            elif auto_doc_class == AutoDocBoolean:
+                convert = _to_bool
+            self._converters[column_name] = _converter(convert)
+
+    def load_csv(self, fp, delimiter=",", file_name=""):
+        """
+        Replaces the contents of the table with the records in the given CSV file (an open file object).
+
+        The first line of the file must contain the column names.
+        """
+        reader = csv.reader(fp, delimiter=delimiter)
+        header = next(reader, [])
+        self._positions = {
+            column_name: position for (position, column_name) in enumerate(header) if column_name in self._converters
+        }
+        if self.id_column_name not in self._positions:
+            raise ValueError(f"Missing id column, '{self.id_column_name}', in the header of CSV file '{file_name}'")
+
+        width = len(header)
+        id_position = self._positions[self.id_column_name]
+        convert_id = self._converters[self.id_column_name]
+        raw_rows = []
+        id_index = {}
+        for row_number, values in enumerate(reader):
+            if len(values) != width:
+                if not values:
+                    continue
+                values = (values + [""] * width)[:width]
+            record_id = convert_id(values[id_position])
+            if not record_id:
+                print(
+                    f"Missing id column, '{self.id_column_name}', for record row #{row_number+1} in file '{file_name}'.  Skipping."
+                )
+                continue
+            if record_id in id_index:
+                print(
+                    f"Duplicate id, '{record_id}', for record row #{row_number+1} in file '{file_name}'.  Replacing the earlier record."
+                )
+                raw_rows[id_index[record_id]] = values
+                continue
+            id_index[record_id] = len(raw_rows)
+            raw_rows.append(values)
+
+        self._raw_rows = raw_rows
+        self._typed_columns = {}
+        self.load([CsvRow(self, index) for index in range(len(raw_rows))], id_index)
+
+    def _value(self, index, column_name):
+        if column_name not in self._typed_columns:
+            if column_name not in self._converters:
+                raise KeyError(column_name)
+            if column_name not in self._positions:
+                return None
+            position = self._positions[column_name]
+            convert = self._converters[column_name]
+            self._typed_columns[column_name] = [convert(values[position]) for values in self._raw_rows]
+        return self._typed_columns[column_name][index]
+
+    def _as_dict(self, row):
+        """
+        Returns a row as a regular dictionary, converting its values without converting the rest of their columns
+        """
+        if not isinstance(row, CsvRow):
+            return row
+        values = self._raw_rows[row._index]
+        data = {}
+        for column_name in self._column_names:
+            if column_name in self._typed_columns:
+                data[column_name] = self._typed_columns[column_name][row._index]
+            elif column_name in self._positions:
+                data[column_name] = self._converters[column_name](values[self._positions[column_name]])
+            else:
+                data[column_name] = None
+        return data
+
+    def rows(self, configuration, wheres, filter_only=False, next_page_data=None):
+        rows = super().rows(configuration, wheres, filter_only=filter_only, next_page_data=next_page_data)
+        if filter_only:
+            return rows
+        return [self._as_dict(row) for row in rows]
+
+    def all_rows(self):
+        return [self._as_dict(row) for row in self._rows]
+
+
+class CsvBackend(FileBackend):
+    """
+    A backend for CSV (or TSV) files.
+
+    Like the other file backends, the table name of the model is the name of the file to read.  The first line of the
+    file must contain the column names.  See CsvTable for details about how the data is stored and converted.  With
+    the `columnar` option, the data is instead converted up front and stored in a ColumnarMemoryTable.
+    """
+
+    _delimiter = ","
+
+    def configure(self, delimiter=",", **kwargs):
+        """
+        Configures the backend.
+
+        Set `delimiter` to `\\t` for tab-separated files.  Any other options are passed along to the FileBackend.
+        """
+        super().configure(**kwargs)
+        self._delimiter = delimiter
+
+    def table_from_file(self, model, file_name):
+        table = CsvTable(model)
+        with open(file_name, "r", newline="") as fp:
+            table.load_csv(fp, delimiter=self._delimiter, file_name=file_name)
+        if self._columnar:
+            rows = table.all_rows()
+            columnar_table = self.new_table(model)
+            columnar_table.load(rows, {row[model.id_column_name]: index for (index, row) in enumerate(rows)})
+            return columnar_table
+        for column_name in self._like_indexes.get(model.table_name(), []):
+            table.add_like_index(column_name)
+        return table
+
+    def transform_data_to_file(self, records):
+        if not records:
+            return ""
+        output = io.StringIO()
+        writer = csv.DictWriter(
+            output, fieldnames=list(records[0].keys()), delimiter=self._delimiter, extrasaction="ignore"
+        )
+        writer.writeheader()
+        for record in records:
+            writer.writerow({key: "" if value is None else value for (key, value) in record.items()})
+        return output.getvalue()
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+from .csv_backend import CsvBackend
+from ..column_types.boolean import Boolean
+from ..column_types.float import Float
+from ..column_types.integer import Integer
+from ..column_types.string import String
+from types import SimpleNamespace
+
+
+class CsvBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "users.csv")
+        self.write("id,name,age,score,active,notes\n1,Conor,35,4.5,true,hi\n2,Jane,,12,no,\n3,Ronoc,8,x,1,there\n")
+        self.user_model = SimpleNamespace(
+            table_name=lambda: self.file_name,
+            columns_configuration=lambda: {
+                "name": {"class": String},
+                "age": {"class": Integer},
+                "score": {"class": Float},
+                "active": {"class": Boolean},
+                "notes": {"class": String},
+            },
+            id_column_name="id",
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, contents):
+        with open(self.file_name, "w") as fp:
+            fp.write(contents)
+
+    def records(self, csv_backend, **configuration):
+        return csv_backend.records({"table_name": self.file_name, **configuration}, self.user_model)
+
+    def test_typed_records(self):
+        csv_backend = CsvBackend()
+        self.assertEqual(
+            [
+                {"id": "1", "name": "Conor", "age": 35, "score": 4.5, "active": True, "notes": "hi"},
+                {"id": "2", "name": "Jane", "age": None, "score": 12.0, "active": False, "notes": None},
+                {"id": "3", "name": "Ronoc", "age": 8, "score": "x", "active": True, "notes": "there"},
+            ],
+            self.records(csv_backend),
+        )
+        self.assertEqual(
+            ["Conor"],
+            [
+                record["name"]
+                for record in self.records(
+                    csv_backend, wheres=[{"column": "age", "operator": "in", "values": [35, 36]}]
+                )
+            ],
+        )
+        self.assertEqual(
+            ["3", "2", "1"],
+            [record["id"] for record in self.records(csv_backend, sorts=[{"column": "name", "direction": "DESC"}])],
+        )
+
+    def test_lazy_columns(self):
+        csv_backend = CsvBackend()
+        wheres = [{"column": "id", "operator": "=", "values": [2]}]
+        self.assertEqual(1, csv_backend.count({"table_name": self.file_name, "wheres": wheres}, self.user_model))
+        table = csv_backend._tables[self.file_name]
+        self.assertEqual(["id"], list(table._typed_columns.keys()))
+        self.records(csv_backend, wheres=[{"column": "age", "operator": "is null", "values": []}], limit=1)
+        # the returned record is converted on its own, without converting the rest of its columns
+        self.assertEqual(["id", "age"], list(table._typed_columns.keys()))
+
+    def test_duplicate_ids(self):
+        self.write("id,name\n1,Conor\n2,Jane\n1,Ronoc\n")
+        self.assertEqual(
+            [{"id": "1", "name": "Ronoc"}, {"id": "2", "name": "Jane"}],
+            [{"id": record["id"], "name": record["name"]} for record in self.records(CsvBackend())],
+        )
+
+    def test_columnar(self):
+        csv_backend = CsvBackend()
+        csv_backend.configure(columnar=True)
+        self.assertEqual(
+            ["Conor"],
+            [
+                record["name"]
+                for record in self.records(
+                    csv_backend, wheres=[{"column": "age", "operator": "in", "values": [35, 36]}]
+                )
+            ],
+        )
+        self.assertEqual("ColumnarMemoryTable", csv_backend._tables[self.file_name].__class__.__name__)
+
+    def test_tsv(self):
+        self.write("id\tname\n1\tConor\n\n2\tJane\n")
+        csv_backend = CsvBackend()
+        csv_backend.configure(delimiter="\t")
+        self.assertEqual(["Conor", "Jane"], [record["name"] for record in self.records(csv_backend)])
+
+    def test_write_and_compact(self):
+        csv_backend = CsvBackend()
+        csv_backend.configure(journal=True, compact_after=2)
+        record = csv_backend.create({"name": "Enaj", "age": 20}, self.user_model)
+        self.assertEqual("4", str(record["id"]))
+        csv_backend.update("1", {"age": 36}, self.user_model)
+        with open(self.file_name, "r") as fp:
+            self.assertEqual(
+                "name,age,score,active,notes,id\nConor,36,4.5,True,hi,1\nJane,,12.0,False,,2\nRonoc,8,x,True,there,3\nEnaj,20,,,,4\n",
+                fp.read().replace("\r\n", "\n"),
+            )
+        self.assertEqual([36, None, 8, 20], [record["age"] for record in self.records(CsvBackend())])
@@ -7,6 +7,8 @@ from .. import model
 class CursorBackend(Backend):
     supports_n_plus_one = True
     _cursor = None
+    _stream_records = False
+    _stream_batch_size = 1000
 
     _allowed_configs = [
         "table_name",
@@ -39,8 +41,16 @@ class CursorBackend(Backend):
         """Return the character to use to escape column names in queries."""
         return "`"
 
-    def configure(self):
-        pass
+    def configure(self, stream_records=False, stream_batch_size=1000):
+        """
+        Configures the backend.
+
+        By default the records for a query are all read into a list.  Set `stream_records` to have `records` return
+        a generator instead, which reads the rows `stream_batch_size` at a time (see `_stream_records_from_cursor`),
+        so that iterating over models, `Models.batches`, and streamed responses never hold every row at once.
+        """
+        self._stream_records = stream_records
+        self._stream_batch_size = stream_batch_size
 
     def _finalize_table_name(self, table_name):
         escape = self._table_escape_character()
@@ -109,6 +119,64 @@ class CursorBackend(Backend):
         )
         return results[0]
 
+    def create_many(self, records, model):
+        """
+        Creates the records, inserting those with ids (e.g. UUIDs) with one INSERT per set of columns.
+
+        Records without an id (i.e. auto-increment ids) are created one at a time.  To return them we'd have to work
+        out which new id went to which record, and MySQL doesn't promise that the ids from a multi-row INSERT are
+        consecutive (they can interleave with concurrent inserts when innodb_autoinc_lock_mode is 2, the default
+        since MySQL 8.0), so neither the last insert id nor the insertion order can be trusted.
+        """
+        id_column_name = model.id_column_name
+        results = [None] * len(records)
+        batches = {}
+        for index, record in enumerate(records):
+            if record.get(id_column_name):
+                batches.setdefault(tuple(record.keys()), []).append(index)
+            else:
+                results[index] = self.create(record, model)
+        for keys, indexes in batches.items():
+            batch_results = self._insert_many([records[index] for index in indexes], list(keys), model)
+            for index, result in zip(indexes, batch_results):
+                results[index] = result
+        return results
+
+    def _insert_many(self, records, keys, model):
+        """
+        Inserts records (which all have ids and set the given columns) with a single INSERT and returns them
+        """
+        id_column_name = model.id_column_name
+        escape = self._column_escape_character()
+        columns = escape + f"{escape}, {escape}".join(keys) + escape
+        placeholders = "(" + ", ".join(["%s" for key in keys]) + ")"
+        parameters = [record[key] for record in records for key in keys]
+
+        table_name = self._finalize_table_name(model.table_name())
+        self._cursor.execute(
+            f"INSERT INTO {table_name} ({columns}) VALUES " + ", ".join([placeholders for record in records]),
+            tuple(parameters),
+        )
+
+        ids = [record[id_column_name] for record in records]
+        results = self.records(
+            {
+                "table_name": model.table_name(),
+                "select_all": True,
+                "wheres": [
+                    {
+                        "column": id_column_name,
+                        "operator": "IN",
+                        "parsed": f"{id_column_name} IN (" + ", ".join(["%s" for id in ids]) + ")",
+                        "values": ids,
+                    }
+                ],
+            },
+            model,
+        )
+        by_id = {str(result[id_column_name]): result for result in results}
+        return [by_id[str(id)] for id in ids]
+
     def delete(self, id, model):
         table_name = self._finalize_table_name(model.table_name())
         self._cursor.execute(f"DELETE FROM {table_name} WHERE {model.id_column_name}=%s", (id,))
@@ -125,19 +193,56 @@ class CursorBackend(Backend):
     def records(
         self, configuration: Dict[str, Any], model: model.Model, next_page_data: Dict[str, str] = None
     ) -> List[Dict[str, Any]]:
-        # I was going to get fancy and have this return an iterator, but since I'm going to load up
-        # everything into a list anyway, I may as well just return the list, right?
         configuration = self._check_query_configuration(configuration)
         [query, parameters] = self.as_sql(configuration)
+        if self._stream_records:
+            return self._stream_records_from_cursor(configuration, query, parameters, next_page_data)
         self._cursor.execute(query, tuple(parameters))
         records = [row for row in self._cursor]
         if type(next_page_data) == dict:
-            limit = configuration.get("limit", None)
-            start = configuration.get("pagination", {}).get("start", 0)
-            if limit and len(records) == limit:
-                next_page_data["start"] = int(start) + int(limit)
+            self._populate_next_page_data(configuration, len(records), next_page_data)
         return records
 
+    def _stream_records_from_cursor(self, configuration, query, parameters, next_page_data):
+        """
+        Yields the records for the query as they are fetched from the database, `stream_batch_size` at a time.
+
+        The caller will often run other queries while it works through the records (e.g. to load related records),
+        which would throw away the rest of our results if we shared a cursor, so the query is run on a separate
+        cursor from `_stream_cursor`.  next_page_data is populated once all the records have been read.
+        """
+        cursor = self._stream_cursor()
+        number_records = 0
+        try:
+            cursor.execute(query, tuple(parameters))
+            while True:
+                rows = cursor.fetchmany(self._stream_batch_size)
+                if not rows:
+                    break
+                number_records += len(rows)
+                yield from rows
+        finally:
+            cursor.close()
+        if type(next_page_data) == dict:
+            self._populate_next_page_data(configuration, number_records, next_page_data)
+
+    def _stream_cursor(self):
+        """
+        Returns a new cursor for streaming records (see `configure`).
+
+        With most drivers (e.g. pymysql's default cursors) the database still sends the whole result set up front and
+        the driver holds it in memory, so streaming only avoids building the records into a list and the models all at
+        once.  To avoid that too, override this to return an unbuffered cursor (e.g. pymysql's `SSDictCursor`), but
+        note that MySQL can't run other queries on the same connection until all the records have been read.
+        """
+        return self._cursor.connection.cursor()
+
+    def _populate_next_page_data(self, configuration, number_records, next_page_data):
+        limit = configuration.get("limit", None)
+        start = configuration.get("pagination", {}).get("start", 0)
+        if limit and number_records == limit:
+            next_page_data["start"] = int(start) + int(limit)
+
     def group_by_clause(self, group_by):
         if not group_by:
             return ""
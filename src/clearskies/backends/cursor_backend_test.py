@@ -28,6 +28,51 @@ class CursorBackendTest(unittest.TestCase):
         )
         self.assertEqual({"my": "data"}, new_data)
 
+    def test_create_many(self):
+        self.cursor.__class__.__iter__ = lambda x: iter([{"id": "b", "hey": "you"}, {"id": "a", "hey": "people"}])
+        new_data = self.backend.create_many([{"id": "a", "hey": "people"}, {"id": "b", "hey": "you"}], self.model)
+        self.cursor.execute.assert_has_calls(
+            [
+                call("INSERT INTO `my_table` (`id`, `hey`) VALUES (%s, %s), (%s, %s)", ("a", "people", "b", "you")),
+                call("SELECT `my_table`.* FROM `my_table` WHERE my_table.id IN (%s, %s)", ("a", "b")),
+            ]
+        )
+        self.assertEqual([{"id": "a", "hey": "people"}, {"id": "b", "hey": "you"}], new_data)
+
+        # without ids we have to insert them one at a time, but the records with ids are still batched
+        self.cursor.execute.reset_mock()
+        new_data = self.backend.create_many(
+            [{"hey": "people"}, {"id": "a", "hey": "people"}, {"hey": "you"}, {"id": "b", "hey": "you"}], self.model
+        )
+        self.assertEqual(6, self.cursor.execute.call_count)
+        self.cursor.execute.assert_any_call(
+            "INSERT INTO `my_table` (`id`, `hey`) VALUES (%s, %s), (%s, %s)", ("a", "people", "b", "you")
+        )
+        self.assertEqual({"id": "a", "hey": "people"}, new_data[1])
+        self.assertEqual({"id": "b", "hey": "you"}, new_data[3])
+
+    def test_stream_records(self):
+        stream_cursor = MagicMock()
+        stream_cursor.fetchmany.side_effect = [[{"id": 1}, {"id": 2}], [{"id": 3}], []]
+        self.cursor.connection = MagicMock()
+        self.cursor.connection.cursor.return_value = stream_cursor
+        self.backend.configure(stream_records=True, stream_batch_size=2)
+        next_page_data = {}
+        records = self.backend.records(
+            {"table_name": "my_table", "select_all": True, "limit": 3, "pagination": {"start": 3}},
+            self.model,
+            next_page_data,
+        )
+        # nothing happens until the records are needed
+        stream_cursor.execute.assert_not_called()
+        self.assertEqual([{"id": 1}, {"id": 2}, {"id": 3}], list(records))
+        stream_cursor.execute.assert_called_with("SELECT `my_table`.* FROM `my_table` LIMIT 3, 3", ())
+        stream_cursor.fetchmany.assert_called_with(2)
+        stream_cursor.close.assert_called_once()
+        # the shared cursor is left free for other queries
+        self.cursor.execute.assert_not_called()
+        self.assertEqual({"start": 6}, next_page_data)
+
     def test_update(self):
         to_save = OrderedDict([("hey", "sup"), ("qwerty", "asdf"), ("foo", "bar")])
         new_data = self.backend.update(5, to_save, self.model)
@@ -20,7 +20,7 @@ class ExampleBackend(memory_backend.MemoryBackend):
         table_data = []
         id_index = {}
         record_index = 0
-        table = memory_backend.MemoryTable(model)
+        table = self.new_table(model)
         id_column_name = model.id_column_name
         for row_index, data in enumerate(self.data):
             record_id = data.get(id_column_name)
@@ -34,8 +34,7 @@ class ExampleBackend(memory_backend.MemoryBackend):
             id_index[record_id] = record_index
             record_index += 1
 
-        table._id_index = id_index
-        table._rows = table_data
+        table.load(table_data, id_index)
         self._tables[file_name] = table
 
     def records(self, configuration, model, next_page_data=None):
@@ -1,19 +1,192 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
 from . import memory_backend
+from .json_lines_backend import JsonLinesTable
+
+logger = logging.getLogger(__name__)
 
 
 class FileBackend(memory_backend.MemoryBackend):
     _tables = None
     _silent_on_missing_tables = False
+    _reload_check_interval = None
+    _change_detection = "mtime"
+    _background_reload = True
+    _file_states = None
+    _reloading = None
+    _reload_lock = None
+    _journal = False
+    _fsync = "always"
+    _compact_after = 1000
+    _journal_files = None
+    _journal_entries = None
+    _last_fsync = None
+    _shared_memory_directory = None
+
+    def __init__(self):
+        super().__init__()
+        self._file_states = {}
+        self._reloading = set()
+        self._reload_lock = threading.Lock()
+        self._journal_files = {}
+        self._journal_entries = {}
+        self._last_fsync = {}
+
+    def configure(
+        self,
+        columnar=False,
+        thread_safe=False,
+        like_indexes=None,
+        reload_check_interval=None,
+        change_detection="mtime",
+        background_reload=True,
+        journal=False,
+        fsync="always",
+        compact_after=1000,
+        shared_memory_directory=None,
+    ):
+        """
+        Configures the backend.
+
+        By default, files are read once and then served from memory forever.  To pick up changes to the files
+        without restarting, set `reload_check_interval` to the number of seconds between checks.  `change_detection`
+        controls how we decide if a file has changed: `mtime` compares the modification time and size of the file,
+        while `hash` compares a hash of the file contents (slower, but works even when the modification time is
+        unreliable).  When a change is found, the new table is built off to the side and swapped in once it is
+        ready.  With `background_reload` (the default) this happens in a separate thread so that reads never wait
+        on a reparse: they continue to get the old data until the new table is ready.
+
+        By default, changes made through the backend only live in memory and are lost on restart (or reload).  Set
+        `journal` to make them durable: every change is appended to a journal file (the data file name with a
+        `.journal` suffix) which is replayed on top of the data file whenever it is loaded.  `fsync` controls when the
+        journal is flushed to disk: `always` (after every change), `never` (leave it to the operating system), or a
+        number of seconds between syncs.  Once the journal has `compact_after` entries, the current data is written
+        back to the data file and the journal is emptied (set `compact_after` to None to only compact when `compact`
+        is called).  This requires the backend to define `transform_data_to_file`.
+
+        Normally every process holds its own copy of the data.  When running many worker processes (e.g. under
+        gunicorn) set `shared_memory_directory` to a memory-backed directory such as `/dev/shm`.  The first process
+        to load a file writes the parsed records there as a JSON Lines file, and every process then serves it
+        through a read-only memory map (see JsonLinesTable), so the data is held in memory once no matter how many
+        workers there are.  The trade-off is speed: records are decoded as they are queried, so anything other
+        than a lookup by id decodes every record in the file on every query (and sorted queries hold all the
+        matching records in memory while sorting).  Since the shared tables are read straight out of the file,
+        this can't be combined with `columnar`, `like_indexes`, or `thread_safe`.  A process that changes the data
+        switches to its own private copy of the table, and (without the journal) those changes are lost when the
+        file is reloaded.
+        """
+        if change_detection not in ["mtime", "hash"]:
+            raise ValueError(
+                f"Invalid value for change_detection in configuration for '{self.__class__.__name__}': expected 'mtime' or 'hash' but found '{change_detection}'"
+            )
+        if fsync not in ["always", "never"] and type(fsync) not in [int, float]:
+            raise ValueError(
+                f"Invalid value for fsync in configuration for '{self.__class__.__name__}': expected 'always', 'never', or a number of seconds but found '{fsync}'"
+            )
+        if shared_memory_directory and (columnar or thread_safe or like_indexes):
+            raise ValueError(
+                f"Invalid configuration for '{self.__class__.__name__}': shared_memory_directory cannot be combined with columnar, like_indexes, or thread_safe"
+            )
+        super().configure(columnar=columnar, thread_safe=thread_safe, like_indexes=like_indexes)
+        self._reload_check_interval = reload_check_interval
+        self._change_detection = change_detection
+        self._background_reload = background_reload
+        self._journal = journal
+        self._fsync = fsync
+        self._compact_after = compact_after
+        self._shared_memory_directory = shared_memory_directory
 
     def create_table(self, model):
         model = self.cheez_model(model)
         file_name = model.table_name()
         if file_name in self._tables:
+            self.reload_if_changed(model)
             return
 
+        [table, file_state] = self.load_table(model)
+        self._tables[file_name] = table
+        self._file_states[file_name] = file_state
+
+    def load_table(self, model):
+        """
+        Reads the file for the given model and returns a new table with its data, as well as the state of the file
+        """
+        file_name = model.table_name()
+        file_state = self._file_state(file_name)
+        if self._shared_memory_directory:
+            return [self.shared_table(model, file_state), file_state]
+
+        table = self.table_from_file(model, file_name)
+        if self._journal:
+            self._replay_journal(table, file_name)
+        table.seal()
+        return [table, file_state]
+
+    def shared_table(self, model, file_state):
+        """
+        Returns a read-only table for the given model backed by a file in the shared memory directory.
+
+        The shared file is named after the data file and its current state, so it is only written by the first
+        process that needs it, and all processes switch to a new one when the data file (or journal) changes.
+        """
+        file_name = model.table_name()
+        source_key = hashlib.sha256(os.path.abspath(file_name).encode("utf-8")).hexdigest()[:16]
+        state = [self._file_state_key(file_state)]
+        if self._journal:
+            journal_state = self._file_state(self.journal_file_name(file_name))
+            state.append(self._file_state_key(journal_state) if journal_state else None)
+        state_key = hashlib.sha256(json.dumps(state, default=str).encode("utf-8")).hexdigest()[:16]
+        prefix = os.path.join(self._shared_memory_directory, f"clearskies-{source_key}-")
+        shared_file_name = f"{prefix}{state_key}.jsonl"
+
+        if not os.path.isfile(shared_file_name):
+            table = self.table_from_file(model, file_name)
+            if self._journal:
+                self._replay_journal(table, file_name)
+            temporary_file_name = f"{shared_file_name}.{os.getpid()}.tmp"
+            with open(temporary_file_name, "w") as fp:
+                for row in table.all_rows():
+                    if row is not None:
+                        fp.write(json.dumps(row, default=str) + "\n")
+            os.replace(temporary_file_name, shared_file_name)
+            # processes still using the old versions keep their memory maps even after the files are removed
+            for stale_file_name in glob.glob(f"{prefix}*"):
+                if not stale_file_name.startswith(shared_file_name):
+                    try:
+                        os.remove(stale_file_name)
+                    except OSError:
+                        pass
+
+        return JsonLinesTable(model, shared_file_name)
+
+    def _write(self, model, change):
+        self.create_table(model)
+        file_name = model.table_name()
+        with self._write_lock:
+            table = self._tables[file_name]
+            if isinstance(table, JsonLinesTable):
+                rows = table.all_rows()
+                private_table = self.new_table(model)
+                private_table.load(rows, {row[model.id_column_name]: index for (index, row) in enumerate(rows)})
+                private_table.seal()
+                self._tables[file_name] = private_table
+        return super()._write(model, change)
+
+    def table_from_file(self, model, file_name):
+        """
+        Reads the given file and returns a new table with its data.
+
+        By default the whole file is read and passed to `transform_data_from_file`.  Override this to build the table
+        some other way (e.g. by streaming the file).
+        """
         with open(file_name, "r") as fp:
             records = self.transform_data_from_file(fp.read())
-        table = memory_backend.MemoryTable(model)
+        table = self.new_table(model)
         id_column_name = model.id_column_name
 
         if type(records) != list:
@@ -31,18 +204,213 @@ class FileBackend(memory_backend.MemoryBackend):
                     f"Missing id column, '{id_column_name}', for record row #{row_index+1} in file '{file_name}'.  Skipping."
                 )
                 continue
+            if record_id in id_index:
+                print(
+                    f"Duplicate id, '{record_id}', for record row #{row_index+1} in file '{file_name}'.  Replacing the earlier record."
+                )
+                table_data[id_index[record_id]] = data
+                continue
 
             table_data.append(data)
             id_index[record_id] = record_index
             record_index += 1
 
-        table._id_index = id_index
-        table._rows = table_data
-        self._tables[file_name] = table
+        table.load(table_data, id_index)
+        return table
+
+    def journal_file_name(self, file_name):
+        return f"{file_name}.journal"
+
+    def _replay_journal(self, table, file_name):
+        """
+        Applies the changes stored in the journal for the given file to the table.
+        """
+        journal_file_name = self.journal_file_name(file_name)
+        entries = 0
+        if os.path.isfile(journal_file_name):
+            with open(journal_file_name, "r") as fp:
+                for line_number, line in enumerate(fp):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # a partially written entry means we crashed in the middle of writing it, so it never happened.
+                        print(
+                            f"Ignoring incomplete entry on line #{line_number+1} of journal '{journal_file_name}' and everything after it."
+                        )
+                        break
+                    if entry["action"] == "create":
+                        table.create(entry["data"])
+                    elif entry["action"] == "update":
+                        table.update(entry["id"], entry["data"])
+                    elif entry["action"] == "delete":
+                        table.delete(entry["id"])
+                    entries += 1
+        self._journal_entries[file_name] = entries
+
+    def _append_to_journal(self, model, entry):
+        file_name = model.table_name()
+        if file_name not in self._journal_files:
+            self._journal_files[file_name] = open(self.journal_file_name(file_name), "a")
+            self._last_fsync[file_name] = time.monotonic()
+        journal_file = self._journal_files[file_name]
+        journal_file.write(json.dumps(entry, default=str) + "\n")
+        journal_file.flush()
+        now = time.monotonic()
+        if self._fsync == "always" or (self._fsync != "never" and now - self._last_fsync[file_name] >= self._fsync):
+            os.fsync(journal_file.fileno())
+            self._last_fsync[file_name] = now
+        self._journal_entries[file_name] = self._journal_entries.get(file_name, 0) + 1
+        if self._compact_after is not None and self._journal_entries[file_name] >= self._compact_after:
+            self.compact(model)
+
+    def compact(self, model):
+        """
+        Writes the current data for the given model back to its file and empties the journal.
+
+        The data file is replaced atomically.  If we crash before the journal is emptied, replaying it on top
+        of the new data file is harmless: creates for existing records become updates, and updates and deletes
+        just get applied again.
+        """
+        model = self.cheez_model(model)
+        file_name = model.table_name()
+        with self._write_lock:
+            self.create_table(model)
+            records = [row for row in self._tables[file_name].all_rows() if row is not None]
+            temporary_file_name = f"{file_name}.compacting"
+            with open(temporary_file_name, "w") as fp:
+                fp.write(self.transform_data_to_file(records))
+                fp.flush()
+                os.fsync(fp.fileno())
+            os.replace(temporary_file_name, file_name)
+            self._file_states[file_name] = self._file_state(file_name)
+
+            if file_name in self._journal_files:
+                self._journal_files[file_name].close()
+                del self._journal_files[file_name]
+            with open(self.journal_file_name(file_name), "w") as fp:
+                os.fsync(fp.fileno())
+            self._journal_entries[file_name] = 0
+
+    def create(self, data, model):
+        if not self._journal:
+            return super().create(data, model)
+        with self._write_lock:
+            record = super().create(data, model)
+            self._append_to_journal(model, {"action": "create", "data": record})
+        return record
+
+    def update(self, id, data, model):
+        if not self._journal:
+            return super().update(id, data, model)
+        with self._write_lock:
+            record = super().update(id, data, model)
+            self._append_to_journal(model, {"action": "update", "id": id, "data": data})
+        return record
+
+    def delete(self, id, model):
+        if not self._journal:
+            return super().delete(id, model)
+        with self._write_lock:
+            result = super().delete(id, model)
+            self._append_to_journal(model, {"action": "delete", "id": id})
+        return result
+
+    def reload_if_changed(self, model):
+        """
+        Reloads the table for the given model if its file has changed (see `configure`)
+        """
+        if self._reload_check_interval is None:
+            return
+
+        file_name = model.table_name()
+        now = time.monotonic()
+        with self._reload_lock:
+            previous_state = self._file_states.get(file_name)
+            if previous_state and now - previous_state["checked_at"] < self._reload_check_interval:
+                return
+            if file_name in self._reloading:
+                return
+            file_state = self._file_state(file_name)
+            if file_state is None:
+                # if the file is temporarily missing, keep serving what we have
+                return
+            if previous_state and self._file_state_key(file_state) == self._file_state_key(previous_state):
+                previous_state["checked_at"] = now
+                return
+            self._reloading.add(file_name)
+
+        if self._background_reload:
+            threading.Thread(target=self._reload, args=(model,), daemon=True).start()
+        else:
+            self._reload(model)
+
+    def _reload(self, model):
+        """
+        Loads the table for the given model again and swaps it in.
+
+        If the file can't be loaded (e.g. because it is only partially written) we keep serving the old table and
+        try again after the next check interval.  The swap happens under the write lock so that changes can't be
+        made to the old table after the new one was built.  With the journal, the new table includes the journal, so
+        the lock is held for the whole load (reads carry on with the old table in the meantime).
+        """
+        file_name = model.table_name()
+        try:
+            if self._journal:
+                with self._write_lock:
+                    self._load_and_swap(model)
+            else:
+                self._load_and_swap(model)
+        except Exception as error:
+            logger.warning(f"Failed to reload '{file_name}', so the previous data will be used for now: {error}")
+            with self._reload_lock:
+                previous_state = self._file_states.get(file_name) or {"mtime": None, "size": None, "hash": None}
+                self._file_states[file_name] = {**previous_state, "checked_at": time.monotonic()}
+        finally:
+            with self._reload_lock:
+                self._reloading.discard(file_name)
+
+    def _load_and_swap(self, model):
+        file_name = model.table_name()
+        [table, file_state] = self.load_table(model)
+        with self._write_lock:
+            # a shared table being replaced isn't closed here because reads don't take the lock and may still be
+            # using it: its file and memory map are released along with the last reference to it
+            self._tables[file_name] = table
+            self._file_states[file_name] = file_state
+
+    def _file_state(self, file_name):
+        try:
+            stat = os.stat(file_name)
+        except OSError:
+            return None
+        file_state = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "checked_at": time.monotonic()}
+        if self._change_detection == "hash":
+            file_hash = hashlib.sha256()
+            with open(file_name, "rb") as fp:
+                for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+                    file_hash.update(chunk)
+            file_state["hash"] = file_hash.hexdigest()
+        return file_state
+
+    def _file_state_key(self, file_state):
+        if self._change_detection == "hash":
+            return file_state.get("hash")
+        return (file_state["mtime"], file_state["size"])
 
     def transform_data_from_file(self, file_contents):
         raise NotImplementedError("You must define how to transform the file contents to a list of dicts")
 
+    def transform_data_to_file(self, records):
+        raise NotImplementedError(
+            "You must define how to transform a list of dicts back into file contents in order to compact the journal"
+        )
+
+    def count(self, configuration, model):
+        self.create_table(model)
+        return super().count(configuration, model)
+
     def records(self, configuration, model, next_page_data=None):
         self.create_table(model)
         return super().records(configuration, model, next_page_data=next_page_data)
@@ -0,0 +1,205 @@
+import base64
+from collections import OrderedDict
+import email.utils
+import hashlib
+import json
+import os
+import threading
+import time
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+
+def request_key(method, url, json_data, headers, identity=""):
+    """
+    Returns a key that identifies a request by its method, url, body, headers, and who is making it.
+
+    `identity` should identify the credentials used for the request (e.g. a hash of the authentication headers), so
+    that responses are never shared between callers with different credentials.
+    """
+    request = json.dumps([method.upper(), url, json_data, headers, identity], sort_keys=True, default=str)
+    return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+
+class HttpCache:
+    """
+    A client-side HTTP cache for the ApiBackend.
+
+    Responses are cached according to the usual HTTP rules: a response stays fresh for as long as its
+    `Cache-Control: max-age` (or its `Expires` header) allows, and is returned without contacting the server at all
+    while it is fresh.  Once it is stale, or if the server sent `Cache-Control: no-cache`, the cached response is
+    revalidated with `If-None-Match` (from its `ETag`) and/or `If-Modified-Since` (from its `Last-Modified`), and a
+    `304 Not Modified` response means we can reuse the cached body.  Responses with neither freshness information nor
+    validators, with `Cache-Control: no-store` or `private`, or with `Vary: *` are never cached, and a cached response
+    is only used for requests with the same values for the headers listed in its `Vary` header.
+
+    Since the cache may be shared by backends with different credentials, it is keyed on the identity of the caller
+    as well as the request (see `request_key`).
+
+    Entries are kept in a bounded LRU in memory.  If a directory is provided, entries are also stored there so that
+    they survive restarts and can be shared between processes.
+    """
+
+    max_entries = None
+    directory = None
+    _entries = None
+    _lock = None
+
+    def __init__(self, max_entries=1000, directory=None):
+        self.max_entries = max_entries
+        self.directory = directory
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def fetch(self, method, url, json_data, headers, send, identity=""):
+        """
+        Returns the response for the given request, either from the cache or by calling `send`.
+
+        `send` should execute the request with the given (extra) headers and return the response.  `identity`
+        identifies the credentials the request is sent with (see `request_key`).
+        """
+        key = request_key(method, url, json_data, headers, identity=identity)
+        entry = self.get(key)
+        if entry and entry.get("vary") and entry["vary"] != self._vary_values(entry["vary"].keys(), headers):
+            entry = None
+        if entry and entry["expires_at"] > time.time():
+            return self._as_response(entry)
+
+        validators = {}
+        if entry and entry.get("etag"):
+            validators["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            validators["If-Modified-Since"] = entry["last_modified"]
+        response = send({**headers, **validators})
+
+        if entry and validators and response.status_code == 304:
+            entry = {**entry, "expires_at": self._expires_at(getattr(response, "headers", {}) or entry["headers"])}
+            self.set(key, entry)
+            return self._as_response(entry)
+
+        entry = self._as_entry(response, headers)
+        if entry:
+            self.set(key, entry)
+        return response
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        if not self.directory:
+            return None
+        try:
+            with open(os.path.join(self.directory, f"{key}.json"), "r") as fp:
+                entry = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def set(self, key, entry):
+        self._remember(key, entry)
+        if not self.directory:
+            return
+        file_name = os.path.join(self.directory, f"{key}.json")
+        temporary_file_name = f"{file_name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporary_file_name, "w") as fp:
+                json.dump(entry, fp)
+            os.replace(temporary_file_name, file_name)
+        except OSError:
+            # the disk store is just an optimization, so we can live without it
+            pass
+
+    def clear(self):
+        with self._lock:
+            self._entries = OrderedDict()
+        if not self.directory:
+            return
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith(".json"):
+                os.remove(os.path.join(self.directory, file_name))
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _as_entry(self, response, request_headers):
+        headers = CaseInsensitiveDict(getattr(response, "headers", None) or {})
+        cache_control = self._cache_control(headers)
+        if response.status_code != 200 or "no-store" in cache_control or "private" in cache_control:
+            return None
+        vary = [name.strip().lower() for name in headers.get("Vary", "").split(",") if name.strip()]
+        if "*" in vary:
+            return None
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        expires_at = self._expires_at(headers)
+        if not etag and not last_modified and expires_at <= time.time():
+            return None
+        return {
+            "status_code": response.status_code,
+            "headers": dict(headers),
+            "content": base64.b64encode(response.content).decode("ascii"),
+            "url": getattr(response, "url", ""),
+            "etag": etag,
+            "last_modified": last_modified,
+            "expires_at": expires_at,
+            "vary": self._vary_values(vary, request_headers),
+        }
+
+    def _vary_values(self, names, request_headers):
+        request_headers = CaseInsensitiveDict(request_headers)
+        return {name: request_headers.get(name) for name in names}
+
+    def _as_response(self, entry):
+        response = Response()
+        response.status_code = entry["status_code"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = base64.b64decode(entry["content"])
+        response.url = entry["url"]
+        response.encoding = "utf-8"
+        return response
+
+    def _cache_control(self, headers):
+        directives = {}
+        for directive in headers.get("Cache-Control", "").split(","):
+            [name, _, value] = directive.strip().partition("=")
+            if name:
+                directives[name.lower()] = value.strip('"')
+        return directives
+
+    def _expires_at(self, headers):
+        """
+        Returns the (epoch) time until which a response with the given headers is fresh
+        """
+        headers = CaseInsensitiveDict(headers)
+        now = time.time()
+        cache_control = self._cache_control(headers)
+        if "no-cache" in cache_control:
+            return now
+        if "max-age" in cache_control:
+            try:
+                return now + int(cache_control["max-age"]) - self._age(headers)
+            except ValueError:
+                return now
+        if headers.get("Expires"):
+            try:
+                expires = email.utils.parsedate_to_datetime(headers["Expires"]).timestamp()
+                date = email.utils.parsedate_to_datetime(headers["Date"]).timestamp() if headers.get("Date") else now
+            except (TypeError, ValueError):
+                return now
+            return now + expires - date
+        return now
+
+    def _age(self, headers):
+        try:
+            return int(headers.get("Age", 0))
+        except ValueError:
+            return 0
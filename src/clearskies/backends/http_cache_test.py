@@ -0,0 +1,163 @@
+import json
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from .api_backend import ApiBackend
+from .http_cache import HttpCache
+
+
+class HttpCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.sent_headers = []
+        self.responses = []
+
+    def response(self, status_code=200, content=b'{"data": [{"id": 5}]}', headers=None):
+        return type(
+            "",
+            (),
+            {
+                "status_code": status_code,
+                "ok": status_code < 400,
+                "content": content,
+                "headers": headers or {},
+                "json": lambda self: json.loads(content),
+            },
+        )()
+
+    def send(self, headers):
+        self.sent_headers.append(headers)
+        return self.responses.pop(0)
+
+    def fetch(self, cache, url="https://example.com/users"):
+        return cache.fetch("GET", url, {"limit": 10}, {}, self.send)
+
+    def test_fresh_responses_skip_the_server(self):
+        cache = HttpCache()
+        self.responses = [self.response(headers={"Cache-Control": "public, max-age=60"})]
+        self.assertEqual({"data": [{"id": 5}]}, self.fetch(cache).json())
+        self.assertEqual({"data": [{"id": 5}]}, self.fetch(cache).json())
+        self.assertEqual(1, len(self.sent_headers))
+
+        # a different request body is a different cache entry
+        self.responses = [self.response(content=b'{"data": []}')]
+        cache.fetch("GET", "https://example.com/users", {"limit": 20}, {}, self.send)
+        self.assertEqual(2, len(self.sent_headers))
+
+    def test_expires(self):
+        cache = HttpCache()
+        date = time.time()
+        self.responses = [
+            self.response(
+                headers={
+                    "Date": time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(date)),
+                    "Expires": time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(date + 120)),
+                }
+            )
+        ]
+        self.fetch(cache)
+        self.fetch(cache)
+        self.assertEqual(1, len(self.sent_headers))
+
+    def test_revalidation(self):
+        cache = HttpCache()
+        self.responses = [
+            self.response(headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+            self.response(status_code=304, content=b""),
+            self.response(content=b'{"data": [{"id": 6}]}', headers={"ETag": '"v2"'}),
+        ]
+        self.assertEqual({"data": [{"id": 5}]}, self.fetch(cache).json())
+        self.assertEqual({"data": [{"id": 5}]}, self.fetch(cache).json())
+        self.assertEqual(
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}, self.sent_headers[1]
+        )
+        self.assertEqual({"data": [{"id": 6}]}, self.fetch(cache).json())
+        self.assertEqual(
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}, self.sent_headers[2]
+        )
+        self.responses = [self.response(status_code=304, content=b"")]
+        self.assertEqual({"data": [{"id": 6}]}, self.fetch(cache).json())
+        self.assertEqual({"If-None-Match": '"v2"'}, self.sent_headers[3])
+
+    def test_uncacheable_responses(self):
+        cache = HttpCache()
+        self.responses = [
+            self.response(headers={"Cache-Control": "no-store", "ETag": '"v1"'}),
+            self.response(),
+            self.response(status_code=500, headers={"Cache-Control": "max-age=60"}),
+            self.response(),
+        ]
+        for i in range(4):
+            self.fetch(cache)
+        self.assertEqual([{}, {}, {}, {}], self.sent_headers)
+
+    def test_lru_and_disk_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = HttpCache(max_entries=1, directory=directory)
+            self.responses = [
+                self.response(headers={"Cache-Control": "max-age=60"}),
+                self.response(content=b'{"data": []}', headers={"Cache-Control": "max-age=60"}),
+            ]
+            self.fetch(cache, url="https://example.com/a")
+            self.fetch(cache, url="https://example.com/b")
+            self.assertEqual(1, len(cache._entries))
+
+            # the first entry was evicted from memory, but is still on disk (which is also where a new process looks)
+            self.assertEqual({"data": [{"id": 5}]}, self.fetch(cache, url="https://example.com/a").json())
+            self.assertEqual(
+                {"data": []}, self.fetch(HttpCache(directory=directory), url="https://example.com/b").json()
+            )
+            self.assertEqual(2, len(self.sent_headers))
+
+    def test_private_and_vary(self):
+        cache = HttpCache()
+        self.responses = [
+            self.response(headers={"Cache-Control": "private, max-age=60"}),
+            self.response(headers={"Cache-Control": "private, max-age=60"}),
+        ]
+        self.fetch(cache)
+        self.fetch(cache)
+        self.assertEqual(2, len(self.sent_headers))
+
+        self.responses = [self.response(headers={"Cache-Control": "max-age=60", "Vary": "*"}) for i in range(2)]
+        self.fetch(cache)
+        self.fetch(cache)
+        self.assertEqual(4, len(self.sent_headers))
+
+        # a stored entry only answers requests with the same values for the headers it varies on
+        self.responses = [self.response(headers={"Cache-Control": "max-age=60", "Vary": "Accept-Language"})]
+        cache.fetch("GET", "https://example.com/users", {}, {"Accept-Language": "en"}, self.send)
+        cache.fetch("GET", "https://example.com/users", {}, {"Accept-Language": "en"}, self.send)
+        self.assertEqual(5, len(self.sent_headers))
+        entry = cache.get(list(cache._entries.keys())[-1])
+        self.assertEqual({"accept-language": "en"}, entry["vary"])
+
+    def test_identity(self):
+        cache = HttpCache()
+        self.responses = [self.response(headers={"Cache-Control": "max-age=60"}) for i in range(2)]
+        cache.fetch("GET", "https://example.com/users", {}, {}, self.send, identity="alice")
+        cache.fetch("GET", "https://example.com/users", {}, {}, self.send, identity="bob")
+        cache.fetch("GET", "https://example.com/users", {}, {}, self.send, identity="alice")
+        self.assertEqual(2, len(self.sent_headers))
+
+    def test_api_backend(self):
+        response = self.response(headers={"Cache-Control": "max-age=60"})
+        requests = type("", (), {"request": MagicMock(return_value=response)})()
+        backend = ApiBackend(requests)
+        backend.configure(url="https://example.com", cache=HttpCache())
+        for i in range(2):
+            self.assertEqual([{"id": 5}], backend.records({"table_name": "users", "pagination": {}}, "model"))
+        requests.request.assert_called_once()
+
+    def test_api_backend_credentials(self):
+        response = self.response(headers={"Cache-Control": "max-age=60"})
+        requests = type("", (), {"request": MagicMock(return_value=response)})()
+        cache = HttpCache()
+        for secret in ["alice", "bob", "alice"]:
+            auth = type("", (), {"headers": lambda self, secret=secret: {"Authorization": secret}})()
+            backend = ApiBackend(requests)
+            backend.configure(url="https://example.com", cache=cache, auth=auth)
+            backend.records({"table_name": "users", "pagination": {}}, "model")
+        # the two callers don't share responses, but each gets their own from the cache
+        self.assertEqual(2, requests.request.call_count)
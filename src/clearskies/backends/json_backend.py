@@ -5,3 +5,6 @@ from .file_backend import FileBackend
 class JsonBackend(FileBackend):
     def transform_data_from_file(self, file_contents):
         return json.loads(file_contents)
+
+    def transform_data_to_file(self, records):
+        return json.dumps(records, default=str)
@@ -0,0 +1,182 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from .json_backend import JsonBackend
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+
+class JsonBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "users.json")
+        self.write([{"id": 1, "name": "Conor"}, {"id": 2, "name": "Jane"}])
+        self.user_model = SimpleNamespace(
+            table_name=lambda: self.file_name, columns_configuration=lambda: {"name": ""}, id_column_name="id"
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, records, mtime=None):
+        with open(self.file_name, "w") as fp:
+            fp.write(json.dumps(records))
+        if mtime:
+            os.utime(self.file_name, ns=(mtime, mtime))
+
+    def names(self, json_backend):
+        return [record["name"] for record in json_backend.records({"table_name": self.file_name}, self.user_model)]
+
+    def test_load(self):
+        json_backend = JsonBackend()
+        self.assertEqual(["Conor", "Jane"], self.names(json_backend))
+        self.assertEqual(2, json_backend.count({"table_name": self.file_name}, self.user_model))
+
+    def test_no_reload_by_default(self):
+        json_backend = JsonBackend()
+        self.assertEqual(["Conor", "Jane"], self.names(json_backend))
+        self.write([{"id": 1, "name": "Ronoc"}], mtime=time.time_ns() + 10**9)
+        self.assertEqual(["Conor", "Jane"], self.names(json_backend))
+
+    def test_reload_on_mtime(self):
+        json_backend = JsonBackend()
+        json_backend.configure(reload_check_interval=0, background_reload=False)
+        self.assertEqual(["Conor", "Jane"], self.names(json_backend))
+        self.write([{"id": 1, "name": "Ronoc"}], mtime=time.time_ns() + 10**9)
+        self.assertEqual(["Ronoc"], self.names(json_backend))
+
+    def test_check_interval(self):
+        json_backend = JsonBackend()
+        json_backend.configure(reload_check_interval=3600, background_reload=False)
+        self.assertEqual(["Conor", "Jane"], self.names(json_backend))
+        self.write([{"id": 1, "name": "Ronoc"}], mtime=time.time_ns() + 10**9)
+        self.assertEqual(["Conor", "Jane"], self.names(json_backend))
+
+    def test_reload_on_hash(self):
+        json_backend = JsonBackend()
+        json_backend.configure(reload_check_interval=0, change_detection="hash", background_reload=False)
+        original_mtime = os.stat(self.file_name).st_mtime_ns
+        self.assertEqual(["Conor", "Jane"], self.names(json_backend))
+        # same size and modification time, but different contents
+        self.write([{"id": 1, "name": "Ronoc"}, {"id": 2, "name": "Enaj"}], mtime=original_mtime)
+        self.assertEqual(["Ronoc", "Enaj"], self.names(json_backend))
+
+    def test_background_reload(self):
+        json_backend = JsonBackend()
+        json_backend.configure(reload_check_interval=0)
+        self.assertEqual(["Conor", "Jane"], self.names(json_backend))
+        self.write([{"id": 1, "name": "Ronoc"}], mtime=time.time_ns() + 10**9)
+        for i in range(100):
+            if self.names(json_backend) == ["Ronoc"]:
+                break
+            time.sleep(0.01)
+        self.assertEqual(["Ronoc"], self.names(json_backend))
+
+    def test_failed_reload(self):
+        json_backend = JsonBackend()
+        json_backend.configure(reload_check_interval=0, background_reload=False)
+        self.assertEqual(["Conor", "Jane"], self.names(json_backend))
+        # a half-written file
+        with open(self.file_name, "w") as fp:
+            fp.write('[{"id": 1, "na')
+        os.utime(self.file_name, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+        with self.assertLogs("clearskies.backends.file_backend", level="WARNING"):
+            self.assertEqual(["Conor", "Jane"], self.names(json_backend))
+
+        # the failure counts as a check, so we wait for the interval before trying again
+        json_backend._reload_check_interval = 3600
+        json_backend.load_table = MagicMock()
+        self.assertEqual(["Conor", "Jane"], self.names(json_backend))
+        json_backend.load_table.assert_not_called()
+
+    def journal(self):
+        with open(f"{self.file_name}.journal", "r") as fp:
+            return [json.loads(line) for line in fp if line.strip()]
+
+    def test_journal_replay(self):
+        json_backend = JsonBackend()
+        json_backend.configure(journal=True, compact_after=None)
+        json_backend.create({"name": "Ronoc"}, self.user_model)
+        json_backend.update(1, {"name": "Connor"}, self.user_model)
+        json_backend.delete(2, self.user_model)
+        self.assertEqual(["create", "update", "delete"], [entry["action"] for entry in self.journal()])
+        # the data file itself is untouched until compaction
+        with open(self.file_name, "r") as fp:
+            self.assertEqual([{"id": 1, "name": "Conor"}, {"id": 2, "name": "Jane"}], json.load(fp))
+
+        json_backend = JsonBackend()
+        json_backend.configure(journal=True, compact_after=None)
+        self.assertEqual(["Connor", "Ronoc"], self.names(json_backend))
+        self.assertEqual(4, json_backend._tables[self.file_name].create({"name": "Enaj"})["id"])
+
+    def test_create_after_journal_replay(self):
+        json_backend = JsonBackend()
+        json_backend.configure(journal=True, compact_after=None)
+        self.assertEqual(3, json_backend.create({"name": "Ronoc"}, self.user_model)["id"])
+
+        # after a restart, new records still get ids past the ones in the journal
+        json_backend = JsonBackend()
+        json_backend.configure(journal=True, compact_after=None)
+        self.assertEqual(4, json_backend.create({"name": "Enaj"}, self.user_model)["id"])
+        self.assertEqual(["Conor", "Jane", "Ronoc", "Enaj"], self.names(json_backend))
+
+    def test_journal_ignores_incomplete_entry(self):
+        with open(f"{self.file_name}.journal", "w") as fp:
+            fp.write('{"action": "delete", "id": 1}\n{"action": "create", "data": {"na')
+        json_backend = JsonBackend()
+        json_backend.configure(journal=True)
+        self.assertEqual(["Jane"], self.names(json_backend))
+
+    def test_compaction(self):
+        json_backend = JsonBackend()
+        json_backend.configure(journal=True, compact_after=3, fsync="never")
+        json_backend.create({"name": "Ronoc"}, self.user_model)
+        json_backend.delete(2, self.user_model)
+        self.assertEqual(2, len(self.journal()))
+        json_backend.update(3, {"name": "Enaj"}, self.user_model)
+        self.assertEqual([], self.journal())
+        with open(self.file_name, "r") as fp:
+            self.assertEqual([{"id": 1, "name": "Conor"}, {"id": 3, "name": "Enaj"}], json.load(fp))
+
+        # replaying an old journal on top of the compacted file has no effect
+        with open(f"{self.file_name}.journal", "w") as fp:
+            fp.write('{"action": "create", "data": {"id": 3, "name": "Enaj"}}\n{"action": "delete", "id": 2}\n')
+        self.assertEqual(["Conor", "Enaj"], self.names(JsonBackend()))
+        json_backend = JsonBackend()
+        json_backend.configure(journal=True)
+        self.assertEqual(["Conor", "Enaj"], self.names(json_backend))
+
+    def test_invalid_fsync(self):
+        with self.assertRaises(ValueError):
+            JsonBackend().configure(journal=True, fsync="sometimes")
+
+    def test_shared_memory_options(self):
+        for options in [{"columnar": True}, {"thread_safe": True}, {"like_indexes": {"name": 3}}]:
+            with self.assertRaises(ValueError):
+                JsonBackend().configure(shared_memory_directory=self.directory.name, **options)
+
+    def test_shared_memory(self):
+        shared_directory = os.path.join(self.directory.name, "shm")
+        os.mkdir(shared_directory)
+        workers = [JsonBackend(), JsonBackend()]
+        for worker in workers:
+            worker.configure(shared_memory_directory=shared_directory, reload_check_interval=0, background_reload=False)
+            self.assertEqual(["Conor", "Jane"], self.names(worker))
+        [shared_file_name] = [name for name in os.listdir(shared_directory) if name.endswith(".jsonl")]
+        self.assertEqual(
+            os.path.join(shared_directory, shared_file_name), workers[1]._tables[self.file_name]._file_name
+        )
+
+        # changes are private to the worker that makes them
+        workers[0].update(1, {"name": "Connor"}, self.user_model)
+        self.assertEqual(["Connor", "Jane"], self.names(workers[0]))
+        self.assertEqual(["Conor", "Jane"], self.names(workers[1]))
+
+        # when the file changes, the old shared file is replaced with a new one
+        self.write([{"id": 1, "name": "Ronoc"}], mtime=time.time_ns() + 10**9)
+        self.assertEqual(["Ronoc"], self.names(workers[1]))
+        self.assertEqual(["Ronoc"], self.names(workers[0]))
+        self.assertNotIn(shared_file_name, os.listdir(shared_directory))
+        self.assertEqual(1, len([name for name in os.listdir(shared_directory) if name.endswith(".jsonl")]))
@@ -0,0 +1,274 @@
+import collections
+from functools import cmp_to_key
+import json
+import mmap
+import os
+from . import memory_backend
+
+
+class JsonLinesTable(memory_backend.MemoryTable):
+    """
+    A read-only table that streams its records out of a JSON Lines (NDJSON) file.
+
+    Unlike the FileBackend, records are never all held in memory at once.  The file is memory-mapped and every query
+    walks through it line by line, decoding each record and checking it against the conditions on the fly, so only
+    matching records are kept around (and, if there's no sorting, only until the requested page is full).  An index
+    of record ids to byte offsets is built the first time the file is read, which means that lookups by id (by far
+    the most common query) only have to decode the matching line.  The index is stored next to the data file and
+    reused until the data file changes.
+
+    The file and its memory map stay open for the life of the table: call `close()` (or use the table as a context
+    manager) to release them.
+    """
+
+    _file_name = None
+    _index_file_name = None
+    _file = None
+    _mmap = None
+    _offsets = None
+
+    def __init__(self, model, file_name, persist_index=True):
+        super().__init__(model)
+        self._file_name = file_name
+        self._index_file_name = f"{file_name}.index" if persist_index else None
+        self._open()
+
+    def _open(self):
+        self._file = open(self._file_name, "rb")
+        try:
+            stat = os.fstat(self._file.fileno())
+            # mmap doesn't allow mapping empty files
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b""
+        except Exception:
+            self.close()
+            raise
+        self._offsets = self._load_index(stat)
+        if self._offsets is None:
+            self._offsets = self._build_index()
+            self._save_index(stat)
+
+    def close(self):
+        """
+        Releases the memory map and the file handle.  Any forks of the table share them, so are closed too.
+
+        Tables that are simply dropped release them once garbage collected, so this is only needed to release them
+        promptly (e.g. before deleting the file).
+        """
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._mmap = None
+        if self._file:
+            self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state["_file"]
+        del state["_mmap"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open()
+
+    def _lines(self, start=0):
+        """
+        Yields (offset, line) for every non-empty line in the file, starting at the given offset
+        """
+        data = self._mmap
+        size = len(data)
+        position = start
+        while position < size:
+            end = data.find(b"\n", position)
+            if end == -1:
+                end = size
+            line = data[position:end].strip()
+            if line:
+                yield (position, line)
+            position = end + 1
+
+    def _build_index(self):
+        offsets = {}
+        for row_number, (offset, line) in enumerate(self._lines()):
+            record_id = json.loads(line).get(self.id_column_name)
+            if not record_id:
+                print(
+                    f"Missing id column, '{self.id_column_name}', for record row #{row_number+1} in file '{self._file_name}'.  Skipping."
+                )
+                continue
+            key = str(record_id)
+            if key not in offsets:
+                offsets[key] = []
+            offsets[key].append(offset)
+        return offsets
+
+    def _load_index(self, stat):
+        if not self._index_file_name or not os.path.isfile(self._index_file_name):
+            return None
+        try:
+            with open(self._index_file_name, "r") as fp:
+                index = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        if index.get("mtime") != stat.st_mtime_ns or index.get("size") != stat.st_size:
+            return None
+        return index["offsets"]
+
+    def _save_index(self, stat):
+        if not self._index_file_name:
+            return
+        try:
+            with open(self._index_file_name, "w") as fp:
+                json.dump({"mtime": stat.st_mtime_ns, "size": stat.st_size, "offsets": self._offsets}, fp)
+        except OSError:
+            # the index is just an optimization, so if we can't save it we'll just rebuild it next time
+            pass
+
+    def _record_at(self, offset):
+        end = self._mmap.find(b"\n", offset)
+        return json.loads(self._mmap[offset : end if end != -1 else len(self._mmap)])
+
+    def _id_lookup_offsets(self, wheres):
+        """
+        Returns the offsets of the only records that can match the conditions, or None if we have to scan the file
+        """
+        for where in wheres:
+            if where["column"] != self.id_column_name or where.get("table"):
+                continue
+            operator = where["operator"].lower()
+            if operator not in ["=", "<=>", "in"]:
+                continue
+            values = where["values"] if operator == "in" else where["values"][:1]
+            offsets = set()
+            for value in values:
+                offsets.update(self._offsets.get(str(value), []))
+            return sorted(offsets)
+        return None
+
+    def _matching_rows(self, wheres):
+        """
+        Yields the records that match the given conditions, in file order
+        """
+        filters = [self._where_as_filter(where) for where in wheres]
+        offsets = self._id_lookup_offsets(wheres)
+        if offsets is not None:
+            records = (self._record_at(offset) for offset in offsets)
+        else:
+            records = (json.loads(line) for (offset, line) in self._lines())
+        for record in records:
+            if not record.get(self.id_column_name):
+                continue
+            if all(matches(record) for matches in filters):
+                yield record
+
+    def count(self, configuration, wheres):
+        return sum(1 for record in self._matching_rows(wheres))
+
+    def rows(self, configuration, wheres, filter_only=False, next_page_data=None):
+        rows = self._matching_rows(wheres)
+        if filter_only:
+            return list(rows)
+        paginate = "limit" in configuration or (
+            "pagination" in configuration and configuration["pagination"].get("start")
+        )
+        if "sorts" in configuration and configuration["sorts"]:
+            rows = sorted(
+                rows, key=cmp_to_key(lambda row_a, row_b: memory_backend._sort(row_a, row_b, configuration["sorts"]))
+            )
+        elif paginate and configuration.get("limit"):
+            # without sorting we can stop reading as soon as we have the page (plus one record, to know if there
+            # is another page).  Only the last limit+1 records are kept, which is always enough to cover the page
+            # that _page_bounds picks - including when the start is past the end and it falls back to the last record
+            start = int(configuration.get("pagination", {}).get("start", 0) or 0)
+            limit = int(configuration["limit"])
+            window = collections.deque(maxlen=limit + 1)
+            number_rows = 0
+            for row in rows:
+                window.append(row)
+                number_rows += 1
+                if number_rows > start + limit:
+                    break
+            [page_start, page_end] = self._page_bounds(configuration, number_rows, next_page_data)
+            window_start = number_rows - len(window)
+            return list(window)[page_start - window_start : page_end - window_start]
+        rows = list(rows)
+        if paginate:
+            [start, end] = self._page_bounds(configuration, len(rows), next_page_data)
+            rows = rows[start:end]
+        return rows
+
+    def all_rows(self):
+        return list(self._matching_rows([]))
+
+    def add_like_index(self, column_name, gram_size=3):
+        # there's nowhere to keep an index when the records themselves aren't kept in memory
+        pass
+
+    def _read_only(self):
+        raise ValueError(f"Cannot modify records in '{self._file_name}': the JsonLinesBackend is read-only")
+
+    def update(self, id, data):
+        self._read_only()
+
+    def create(self, data):
+        self._read_only()
+
+    def delete(self, id):
+        self._read_only()
+
+    def load(self, rows, id_index):
+        self._read_only()
+
+
+class JsonLinesBackend(memory_backend.MemoryBackend):
+    """
+    A read-only backend for JSON Lines (NDJSON) files that streams records instead of loading them into memory.
+
+    Like the FileBackend, the table name of the model is the name of the file to read.  See JsonLinesTable for
+    details.  Each file is kept open until `close()` is called (or the backend is used as a context manager).
+    """
+
+    _persist_index = True
+
+    def configure(self, persist_index=True):
+        self._persist_index = persist_index
+
+    def close(self):
+        """
+        Closes every open file.  Tables are reopened as needed if the backend is used again.
+        """
+        with self._write_lock:
+            tables = self._tables
+            self._tables = {}
+        for table in tables.values():
+            table.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def create_table(self, model):
+        model = self.cheez_model(model)
+        file_name = model.table_name()
+        if file_name in self._tables:
+            return
+        with self._write_lock:
+            if file_name in self._tables:
+                return
+            self._tables[file_name] = JsonLinesTable(model, file_name, persist_index=self._persist_index)
+
+    def count(self, configuration, model):
+        self.create_table(model)
+        return super().count(configuration, model)
+
+    def records(self, configuration, model, next_page_data=None):
+        self.create_table(model)
+        return super().records(configuration, model, next_page_data=next_page_data)
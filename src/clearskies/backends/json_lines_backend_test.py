@@ -0,0 +1,141 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from .json_lines_backend import JsonLinesBackend
+from types import SimpleNamespace
+
+
+class JsonLinesBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, "users.ndjson")
+        with open(self.file_name, "w") as fp:
+            for record in [
+                {"id": 1, "name": "Conor", "age": 5},
+                {"id": 2, "name": "Jane", "age": 12},
+                {"name": "No id"},
+                {"id": 3, "name": "Ronoc", "age": 7},
+            ]:
+                fp.write(json.dumps(record) + "\n\n")
+        self.user_model = SimpleNamespace(
+            table_name=lambda: self.file_name,
+            columns_configuration=lambda: {"name": "", "age": ""},
+            id_column_name="id",
+        )
+        self.backend = JsonLinesBackend()
+
+    def tearDown(self):
+        self.backend.close()
+        self.directory.cleanup()
+
+    def records(self, **configuration):
+        return self.backend.records({"table_name": self.file_name, **configuration}, self.user_model)
+
+    def test_records(self):
+        self.assertEqual(
+            [
+                {"id": 1, "name": "Conor", "age": 5},
+                {"id": 2, "name": "Jane", "age": 12},
+                {"id": 3, "name": "Ronoc", "age": 7},
+            ],
+            self.records(),
+        )
+        self.assertEqual(
+            [{"id": 2, "name": "Jane", "age": 12}, {"id": 3, "name": "Ronoc", "age": 7}],
+            self.records(wheres=[{"column": "age", "operator": ">", "values": [6]}]),
+        )
+        self.assertEqual(
+            ["Ronoc", "Jane"],
+            [
+                record["name"]
+                for record in self.records(
+                    wheres=[{"column": "age", "operator": ">", "values": [6]}],
+                    sorts=[{"column": "name", "direction": "DESC"}],
+                )
+            ],
+        )
+        self.assertEqual(
+            2,
+            self.backend.count(
+                {"table_name": self.file_name, "wheres": [{"column": "age", "operator": ">", "values": [6]}]},
+                self.user_model,
+            ),
+        )
+
+    def test_pagination(self):
+        next_page_data = {}
+        records = self.backend.records(
+            {"table_name": self.file_name, "limit": 2, "pagination": {"start": 0}},
+            self.user_model,
+            next_page_data=next_page_data,
+        )
+        self.assertEqual([1, 2], [record["id"] for record in records])
+        self.assertEqual({"start": 2}, next_page_data)
+
+        next_page_data = {}
+        records = self.backend.records(
+            {"table_name": self.file_name, "limit": 2, "pagination": {"start": 2}},
+            self.user_model,
+            next_page_data=next_page_data,
+        )
+        self.assertEqual([3], [record["id"] for record in records])
+        self.assertEqual({}, next_page_data)
+
+        # a start past the end is clamped to the last record, the same as with sorting (and the other backends)
+        for sorts in [[], [{"column": "id", "direction": "ASC"}]]:
+            next_page_data = {}
+            records = self.backend.records(
+                {"table_name": self.file_name, "limit": 2, "pagination": {"start": 10}, "sorts": sorts},
+                self.user_model,
+                next_page_data=next_page_data,
+            )
+            self.assertEqual([3], [record["id"] for record in records])
+            self.assertEqual({}, next_page_data)
+
+    def test_close(self):
+        self.records()
+        table = self.backend._tables[self.file_name]
+        file = table._file
+        with self.backend:
+            pass
+        self.assertTrue(file.closed)
+        self.assertEqual({}, self.backend._tables)
+        # the file is reopened if the backend is used again
+        self.assertEqual(3, len(self.records()))
+
+    def test_id_lookup_uses_index(self):
+        self.records()
+        table = self.backend._tables[self.file_name]
+        with patch.object(table, "_lines", side_effect=AssertionError("should not scan")):
+            self.assertEqual(
+                [{"id": 3, "name": "Ronoc", "age": 7}],
+                self.records(wheres=[{"column": "id", "operator": "=", "values": ["3"]}]),
+            )
+            self.assertEqual(
+                [1, 3],
+                [
+                    record["id"]
+                    for record in self.records(wheres=[{"column": "id", "operator": "in", "values": [3, 1]}])
+                ],
+            )
+
+    def test_persisted_index(self):
+        self.records()
+        self.assertTrue(os.path.isfile(f"{self.file_name}.index"))
+        with patch("clearskies.backends.json_lines_backend.JsonLinesTable._build_index") as build_index:
+            other_backend = JsonLinesBackend()
+            self.assertEqual(
+                [{"id": 2, "name": "Jane", "age": 12}],
+                other_backend.records(
+                    {"table_name": self.file_name, "wheres": [{"column": "id", "operator": "=", "values": [2]}]},
+                    self.user_model,
+                ),
+            )
+            build_index.assert_not_called()
+
+    def test_read_only(self):
+        with self.assertRaises(ValueError) as context:
+            self.backend.create({"name": "hey"}, self.user_model)
+        self.assertIn("read-only", str(context.exception))
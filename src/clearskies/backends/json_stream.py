@@ -0,0 +1,113 @@
+import codecs
+import json
+
+_decoder = json.JSONDecoder()
+_whitespace = " \t\n\r"
+
+
+class JsonStream:
+    """
+    Incrementally decodes a JSON object from an iterable of chunks (bytes or strings).
+
+    The values in the array under `array_key` are yielded one at a time by `items`, so only one of them has to be in
+    memory at once, regardless of the size of the document.  Every other top-level key is decoded normally and
+    stored in `envelope` (which, like `array_found`, is only complete once `items` has been exhausted):
+
+    ```
+    stream = JsonStream(response.iter_content(65536), "data")
+    for record in stream.items():
+        ...
+    print(stream.envelope["pagination"])
+    ```
+    """
+
+    envelope = None
+    array_key = None
+    array_found = False
+    _chunks = None
+    _text_decoder = None
+    _buffer = None
+    _position = None
+    _exhausted = False
+
+    def __init__(self, chunks, array_key="data"):
+        self.envelope = {}
+        self.array_key = array_key
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+
+    def items(self):
+        self._expect("{")
+        if self._peek() == "}":
+            self._position += 1
+            return
+        while True:
+            key = self._value()
+            if type(key) != str:
+                raise ValueError("Invalid JSON: expected an object key")
+            self._expect(":")
+            if key == self.array_key and self._peek() == "[":
+                self._position += 1
+                self.array_found = True
+                yield from self._array_items()
+            else:
+                self.envelope[key] = self._value()
+            if self._expect(",}") == "}":
+                return
+
+    def _array_items(self):
+        if self._peek() == "]":
+            self._position += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(",]") == "]":
+                return
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                (value, end) = _decoder.raw_decode(self._buffer, self._position)
+                # a value that runs up to the end of the buffer (e.g. a number) might continue in the next chunk
+                if end < len(self._buffer) or self._exhausted:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+            self._read()
+
+    def _peek(self):
+        """
+        Skips whitespace and returns the next character
+        """
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in _whitespace:
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if self._exhausted:
+                raise ValueError("Invalid JSON: unexpected end of document")
+            self._read()
+
+    def _expect(self, characters):
+        character = self._peek()
+        if character not in characters:
+            raise ValueError(f"Invalid JSON: expected one of '{characters}' but found '{character}'")
+        self._position += 1
+        return character
+
+    def _read(self):
+        # drop what we've already parsed so the buffer only ever holds the value we're working on
+        self._buffer = self._buffer[self._position :]
+        self._position = 0
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            self._buffer += self._text_decoder.decode(chunk) if type(chunk) == bytes else chunk
+            return
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        self._exhausted = True
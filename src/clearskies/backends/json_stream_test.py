@@ -0,0 +1,40 @@
+import json
+import unittest
+
+from .json_stream import JsonStream
+
+
+class JsonStreamTest(unittest.TestCase):
+    def chunks(self, document, size):
+        encoded = json.dumps(document).encode("utf-8")
+        return [encoded[start : start + size] for start in range(0, len(encoded), size)]
+
+    def test_items_and_envelope(self):
+        document = {
+            "status": "success",
+            "data": [{"id": 1, "name": "Jane ☃"}, {"id": 22, "tags": ["a", "]"]}, 12345, "}", None],
+            "pagination": {"number_results": 5, "next_page": {"start": 5}},
+        }
+        # tiny chunks split numbers, strings, and multi-byte characters
+        for size in [1, 3, 7, 1000]:
+            stream = JsonStream(self.chunks(document, size))
+            self.assertEqual(document["data"], list(stream.items()))
+            self.assertTrue(stream.array_found)
+            self.assertEqual({"status": "success", "pagination": document["pagination"]}, stream.envelope)
+
+    def test_is_lazy(self):
+        stream = JsonStream(iter(['{"data": [{"id": 1}, ', "not json yet"]))
+        items = stream.items()
+        self.assertEqual({"id": 1}, next(items))
+        with self.assertRaises(ValueError):
+            next(items)
+
+    def test_missing_array(self):
+        stream = JsonStream(['{"data": {"id": 1}}'])
+        self.assertEqual([], list(stream.items()))
+        self.assertFalse(stream.array_found)
+        self.assertEqual({"data": {"id": 1}}, stream.envelope)
+
+        self.assertEqual([], list(JsonStream(["{ }"]).items()))
+        with self.assertRaises(ValueError):
+            list(JsonStream(['{"data": [1, 2'], "data").items())
@@ -0,0 +1,62 @@
+class LikeIndex:
+    """
+    An n-gram inverted index for a text column in a MemoryTable.
+
+    Every value in the column is lower-cased and broken into overlapping n-grams (trigrams by default), and the index
+    maps each n-gram to the set of row indexes that contain it.  A row can only match a search like `%term%` if it
+    contains every n-gram in `term`, so intersecting those sets gives a (hopefully small) list of candidate rows.
+    The index never decides whether a row matches: candidates still go through the normal LIKE check.  As a result,
+    `candidates` must always return a superset of the real matches, which includes rows that the LIKE check treats
+    specially (empty values, which match everything, and non-string values, which can't be indexed).
+    """
+
+    gram_size = None
+    _postings = None
+    _always_check = None
+
+    def __init__(self, gram_size=3):
+        self.gram_size = gram_size
+        self._postings = {}
+        self._always_check = set()
+
+    def grams(self, value):
+        value = value.lower()
+        return {value[index : index + self.gram_size] for index in range(len(value) - self.gram_size + 1)}
+
+    def add(self, row_index, value):
+        if not value or not isinstance(value, str):
+            self._always_check.add(row_index)
+            return
+        for gram in self.grams(value):
+            if gram not in self._postings:
+                self._postings[gram] = set()
+            self._postings[gram].add(row_index)
+
+    def remove(self, row_index, value):
+        if not value or not isinstance(value, str):
+            self._always_check.discard(row_index)
+            return
+        for gram in self.grams(value):
+            if gram not in self._postings:
+                continue
+            self._postings[gram].discard(row_index)
+            if not self._postings[gram]:
+                del self._postings[gram]
+
+    def candidates(self, search):
+        """
+        Returns the set of row indexes that may match the given LIKE search, or None if the index can't help.
+        """
+        if not isinstance(search, str):
+            return None
+        term = search.strip("%")
+        if "%" in term or len(term) < self.gram_size:
+            return None
+        postings = sorted([self._postings.get(gram, set()) for gram in self.grams(term)], key=len)
+        return postings[0].intersection(*postings[1:]) | self._always_check
+
+    def copy(self):
+        copy = LikeIndex(self.gram_size)
+        copy._postings = {gram: set(row_indexes) for (gram, row_indexes) in self._postings.items()}
+        copy._always_check = set(self._always_check)
+        return copy
@@ -0,0 +1,29 @@
+import unittest
+from .like_index import LikeIndex
+
+
+class LikeIndexTest(unittest.TestCase):
+    def test_candidates(self):
+        like_index = LikeIndex()
+        like_index.add(0, "Conor Mancone")
+        like_index.add(1, "Jane Doe")
+        like_index.add(2, "")
+        like_index.add(3, 5)
+        self.assertEqual({0, 2, 3}, like_index.candidates("%ANCON%"))
+        self.assertEqual({1, 2, 3}, like_index.candidates("jane%"))
+        self.assertEqual({2, 3}, like_index.candidates("%xyz%"))
+
+    def test_unusable_searches(self):
+        like_index = LikeIndex()
+        like_index.add(0, "Conor Mancone")
+        self.assertIsNone(like_index.candidates("%co%"))
+        self.assertIsNone(like_index.candidates("%con%one%"))
+
+    def test_remove_and_copy(self):
+        like_index = LikeIndex()
+        like_index.add(0, "Conor Mancone")
+        like_index.add(1, "Ronoc Mancone")
+        copy = like_index.copy()
+        like_index.remove(0, "Conor Mancone")
+        self.assertEqual({1}, like_index.candidates("%mancone%"))
+        self.assertEqual({0, 1}, copy.candidates("%mancone%"))
@@ -1,7 +1,11 @@
 from .backend import Backend
+from .like_index import LikeIndex
+from .memory_snapshot import MemorySnapshot
 from collections import OrderedDict
 from functools import cmp_to_key
 import inspect
+import re
+import threading
 from typing import Any, Callable, Dict, List, Tuple
 from ..autodoc.schema import Integer as AutoDocInteger
 from .. import model
@@ -58,6 +62,69 @@ def like_check(column, values, null):
         return value == search
     return matches
 
+def _split_selects(selects):
+    """
+    Splits a list of select strings (which may themselves contain multiple comma-separated selects) into a flat list
+    """
+    parts = []
+    for select in selects:
+        depth = 0
+        current = ""
+        for character in select:
+            if character == "(":
+                depth += 1
+            elif character == ")":
+                depth -= 1
+            if character == "," and not depth:
+                parts.append(current.strip())
+                current = ""
+                continue
+            current += character
+        if current.strip():
+            parts.append(current.strip())
+    return parts
+
+
+_aggregate_pattern = re.compile(
+    r"^(COUNT|SUM|MIN|MAX|AVG)\s*\(\s*(DISTINCT\s+)?([^)]+?)\s*\)(?:\s+AS\s+(\S+))?$", re.IGNORECASE
+)
+
+
+def _parse_aggregate(select):
+    """
+    Parses a select like `SUM(orders.total) AS total` and returns None if it isn't an aggregate we understand
+    """
+    match = _aggregate_pattern.match(select.strip())
+    if not match:
+        return None
+    [function, distinct, column, alias] = match.groups()
+    column = column.replace("`", "")
+    return {
+        "function": function.upper(),
+        "distinct": bool(distinct),
+        "table": column.split(".", 1)[0] if "." in column else "",
+        "column": column.split(".", 1)[1] if "." in column else column,
+        "alias": alias.replace("`", "") if alias else select.strip(),
+    }
+
+
+def _aggregate(function, values):
+    if function == "COUNT":
+        return len(values)
+    if not values:
+        return None
+    if function == "MIN":
+        return min(values)
+    if function == "MAX":
+        return max(values)
+    numbers = [gentle_float_conversion(value) for value in values]
+    numbers = [number if type(number) in [int, float] else 0 for number in numbers]
+    if all(type(value) == int for value in values):
+        numbers = values
+    total = sum(numbers)
+    return total if function == "SUM" else total / len(numbers)
+
+
 class MemoryTable:
     _table_name = None
     _column_names = None
@@ -66,6 +133,8 @@ class MemoryTable:
     _id_index = None
     id_column_name = None
     _next_id = None
+    _shared = False
+    _like_indexes = None
 
     # here be dragons.  This is not a 100% drop-in replacement for the equivalent SQL operators
     # https://codereview.stackexchange.com/questions/259198/in-memory-table-filtering-in-python
@@ -96,12 +165,41 @@ class MemoryTable:
         self._id_index = {}
         self.id_column_name = model.id_column_name
         self._next_id = 1
+        self._like_indexes = {}
 
         self._table_name = model.table_name()
         self._column_names.extend(model.columns_configuration().keys())
         if self.id_column_name not in self._column_names:
             self._column_names.append(self.id_column_name)
 
+    def fork(self):
+        """
+        Returns a copy-on-write copy of the table.
+
+        The new table shares its data with this one until either of them is modified, at which point the
+        table being modified makes its own copy.  Rows are never modified in place (updates replace the
+        row dictionary) so only the containers need to be copied, not the rows themselves.
+        """
+        self._shared = True
+        fork = self.__class__.__new__(self.__class__)
+        fork.__dict__.update(self.__dict__)
+        return fork
+
+    def _unshare(self):
+        """
+        Makes sure this table has its own copy of any data it shares with a fork, before we modify it.
+        """
+        if not self._shared:
+            return
+        self._rows = [*self._rows]
+        self._id_index = {**self._id_index}
+        self._like_indexes = {column_name: index.copy() for (column_name, index) in self._like_indexes.items()}
+        self._shared = False
+
+    def __getstate__(self):
+        # a table that has been unpickled never shares data with anyone else
+        return {**self.__dict__, "_shared": False}
+
     def update(self, id, data):
         if id not in self._id_index:
             raise ValueError(f"Attempt to update non-existent record with '{self.id_column_name}' of '{id}'")
@@ -116,10 +214,13 @@ class MemoryTable:
                 raise ValueError(
                     f"Cannot update record: column '{column_name}' does not exist in table '{self._table_name}'"
                 )
+        self._unshare()
+        self._unindex_row(index, row)
         self._rows[index] = {
             **self._rows[index],
             **data,
         }
+        self._index_row(index, self._rows[index])
         return self._rows[index]
 
     def create(self, data):
@@ -128,42 +229,138 @@ class MemoryTable:
                 raise ValueError(
                     f"Cannot create record: column '{column_name}' does not exist in table '{self._table_name}'"
                 )
+        self._unshare()
         incoming_id = data.get(self.id_column_name)
         if not incoming_id:
             incoming_id = self._next_id
             data[self.id_column_name] = incoming_id
             self._next_id += 1
         try:
-            incoming_as_int = int(incoming_as_int)
+            incoming_as_int = int(incoming_id)
             if incoming_as_int >= self._next_id:
                 self._next_id = incoming_as_int + 1
-        except:
+        except (TypeError, ValueError):
             pass
-        if incoming_id in self._id_index and self._rows[self._id_index[data[self.id_column_name]]] is not None:
+        if incoming_id in self._id_index and self._row_exists(self._id_index[data[self.id_column_name]]):
             return self.update(data[self.id_column_name], data)
         for column_name in self._column_names:
             if column_name not in data:
                 data[column_name] = None
-        self._rows.append({**data})
-        self._id_index[data[self.id_column_name]] = len(self._rows) - 1
+        index = self._append(data)
+        self._id_index[data[self.id_column_name]] = index
+        self._index_row(index, data)
         return data
 
+    def _append(self, data):
+        """
+        Stores a new row and returns its index
+        """
+        self._rows.append({**data})
+        return len(self._rows) - 1
+
+    def _row_exists(self, index):
+        return self._rows[index] is not None
+
+    def seal(self):
+        """
+        Called before a new version of the table is published to readers in thread-safe mode.
+
+        After this, the table must be safe to read from multiple threads at once without any changes to its data.
+        """
+        pass
+
+    def load(self, rows, id_index):
+        """
+        Replaces the contents of the table in one go.
+
+        `rows` is a list of dictionaries and `id_index` maps the id of each record to its position in `rows`.
+        This is used by backends (e.g. the FileBackend) which load their data in bulk rather than
+        record-by-record.
+        """
+        self._id_index = id_index
+        self._rows = rows
+        self._shared = False
+        self._advance_next_id()
+        for column_name, like_index in self._like_indexes.items():
+            self._like_indexes[column_name] = self._build_like_index(column_name, like_index.gram_size)
+
+    def _advance_next_id(self):
+        """
+        Makes sure that newly created records get an id past any numeric ids already in the table
+        """
+        for id in self._id_index.keys():
+            try:
+                id_as_int = int(id)
+            except (TypeError, ValueError):
+                continue
+            if id_as_int >= self._next_id:
+                self._next_id = id_as_int + 1
+
+    def all_rows(self):
+        return self._rows
+
     def delete(self, id):
         if id not in self._id_index:
             return True
         index = self._id_index[id]
         if self._rows[index] is None:
             return True
+        self._unshare()
+        self._unindex_row(index, self._rows[index])
         # we set the row to None because if we remove it we'll change the indexes of the rest
         # of the rows, and I like being able to calculate the index from the id
         self._rows[index] = None
         return True
 
+    def add_like_index(self, column_name, gram_size=3):
+        """
+        Adds an n-gram index on the given column, which is used to speed up LIKE conditions.
+
+        See the LikeIndex class for details.
+        """
+        if column_name not in self._column_names:
+            raise ValueError(
+                f"Cannot add LIKE index: column '{column_name}' does not exist in table '{self._table_name}'"
+            )
+        self._unshare()
+        self._like_indexes[column_name] = self._build_like_index(column_name, gram_size)
+
+    def _build_like_index(self, column_name, gram_size):
+        like_index = LikeIndex(gram_size)
+        for index, row in enumerate(self._rows):
+            if row is not None:
+                like_index.add(index, row.get(column_name))
+        return like_index
+
+    def _index_row(self, index, row):
+        for column_name, like_index in self._like_indexes.items():
+            like_index.add(index, row.get(column_name))
+
+    def _unindex_row(self, index, row):
+        for column_name, like_index in self._like_indexes.items():
+            like_index.remove(index, row.get(column_name))
+
+    def _candidate_rows(self, wheres):
+        """
+        Returns the rows that might match the given conditions, using any LIKE indexes to narrow things down
+        """
+        candidates = None
+        for where in wheres:
+            if where["operator"].lower() != "like" or where["column"] not in self._like_indexes:
+                continue
+            matches = self._like_indexes[where["column"]].candidates(where["values"][0])
+            if matches is None:
+                continue
+            candidates = matches if candidates is None else candidates & matches
+        if candidates is None:
+            return list(filter(None, self._rows))
+        return [self._rows[index] for index in sorted(candidates) if self._rows[index] is not None]
+
     def count(self, configuration, wheres):
         return len(self.rows(configuration, wheres, filter_only=True))
 
     def rows(self, configuration, wheres, filter_only=False, next_page_data=None):
-        rows = list(filter(None, self._rows))
+        rows = self._candidate_rows(wheres)
         for where in wheres:
             rows = filter(self._where_as_filter(where), rows)
         rows = list(rows)
@@ -172,20 +369,26 @@ class MemoryTable:
         if "sorts" in configuration and configuration["sorts"]:
             rows = sorted(rows, key=cmp_to_key(lambda row_a, row_b: _sort(row_a, row_b, configuration["sorts"])))
         if "limit" in configuration or ("pagination" in configuration and configuration["pagination"].get("start")):
-            number_rows = len(rows)
-            start = int(configuration.get("pagination", {}).get("start", 0))
-            if not start:
-                start = 0
-            if int(start) >= number_rows:
-                start = number_rows - 1
-            end = len(rows)
-            if configuration.get("limit") and configuration.get("limit") > 0 and start + int(configuration["limit"]) <= number_rows:
-                end = start + int(configuration["limit"])
-            if end < number_rows and type(next_page_data) == dict:
-                next_page_data["start"] = start + configuration["limit"]
+            [start, end] = self._page_bounds(configuration, len(rows), next_page_data)
             rows = rows[start:end]
         return rows
 
+    def _page_bounds(self, configuration, number_rows, next_page_data=None):
+        """
+        Returns the start/end indexes of the requested page and populates next_page_data as needed
+        """
+        start = int(configuration.get("pagination", {}).get("start", 0))
+        if not start:
+            start = 0
+        if int(start) >= number_rows:
+            start = number_rows - 1
+        end = number_rows
+        if configuration.get("limit") and configuration.get("limit") > 0 and start + int(configuration["limit"]) <= number_rows:
+            end = start + int(configuration["limit"])
+        if end < number_rows and type(next_page_data) == dict:
+            next_page_data["start"] = start + configuration["limit"]
+        return [start, end]
+
     def _where_as_filter(self, where):
         column = where["column"]
         values = where["values"]
@@ -195,12 +398,17 @@ class MemoryTable:
 class MemoryBackend(Backend):
     _tables = None
     _silent_on_missing_tables = False
+    _columnar = False
+    _thread_safe = False
+    _write_lock = None
+    _like_indexes = None
 
     _allowed_configs = [
         "table_name",
         "wheres",
         "joins",
         "sorts",
+        "group_by_column",
         "pagination",
         "length",
         "selects",
@@ -215,12 +423,42 @@ class MemoryBackend(Backend):
     def __init__(self):
         self._tables = {}
         self._silent_on_missing_tables = True
+        self._write_lock = threading.RLock()
+        self._like_indexes = {}
 
     def silent_on_missing_tables(self, silent=True):
         self._silent_on_missing_tables = silent
 
-    def configure(self):
-        pass
+    def configure(self, columnar=False, thread_safe=False, like_indexes=None):
+        self._columnar = columnar
+        self._thread_safe = thread_safe
+        self._like_indexes = like_indexes if like_indexes else {}
+
+    def thread_safe(self, thread_safe=True):
+        """
+        Switches the backend to copy-on-write table versions so it can be shared between threads.
+
+        Normally tables are modified in place, which means that a thread reading from a table can see half-applied
+        changes (or crash outright) if another thread writes to it at the same time.  In thread-safe mode, readers
+        always work with an immutable version of the table and never need a lock.  Writers take a lock, apply their
+        change to a copy-on-write fork of the latest version, and then publish the fork as the new version in one
+        atomic step.
+
+        The trade-off is that every write has to copy the table's containers (although not the rows themselves),
+        so this is meant for read-mostly use cases, e.g. using the MemoryBackend as a cache in a threaded server.
+        """
+        self._thread_safe = thread_safe
+
+    def columnar(self, columnar=True):
+        """
+        Switches the backend to columnar storage for any tables created after this call.
+
+        Columnar tables store each column in a NumPy array (with a null mask) rather than storing each
+        row as a dictionary.  Filtering, sorting, and counting are then vectorized, and rows are only
+        turned back into dictionaries for the page of results that is actually returned.  This is meant
+        for analytics-style use cases with large datasets and requires NumPy to be installed.
+        """
+        self._columnar = columnar
 
     def create_table(self, model):
         """
@@ -229,19 +467,101 @@ class MemoryBackend(Backend):
         model = self.cheez_model(model)
         if model.table_name() in self._tables:
             return
-        self._tables[model.table_name()] = MemoryTable(model)
+        with self._write_lock:
+            if model.table_name() in self._tables:
+                return
+            self._tables[model.table_name()] = self.new_table(model)
+
+    def new_table(self, model):
+        """
+        Builds an empty table for the given model, using columnar storage if it has been enabled
+        """
+        if self._columnar:
+            from .columnar_memory_table import ColumnarMemoryTable
+
+            table = ColumnarMemoryTable(model)
+        else:
+            table = MemoryTable(model)
+        for column_name in self._like_indexes.get(model.table_name(), []):
+            table.add_like_index(column_name)
+        return table
+
+    def add_like_index(self, model, column_names, gram_size=3):
+        """
+        Adds n-gram indexes to speed up LIKE conditions (e.g. from search endpoints) on the given columns.
+
+        Accepts either a model or a model class.  Indexes can also be configured ahead of time (which is handy for
+        the FileBackend, where tables are created on demand) via the `like_indexes` configuration, which is a
+        dictionary with table names as keys and a list of column names as values.
+        """
+        if type(column_names) == str:
+            column_names = [column_names]
+
+        def add_indexes(table):
+            for column_name in column_names:
+                table.add_like_index(column_name, gram_size=gram_size)
+
+        self._write(self.cheez_model(model), add_indexes)
+
+    def snapshot(self):
+        """
+        Returns a MemorySnapshot with the current state of all tables in the backend.
+
+        Taking a snapshot is cheap: the tables are forked copy-on-write, so nothing is copied until either
+        the backend or a restored copy of the snapshot is modified.
+        """
+        return MemorySnapshot(self._tables)
+
+    def restore(self, snapshot):
+        """
+        Replaces all tables in the backend with (copy-on-write) copies of the tables in the given snapshot.
+
+        The snapshot itself is never modified, so it can be restored any number of times.  This makes it easy to
+        build a fixture once and then start every test from the same pristine data.
+        """
+        self._tables = snapshot.fork()
+
+    def save_snapshot(self, file_name):
+        """
+        Saves the current state of all tables in the backend to the given file
+        """
+        self.snapshot().save(file_name)
+
+    def load_snapshot(self, file_name):
+        """
+        Replaces all tables in the backend with the ones stored in the given file (see `save_snapshot`).
+
+        Note that snapshot files are pickled, so only load files that you created yourself.
+        """
+        self.restore(MemorySnapshot.load(file_name))
 
     def update(self, id, data, model):
-        self.create_table(model)
-        return self._tables[model.table_name()].update(id, data)
+        return self._write(model, lambda table: table.update(id, data))
 
     def create(self, data, model):
-        self.create_table(model)
-        return self._tables[model.table_name()].create(data)
+        return self._write(model, lambda table: table.create(data))
 
     def delete(self, id, model):
+        return self._write(model, lambda table: table.delete(id))
+
+    def _write(self, model, change):
+        """
+        Applies a change to the table for the given model and returns the result.
+
+        In thread-safe mode the change is applied to a fork of the current version of the table, and the fork
+        is then published as the new version (see `thread_safe`).
+        """
         self.create_table(model)
-        return self._tables[model.table_name()].delete(id)
+        table_name = model.table_name()
+        if not self._thread_safe:
+            return change(self._tables[table_name])
+
+        with self._write_lock:
+            table = self._tables[table_name].fork()
+            result = change(table)
+            table.seal()
+            self._tables[table_name] = table
+        return result
 
     def count(self, configuration, model):
         if configuration["table_name"] not in self._tables:
@@ -252,6 +572,10 @@ class MemoryBackend(Backend):
                 f"Attempt to count records in non-existent table '{configuration['table_name']} via MemoryBackend"
             )
 
+        # left joins still count when grouping, since the group by column may come from one of them
+        if configuration.get("group_by_column"):
+            return len(self.group_rows(self.rows_for_grouping(configuration), configuration))
+
         # this is easy if we have no joins, so just return early so I don't have to think about it
         if "joins" not in configuration or not configuration["joins"]:
             wheres = configuration["wheres"] if "wheres" in configuration else []
@@ -273,15 +597,19 @@ class MemoryBackend(Backend):
             )
 
         # this is easy if we have no joins, so just return early so I don't have to think about it
-        if "joins" not in configuration or not configuration["joins"]:
+        has_joins = "joins" in configuration and configuration["joins"]
+        if not has_joins and not configuration.get("group_by_column"):
             wheres = configuration["wheres"] if "wheres" in configuration else []
             return self._tables[table_name].rows(configuration, wheres, next_page_data=next_page_data)
 
-        rows = self.rows_with_joins(configuration)
+        if configuration.get("group_by_column"):
+            rows = self.group_rows(self.rows_for_grouping(configuration), configuration)
+        else:
+            rows = self.rows_with_joins(configuration)
 
-        # currently we don't do much with selects, so just limit results down to the data from the original
-        # table.
-        rows = [row[table_name] for row in rows]
+            # currently we don't do much with selects, so just limit results down to the data from the original
+            # table.
+            rows = [{**row[table_name]} for row in rows]
 
         if "sorts" in configuration and configuration["sorts"]:
             rows = sorted(rows, key=cmp_to_key(lambda row_a, row_b: _sort(row_a, row_b, configuration["sorts"])))
@@ -298,8 +626,67 @@ class MemoryBackend(Backend):
                 next_page_data["start"] = start + configuration["limit"]
         return rows
 
+    def rows_for_grouping(self, configuration):
+        """
+        Returns the matching rows in the format used for joins (see `join_rows`), even if there are no joins
+        """
+        if configuration.get("joins"):
+            return self.rows_with_joins(configuration)
+
+        table_name = configuration["table_name"]
+        wheres = configuration["wheres"] if "wheres" in configuration else []
+        return [{table_name: row} for row in self._tables[table_name].rows(configuration, wheres, filter_only=True)]
+
+    def group_rows(self, rows, configuration):
+        """
+        Groups rows by the group_by_column and calculates any aggregate selects (COUNT, SUM, MIN, MAX, AVG).
+
+        `rows` should be in the format used for joins (see `join_rows`).  Like MySQL, each group returns the data
+        from the first row in the group for the main table, along with a column for each aggregate select.  Aggregate
+        columns are named after their alias (e.g. `COUNT(*) AS count` becomes `count`) or, if there is no alias,
+        the select itself.  Non-aggregate selects are ignored, just like they are without a GROUP BY.
+        """
+        table_name = configuration["table_name"]
+        group_by = configuration["group_by_column"].replace("`", "")
+        group_table = group_by.split(".", 1)[0] if "." in group_by else table_name
+        group_column = group_by.split(".", 1)[1] if "." in group_by else group_by
+        aggregates = list(filter(None, map(_parse_aggregate, _split_selects(configuration.get("selects") or []))))
+
+        groups = {}
+        for row in rows:
+            group_row = row.get(group_table)
+            key = group_row.get(group_column) if group_row else None
+            if key not in groups:
+                groups[key] = []
+            groups[key].append(row)
+
+        grouped_rows = []
+        for group in groups.values():
+            grouped_row = {**group[0][table_name]} if group[0].get(table_name) else {}
+            for aggregate in aggregates:
+                grouped_row[aggregate["alias"]] = self._aggregate_group(group, aggregate, table_name)
+            grouped_rows.append(grouped_row)
+        return grouped_rows
+
+    def _aggregate_group(self, rows, aggregate, default_table_name):
+        if aggregate["column"] == "*":
+            return _aggregate(aggregate["function"], rows)
+
+        table_name = aggregate["table"] if aggregate["table"] else default_table_name
+        values = []
+        for row in rows:
+            table_row = row.get(table_name)
+            value = table_row.get(aggregate["column"]) if table_row else None
+            if value is None:
+                continue
+            if aggregate["distinct"] and value in values:
+                continue
+            values.append(value)
+        return _aggregate(aggregate["function"], values)
+
     def rows_with_joins(self, configuration):
-        joins = configuration["joins"]
+        # joins are removed from this list as they are applied, so don't change the caller's configuration
+        joins = [*configuration["joins"]]
         wheres = configuration["wheres"] if "wheres" in configuration else []
         # quick sanity check
         for join in configuration["joins"]:
@@ -363,7 +750,7 @@ class MemoryBackend(Backend):
                 return []
 
             raise ValueError(f"Cannot return rows for unknown table '{table_name}'")
-        return self._tables[table_name]._rows
+        return self._tables[table_name].all_rows()
 
     def _check_query_configuration(self, configuration):
         for key in configuration.keys():
@@ -1,3 +1,6 @@
+import os
+import tempfile
+import threading
 import unittest
 from .memory_backend import MemoryBackend
 from types import SimpleNamespace
@@ -303,3 +306,215 @@ class MemoryBackendTest(unittest.TestCase):
             ],
             results,
         )
+
+    def test_snapshot_and_restore(self):
+        self.memory_backend.create({"id": "1-2-3-4", "name": "Conor", "email": "cmancone@example.com"}, self.user_model)
+        snapshot = self.memory_backend.snapshot()
+
+        self.memory_backend.update("1-2-3-4", {"name": "Ronoc"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-5", "name": "Jane", "email": "jane@example.com"}, self.user_model)
+        self.assertEqual(2, self.memory_backend.count({"table_name": "users"}, self.user_model))
+
+        self.memory_backend.restore(snapshot)
+        self.assertEqual(
+            [{"id": "1-2-3-4", "name": "Conor", "email": "cmancone@example.com"}],
+            self.memory_backend.records({"table_name": "users"}, self.user_model),
+        )
+
+        # changes after a restore don't leak back into the snapshot
+        self.memory_backend.delete("1-2-3-4", self.user_model)
+        other_backend = MemoryBackend()
+        other_backend.restore(snapshot)
+        self.assertEqual(0, self.memory_backend.count({"table_name": "users"}, self.user_model))
+        self.assertEqual(1, other_backend.count({"table_name": "users"}, self.user_model))
+
+    def test_snapshot_file(self):
+        self.memory_backend.create({"name": "Conor", "email": "cmancone@example.com"}, self.user_model)
+        self.memory_backend.create({"review": "cool"}, self.reviews_model)
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "snapshot.pickle")
+            self.memory_backend.save_snapshot(file_name)
+            other_backend = MemoryBackend()
+            other_backend.load_snapshot(file_name)
+
+        self.assertEqual(
+            [{"id": 1, "name": "Conor", "email": "cmancone@example.com"}],
+            other_backend.records({"table_name": "users"}, self.user_model),
+        )
+        self.assertEqual(
+            {"id": 2, "name": "Ronoc", "email": None}, other_backend.create({"name": "Ronoc"}, self.user_model)
+        )
+        self.assertEqual(
+            [{"id": 1, "review": "cool", "email": None}],
+            other_backend.records({"table_name": "reviews"}, self.reviews_model),
+        )
+
+    def test_group_by(self):
+        self.memory_backend.create({"id": "1-2-3-4", "name": "Zeb", "email": "a@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-5", "name": "Zeb", "email": "b@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-6", "name": "A", "email": "c@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-7", "name": "B", "email": None}, self.user_model)
+        configuration = {
+            "table_name": "users",
+            "wheres": [{"column": "id", "operator": "!=", "values": ["1-2-3-7"]}],
+            "group_by_column": "name",
+            "selects": ["COUNT(*) AS count, MAX(users.email) AS last_email", "COUNT(DISTINCT `name`) AS names"],
+            "sorts": [{"column": "count", "direction": "DESC"}],
+        }
+        self.assertEqual(
+            [
+                {
+                    "id": "1-2-3-4",
+                    "name": "Zeb",
+                    "email": "a@example.com",
+                    "count": 2,
+                    "last_email": "b@example.com",
+                    "names": 1,
+                },
+                {
+                    "id": "1-2-3-6",
+                    "name": "A",
+                    "email": "c@example.com",
+                    "count": 1,
+                    "last_email": "c@example.com",
+                    "names": 1,
+                },
+            ],
+            self.memory_backend.records({**configuration}, self.user_model),
+        )
+        self.assertEqual(2, self.memory_backend.count({**configuration}, self.user_model))
+
+    def test_group_by_with_join(self):
+        self.memory_backend.create({"id": "1-2-3-4", "name": "Zeb", "email": "a@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-5", "name": "Jane", "email": "b@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-6", "name": "Bob", "email": "c@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1", "review": "5", "email": "a@example.com"}, self.reviews_model)
+        self.memory_backend.create({"id": "2", "review": "5", "email": "b@example.com"}, self.reviews_model)
+        self.memory_backend.create({"id": "3", "review": "3", "email": "c@example.com"}, self.reviews_model)
+        records = self.memory_backend.records(
+            {
+                "table_name": "users",
+                "wheres": [],
+                "joins": [
+                    {
+                        "alias": "",
+                        "type": "INNER",
+                        "table": "reviews",
+                        "left_table": "users",
+                        "left_column": "email",
+                        "right_table": "reviews",
+                        "right_column": "email",
+                        "raw": "JOIN reviews ON reviews.email=users.email",
+                    },
+                ],
+                "group_by_column": "reviews.review",
+                "selects": ["COUNT(*) AS count", "SUM(reviews.review)"],
+                "sorts": [{"column": "count", "direction": "ASC"}],
+            },
+            self.user_model,
+        )
+        self.assertEqual(
+            [
+                {"id": "1-2-3-6", "name": "Bob", "email": "c@example.com", "count": 1, "SUM(reviews.review)": 3.0},
+                {"id": "1-2-3-4", "name": "Zeb", "email": "a@example.com", "count": 2, "SUM(reviews.review)": 10.0},
+            ],
+            records,
+        )
+
+    def test_group_by_with_left_join(self):
+        self.memory_backend.create({"id": "1-2-3-4", "name": "Zeb", "email": "a@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-5", "name": "Jane", "email": "b@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-6", "name": "Bob", "email": "c@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "1", "review": "5", "email": "a@example.com"}, self.reviews_model)
+        self.memory_backend.create({"id": "2", "review": "5", "email": "b@example.com"}, self.reviews_model)
+        configuration = {
+            "table_name": "users",
+            "wheres": [],
+            "joins": [
+                {
+                    "alias": "",
+                    "type": "LEFT",
+                    "table": "reviews",
+                    "left_table": "users",
+                    "left_column": "email",
+                    "right_table": "reviews",
+                    "right_column": "email",
+                    "raw": "LEFT JOIN reviews ON reviews.email=users.email",
+                },
+            ],
+            "group_by_column": "reviews.review",
+        }
+        # Bob has no reviews, so he gets a group of his own
+        self.assertEqual(2, len(self.memory_backend.records({**configuration}, self.user_model)))
+        self.assertEqual(2, self.memory_backend.count({**configuration}, self.user_model))
+
+    def test_thread_safe_versions(self):
+        self.memory_backend.thread_safe()
+        self.memory_backend.create({"id": "1-2-3-4", "name": "Conor", "email": "cmancone@example.com"}, self.user_model)
+
+        # a reader holding on to a version of the table doesn't see later writes
+        version = self.memory_backend._tables["users"]
+        self.memory_backend.update("1-2-3-4", {"name": "Ronoc"}, self.user_model)
+        self.memory_backend.create({"id": "1-2-3-5", "name": "Jane", "email": "jane@example.com"}, self.user_model)
+        self.assertEqual([{"id": "1-2-3-4", "name": "Conor", "email": "cmancone@example.com"}], version.rows({}, []))
+        self.assertEqual(2, self.memory_backend.count({"table_name": "users"}, self.user_model))
+        self.assertEqual(
+            "Ronoc",
+            self.memory_backend.records(
+                {"table_name": "users", "wheres": [{"column": "id", "operator": "=", "values": ["1-2-3-4"]}]},
+                self.user_model,
+            )[0]["name"],
+        )
+
+    def test_thread_safe_concurrent_writes(self):
+        self.memory_backend.thread_safe()
+        errors = []
+
+        def write(prefix):
+            try:
+                for index in range(50):
+                    self.memory_backend.create({"name": f"{prefix}-{index}"}, self.user_model)
+                    self.memory_backend.records(
+                        {"table_name": "users", "sorts": [{"column": "name", "direction": "ASC"}]}, self.user_model
+                    )
+            except Exception as exception:
+                errors.append(exception)
+
+        threads = [threading.Thread(target=write, args=(prefix,)) for prefix in ["a", "b", "c", "d"]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(200, self.memory_backend.count({"table_name": "users"}, self.user_model))
+
+    def test_like_index(self):
+        self.memory_backend.create(
+            {"id": "1", "name": "Conor Mancone", "email": "cmancone@example.com"}, self.user_model
+        )
+        self.memory_backend.create({"id": "2", "name": "Jane Doe", "email": "jane@example.com"}, self.user_model)
+        self.memory_backend.create({"id": "3", "name": None, "email": "nobody@example.com"}, self.user_model)
+        self.memory_backend.add_like_index(self.user_model, ["name"])
+        self.memory_backend.create(
+            {"id": "4", "name": "Ronoc Mancone", "email": "rmancone@example.com"}, self.user_model
+        )
+
+        def search(term):
+            return [
+                record["id"]
+                for record in self.memory_backend.records(
+                    {"table_name": "users", "wheres": [{"column": "name", "operator": "like", "values": [term]}]},
+                    self.user_model,
+                )
+            ]
+
+        # empty values match any search, just like without the index
+        self.assertEqual(["1", "3", "4"], search("%MANCONE%"))
+        self.assertEqual(["2", "3"], search("%doe%"))
+        self.assertEqual(["1", "2", "3", "4"], search("%n%"))
+
+        self.memory_backend.update("2", {"name": "Jane Mancone"}, self.user_model)
+        self.memory_backend.delete("1", self.user_model)
+        self.assertEqual(["2", "3", "4"], search("%mancone%"))
+        self.assertEqual(["3"], search("%doe%"))
@@ -0,0 +1,39 @@
+import pickle
+
+
+class MemorySnapshot:
+    """
+    A point-in-time copy of the tables in a MemoryBackend.
+
+    Snapshots are created via `MemoryBackend.snapshot()` and restored via `MemoryBackend.restore()`.  The tables in
+    a snapshot are copy-on-write forks, so taking and restoring a snapshot doesn't copy any data until a table is
+    actually modified.  Everything is included: rows, the id index, the next auto-generated id, and any
+    secondary indexes held by the tables.
+
+    Snapshots can also be saved to a file, which stores all the tables in one compact (pickled) binary file that
+    is loaded back in one shot.  This is much faster than rebuilding tables record-by-record at startup, but
+    keep in mind that pickled files should only be loaded if you created them yourself.
+    """
+
+    _tables = None
+
+    def __init__(self, tables):
+        self._tables = {table_name: table.fork() for (table_name, table) in tables.items()}
+
+    def fork(self):
+        """
+        Returns a dictionary with copy-on-write copies of all the tables in the snapshot
+        """
+        return {table_name: table.fork() for (table_name, table) in self._tables.items()}
+
+    def table_names(self):
+        return list(self._tables.keys())
+
+    def save(self, file_name):
+        with open(file_name, "wb") as fp:
+            pickle.dump(self._tables, fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, file_name):
+        with open(file_name, "rb") as fp:
+            return cls(pickle.load(fp))
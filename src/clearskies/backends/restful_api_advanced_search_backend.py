@@ -25,11 +25,9 @@ class RestfulApiAdvancedSearchBackend(ApiBackend):
         "joins",
     ]
 
-    def __init__(self, requests):
-        self._requests = requests
-
-    def configure(self, auth=None):
+    def configure(self, auth=None, cache=None):
         self._auth = auth
+        self._cache = cache
 
     def records_url(self, configuration: Dict[str, Any]) -> str:
         return configuration["table_name"].rstrip("/") + "/search"
@@ -61,16 +59,11 @@ class RestfulApiAdvancedSearchBackend(ApiBackend):
         json_data["count_only"] = True
         return [url, method, json_data, headers]
 
-    def records(self, configuration, model, next_page_data={}):
-        configuration = self._check_query_configuration(configuration)
-        [url, method, json_data, headers] = self._build_records_request(configuration)
-        response = self._execute_request(url, method, json=json_data, headers=headers).json()
-        records = self._map_records_response(response)
+    def _populate_next_page_data(self, configuration, response_json, number_records, next_page_data):
         for next_page_key in ["nextPage", "NextPage", "next_page"]:
-            if response.get("pagination", {}).get(next_page_key):
-                for key, value in response["pagination"][next_page_key].items():
+            if response_json.get("pagination", {}).get(next_page_key):
+                for key, value in response_json["pagination"][next_page_key].items():
                     next_page_data[key] = value
-        return records
 
     def _as_post_data(self, configuration):
         data = {
@@ -87,10 +80,14 @@ class RestfulApiAdvancedSearchBackend(ApiBackend):
         prefix = ""
         if where.get("table"):
             prefix = where["table"] + "."
+        if where["operator"].lower() == "in":
+            value = [self.normalize_outgoing_value(where, columns, value) for value in where["values"]]
+        else:
+            value = self.normalize_outgoing_value(where, columns, where["values"][0])
         return {
             "column": prefix + where["column"],
             "operator": where["operator"],
-            "value": self.normalize_outgoing_value(where, columns, where["values"][0]),
+            "value": value,
         }
 
     def normalize_outgoing_value(self, where, columns, value):
@@ -158,6 +158,13 @@ class BelongsTo(String):
         select_parts.append(f"{alias}.{parent_id_column_name} AS {alias}_{parent_id_column_name}")
         return models.select(", ".join(select_parts))
 
+    def prefetch(self, models):
+        # parents are only loaded when we return their columns, and we can't batch lookups with extra conditions
+        if not self.config("readable_parent_columns", silent=True) or self.config("where"):
+            return
+        parent_models = self.parent_models
+        parent_models.prefetch(parent_models.get_id_column_name(), [model.data.get(self.name) for model in models])
+
     @property
     def parent_models(self):
         parents = self.di.build(self.config("parent_models_class"), cache=True)
@@ -176,6 +183,9 @@ class BelongsTo(String):
     def parent_columns(self):
         return self.parent_models.model_columns
 
+    def related_models_classes(self):
+        return [self.config("parent_models_class")]
+
     def to_json(self, model):
         # if we don't have readable parent columns specified, then just return the id
         if not self.config("readable_parent_columns", silent=True):
@@ -76,3 +76,13 @@ class BelongsToTest(unittest.TestCase):
         user = self.belongs_to.provide({"user_id": "2"}, "user_id")
         self.assertEqual("2", user.id)
         self.assertEqual("hey", user.name)
+
+    def test_prefetch(self):
+        self.belongs_to.configure(
+            "user_id", {"parent_models_class": TestModel, "readable_parent_columns": ["name"]}, BelongsToTest
+        )
+        backend = self.belongs_to.parent_models._backend
+        backend.prefetch = MagicMock()
+        self.belongs_to.prefetch([self.models.model({"user_id": "2"}), self.models.model({"user_id": "5"})])
+        backend.prefetch.assert_called_once()
+        self.assertEqual(("id", ["2", "5"]), backend.prefetch.call_args[0][1:])
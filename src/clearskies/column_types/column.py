@@ -196,6 +196,18 @@ class Column(ABC):
         """
         return {self.name: model.get(self.name, silent=True)}
 
+    def json_converter(self):
+        """
+        Returns a function that converts the value of the column into its JSON representation, or None.
+
+        This lets handlers serialize rows without calling `to_json` for every column of every record.  It should only
+        return a function if `to_json` is equivalent to `{self.name: converter(model.get(self.name, silent=True))}`.
+        Columns that override `to_json` (or that need more than their own value) fall back on `to_json`.
+        """
+        if type(self).to_json is not Column.to_json:
+            return None
+        return lambda value: value
+
     def input_errors(self, model, data):
         error = self.check_input(model, data)
         if error:
@@ -339,6 +351,30 @@ class Column(ABC):
     def configure_n_plus_one(self, models):
         return models
 
+    def backend_column_names(self):
+        """
+        Returns the names of the backend columns that have to be loaded to read this column.
+
+        This is used when a query only selects some columns (see Models.select_columns).  The id column is always
+        loaded, so columns that only need the id (e.g. relationships to child records) return an empty list.
+        """
+        return [] if self.is_temporary else [self.name]
+
+    def related_models_classes(self):
+        """
+        Returns the models classes that this column reads data from (other than its own).
+
+        Cached responses that include this column are thrown away when records from any of these are saved (see
+        the `cache_ttl` option of the handlers).
+        """
+        return []
+
+    def prefetch(self, models):
+        """
+        Called with a page of models before they are rendered, so related records can be fetched all at once
+        """
+        pass
+
     def check_search_value(self, value, operator=None, relationship_reference=None):
         return self.input_error_for_value(value, operator=operator)
 
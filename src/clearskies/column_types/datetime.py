@@ -47,6 +47,11 @@ class DateTime(Column):
         datetime = model.get(self.name, silent=True)
         return {self.name: datetime.isoformat() if datetime else None}
 
+    def json_converter(self):
+        if type(self).to_json is not DateTime.to_json:
+            return None
+        return lambda datetime: datetime.isoformat() if datetime else None
+
     def build_condition(self, value, operator=None, column_prefix=""):
         date = dateparser.parse(value).astimezone(self._timezone).strftime(self.config("date_format"))
         if not operator:
@@ -38,6 +38,13 @@ class HasMany(Column):
     def is_writeable(self):
         return False
 
+    def backend_column_names(self):
+        # the children are found via our id
+        return []
+
+    def related_models_classes(self):
+        return [self.config("child_models_class")]
+
     @property
     def is_readable(self):
         is_readable = self.config("is_readable", True)
@@ -27,6 +27,12 @@ class HasOne(HasMany):
             return self.child_models.empty_model()
         return self.child_models.find(f"{foreign_column_name}={data[id_column_name]}")
 
+    def prefetch(self, models):
+        id_column_name = self.config("parent_id_column_name")
+        self.child_models.prefetch(
+            self.config("foreign_column_name"), [model.data.get(id_column_name) for model in models]
+        )
+
     def to_json(self, model):
         json = OrderedDict()
         columns = self.get_child_columns()
@@ -23,3 +23,8 @@ class JSON(Column):
 
     def to_json(self, model):
         return {self.name: model.get(self.name, silent=True)}
+
+    def json_converter(self):
+        if type(self).to_json is not JSON.to_json:
+            return None
+        return lambda value: value
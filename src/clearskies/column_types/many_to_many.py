@@ -173,6 +173,13 @@ class ManyToMany(String):
             return [model for model in related_models]
         return [model.__getattr__(related_id_column_name) for model in related_models]
 
+    def backend_column_names(self):
+        # the related ids live in the pivot table and are found via our id
+        return []
+
+    def related_models_classes(self):
+        return [self.config("pivot_models_class"), self.config("related_models_class")]
+
     def to_backend(self, data):
         # we can't persist our mapping data to the database directly, so remove anything here
         # and take care of things in post_save
@@ -83,6 +83,28 @@ class ConditionParser:
             ),
         }
 
+    def build_condition(self, column, operator, values, table=""):
+        """
+        Returns a condition just like `parse_condition`, but from its parts instead of a string.
+
+        The values are used as-is, so (unlike with `parse_condition`) they can safely contain spaces, commas, quotes,
+        etc...
+        """
+        lowercase_operator = operator.lower()
+        if lowercase_operator not in self.operators:
+            raise ValueError(f"Unsupported operator {operator} for condition")
+        values = list(values)
+        column_for_parsed = f"{table}.{column}" if table else column
+        return {
+            "table": table,
+            "column": column,
+            "operator": lowercase_operator.upper(),
+            "values": [] if lowercase_operator in self.operators_without_placeholders else values,
+            "parsed": self._with_placeholders(
+                column_for_parsed, lowercase_operator, values, escape=False if table else True
+            ),
+        }
+
     def _parse_condition_list(self, value):
         if value[0] != "(" and value[-1] != ")":
             raise ValueError(f"Invalid search value {value} for condition.  For IN operator use `IN (value1,value2)`")
@@ -11,7 +11,9 @@ class WSGI(Context):
         if self.handler is None:
             raise ValueError("Cannot execute WSGI context without first configuring it")
 
-        return self.handler(WSGIInputOutput(env, start_response))
+        input_output = WSGIInputOutput(env, start_response)
+        input_output.set_json_encoder(self.di.build("json_encoder", cache=True))
+        return self.handler(input_output)
 
 
 def wsgi(
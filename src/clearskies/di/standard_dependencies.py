@@ -1,7 +1,7 @@
 from .di import DI
 from ..columns import Columns
 from ..environment import Environment
-from ..backends import CursorBackend, JsonBackend, MemoryBackend, SecretsBackend
+from ..backends import CsvBackend, CursorBackend, JsonBackend, JsonLinesBackend, MemoryBackend, SecretsBackend
 from .. import autodoc
 import os
 import uuid
@@ -9,28 +9,87 @@ import inspect
 
 
 class StandardDependencies(DI):
-    def provide_requests(self):
+    def provide_requests(self, requests_configuration):
         # by importing the requests library when requested, instead of in the top of the file,
         # it is not necessary to install the requests library if it is never used.
         import requests
-        from requests.adapters import HTTPAdapter
         from requests.packages.urllib3.util.retry import Retry
+        from ..http_transport import HttpTransport
+        from ..rate_limiter import RateLimiter
 
+        # allow partial configurations
+        requests_configuration = {**self.provide_requests_configuration(), **requests_configuration}
         use_allowed_methods = "allowed_methods" in inspect.getfullargspec(Retry.__init__).args
         methods_key = "allowed_methods" if use_allowed_methods else "method_whitelist"
         kwargs = {
-            "total": 3,
-            "status_forcelist": [429, 500, 502, 503, 504],
-            "backoff_factor": 1,
-            methods_key: ["GET", "POST", "DELETE", "OPTIONS", "PATCH"],
+            "total": requests_configuration["retries"],
+            "status_forcelist": requests_configuration["retry_statuses"],
+            "backoff_factor": requests_configuration["backoff_factor"],
+            methods_key: requests_configuration["retry_methods"],
         }
 
+        rate_limiter = RateLimiter(
+            requests_per_second=requests_configuration["rate_limit"],
+            burst=requests_configuration["rate_limit_burst"],
+            max_concurrency=requests_configuration["max_concurrency"],
+            max_wait=requests_configuration["max_rate_limit_wait"],
+        )
+        # the transport retries overloaded hosts itself, so that all threads back off together
+        kwargs["status_forcelist"] = [
+            status for status in kwargs["status_forcelist"] if status not in rate_limiter.overloaded_statuses
+        ]
+        kwargs["respect_retry_after_header"] = False
+
         retry_strategy = Retry(**kwargs)
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HttpTransport(
+            max_retries=retry_strategy,
+            pool_connections=requests_configuration["pool_connections"],
+            pool_maxsize=requests_configuration["pool_maxsize"],
+            pool_block=requests_configuration["pool_block"],
+            timeout=requests_configuration["timeout"],
+            keep_alive=requests_configuration["keep_alive"],
+            rate_limiter=rate_limiter,
+            rate_limit_retries=requests_configuration["retries"],
+            backoff_factor=requests_configuration["backoff_factor"],
+            retry_statuses=requests_configuration["retry_statuses"],
+            retry_methods=requests_configuration["retry_methods"],
+        )
         http = requests.Session()
         http.mount("https://", adapter)
+        http.mount("http://", adapter)
         return http
 
+    def provide_requests_configuration(self):
+        """
+        The settings for the HTTP transport used by `requests`.  Bind a dictionary to change any of them.
+
+        `pool_connections` is the number of hosts to keep connection pools for, `pool_maxsize` is the number of
+        connections kept per host, and `pool_block` decides whether to wait for a free connection (rather than opening
+        a throwaway one) when they are all in use.  `timeout` is used for any request that doesn't set its own, and can
+        be a number of seconds or a (connect, read) tuple.  Failed requests are retried `retries` times (with
+        exponential `backoff_factor`) for the given statuses and methods.
+
+        Requests are also rate limited per host (see RateLimiter): `Retry-After` and `X-RateLimit-*` headers pause all
+        requests to the host, `rate_limit` (with bursts of `rate_limit_burst`) caps the requests per second, and
+        `max_concurrency` caps the requests in flight, adapting the cap when the host is overloaded.  Pauses never
+        last more than `max_rate_limit_wait` seconds.
+        """
+        return {
+            "pool_connections": 10,
+            "pool_maxsize": 10,
+            "pool_block": False,
+            "timeout": None,
+            "keep_alive": True,
+            "retries": 3,
+            "retry_statuses": [429, 500, 502, 503, 504],
+            "retry_methods": ["GET", "POST", "DELETE", "OPTIONS", "PATCH"],
+            "backoff_factor": 1,
+            "rate_limit": None,
+            "rate_limit_burst": None,
+            "max_concurrency": None,
+            "max_rate_limit_wait": 60,
+        }
+
     def provide_sys(self):
         import sys
 
@@ -96,9 +155,15 @@ class StandardDependencies(DI):
     def provide_memory_backend(self):
         return MemoryBackend()
 
+    def provide_csv_backend(self):
+        return CsvBackend()
+
     def provide_json_backend(self):
         return JsonBackend()
 
+    def provide_json_lines_backend(self):
+        return JsonLinesBackend()
+
     def provide_secrets_backend(self, secrets):
         return SecretsBackend(secrets)
 
@@ -127,6 +192,16 @@ class StandardDependencies(DI):
             "The dependency injector requested an InputOutput but none has been configured.  Alternatively, if you directly called `di.build('input_output')` then try again with `di.build('input_output', cache=True)`"
         )
 
+    def provide_json_encoder(self):
+        from ..input_outputs import JsonEncoder
+
+        return JsonEncoder()
+
+    def provide_response_cache(self):
+        from ..handlers.response_cache import ResponseCache
+
+        return ResponseCache()
+
     def provide_authentication(self):
         raise AttributeError("The dependency injector requested an Authenticaiton method but none has been configured")
 
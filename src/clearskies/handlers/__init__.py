@@ -1,9 +1,11 @@
 from .advanced_search import AdvancedSearch
+from .bulk_write import BulkWrite
 from .callable import Callable
 from .create import Create
 from .crud_by_method import CRUDByMethod
 from .database_connector import DatabaseConnector
 from .delete import Delete
+from .export import Export
 from .get import Get
 from .health_check import HealthCheck
 from .list import List
@@ -21,11 +23,13 @@ from . import exceptions
 __all__ = [
     "exceptions",
     "AdvancedSearch",
+    "BulkWrite",
     "Callable",
     "Create",
     "CRUDByMethod",
     "DatabaseConnector",
     "Delete",
+    "Export",
     "Get",
     "HealthCheck",
     "List",
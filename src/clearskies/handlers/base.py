@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from . import exceptions
 from collections import OrderedDict
+import hashlib
 import inspect
+import json
 import re
 from ..autodoc.schema import Integer as AutoDocInteger
 from ..autodoc.schema import String as AutoDocString
@@ -15,6 +17,13 @@ class Base(ABC):
     _configuration = None
     _configuration_defaults = {}
     _as_json_map = None
+    _row_serializer = None
+    _field_serializers = None
+    _field_serializers_limit = 100
+    _envelope_names = None
+    _casing_memo = None
+    _casing_memo_limit = 10000
+    _stream_chunk_size = 65536
     _global_configuration_defaults = {
         "base_url": "",
         "response_headers": None,
@@ -32,6 +41,9 @@ class Base(ABC):
     _configuration = None
     _cors_header = None
     has_cors = False
+    # read handlers can cache their responses (see `cache_ttl`), and write handlers invalidate those caches
+    _caches_responses = False
+    _invalidates_cached_responses = False
 
     def __init__(self, di):
         self._di = di
@@ -49,12 +61,22 @@ class Base(ABC):
 
         self._check_configuration(configuration)
         self._configuration = self._finalize_configuration(self.apply_default_configuration(configuration))
+        self._envelope_names = None
+        self._casing_memo = None
+        self._as_json_map = None
+        self._row_serializer = None
+        self._field_serializers = None
+        self._precompute_casings()
 
     def _check_configuration(self, configuration):
         if not "authentication" in configuration:
             raise KeyError(
                 f"You must provide authentication in the configuration for handler '{self.__class__.__name__}'"
             )
+        cache_ttl = configuration.get("cache_ttl", 0)
+        if type(cache_ttl) not in [int, float] or cache_ttl < 0:
+            class_name = self.__class__.__name__
+            raise ValueError(f"Configuration error for {class_name}: 'cache_ttl' should be a non-negative number")
         if configuration.get("authorization", None):
             # authorization can be a function (in which case we'll just call it for gating) or it can be an object
             # with 'gate' and 'filter_models' attributes, per the authentication.authorization base class
@@ -189,6 +211,10 @@ class Base(ABC):
         except exceptions.NotFound as auth_error:
             return self.error(input_output, str(auth_error), 404)
 
+        cached = self._respond_from_cache(input_output)
+        if cached is not None:
+            return cached
+
         try:
             response = self.handle(input_output)
         except exceptions.ClientError as client_error:
@@ -226,91 +252,369 @@ class Base(ABC):
 
         return self.respond(input_output, response_data, 200)
 
+    def success_stream(self, input_output, data, pagination=None):
+        """
+        Like `success`, but sends the data to the client as it is produced instead of all at once.
+
+        `data` is an iterable of JSON-ready records (typically a generator), and `pagination`, if provided, is a
+        function that returns the pagination data (`number_results`, `limit`, and `next_page`).  It is called after
+        the data has been exhausted, so the next page can come from a streaming iterator.  Since the status code is
+        sent before the data, any error while producing the data can only abort the response.
+        """
+        return self.respond_stream(input_output, self._stream_success_body(input_output, data, pagination), 200)
+
     def respond(self, input_output, response_data, status_code):
+        self._set_response_headers(input_output)
+        success = status_code == 200 and response_data.get("status") == "success"
+        response_data = self._normalize_response(response_data)
+        if success and self._invalidates_cached_responses:
+            self._response_cache().invalidate(self._response_cache_tag())
+        if not success or not self._is_cacheable_request(input_output):
+            return input_output.respond(response_data, status_code)
+
+        # the response is encoded once, for both the ETag and (where the context sends bytes) the body
+        encoded = input_output.json_encoder().encode(response_data)
+        etag = '"' + hashlib.sha1(encoded).hexdigest() + '"'
+        cached = [response_data, encoded, status_code, etag]
+        self._response_cache().set(
+            self._response_cache_key(input_output),
+            self._response_cache_tags(),
+            cached,
+            self.configuration("cache_ttl"),
+        )
+        return self._respond_with_etag(input_output, *cached)
+
+    def _respond_from_cache(self, input_output):
+        """
+        Sends the cached response for the request, if there is one.  Otherwise returns None.
+        """
+        if not self._is_cacheable_request(input_output):
+            return None
+        cached = self._response_cache().get(self._response_cache_key(input_output))
+        if cached is None:
+            return None
+        self._set_response_headers(input_output)
+        return self._respond_with_etag(input_output, *cached)
+
+    def _respond_with_etag(self, input_output, response_data, encoded, status_code, etag):
+        input_output.set_header("etag", etag)
+        if_none_match = input_output.get_request_header("if-none-match", True)
+        client_etags = [tag.strip() for tag in if_none_match.split(",")] if if_none_match else []
+        if etag in client_etags or "*" in client_etags:
+            return input_output.respond("", 304)
+        return input_output.respond_json(response_data, encoded, status_code)
+
+    def _is_cacheable_request(self, input_output):
+        return (
+            self._caches_responses
+            and bool(self.configuration("cache_ttl"))
+            and not self.configuration("output_map")
+            and input_output.get_request_method() == "GET"
+        )
+
+    def _response_cache(self):
+        return self._di.build("response_cache", cache=True)
+
+    def _response_cache_tag(self):
+        """
+        Returns what the cached responses are invalidated by: the model class, for handlers that have one.
+
+        The model class is used (rather than the models class) since handlers can be configured with either.
+        """
+        model = getattr(self, "_model", None)
+        return model.model_class() if model is not None else self.__class__
+
+    def _response_cache_tags(self):
+        """
+        Returns the tags to cache responses under: our own, plus the model classes that the readable columns
+        pull related records from (e.g. the parent of a belongs to column).
+        """
+        tags = [self._response_cache_tag()]
+        for column in self._get_readable_columns().values():
+            for models_class in column.related_models_classes():
+                tags.append(self._di.build(models_class, cache=True).model_class())
+        return tags
+
+    def _response_cache_key(self, input_output):
+        """
+        Returns the cache key for the request.
+
+        Responses depend on the route, the query (including search, sort, and pagination parameters in the body),
+        the casing, and who is asking (since where_for_request and authorization filter on the authorization data),
+        so all of these go into the key.  The raw body is used since handlers may change the parsed request data.
+        """
+        return json.dumps(
+            [
+                self.__class__.__name__,
+                self.configuration("base_url"),
+                input_output.get_path_info(),
+                input_output.routing_data(),
+                input_output.get_query_parameters(),
+                input_output.get_body(),
+                self._configuration["internal_casing"],
+                self._configuration["external_casing"],
+                input_output.get_authorization_data(),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+    def respond_stream(self, input_output, chunks, status_code):
+        self._set_response_headers(input_output)
+        return input_output.respond_stream(chunks, status_code)
+
+    def _set_response_headers(self, input_output):
         response_headers = self.configuration("response_headers")
         if response_headers:
             input_output.set_headers(response_headers)
         for security_header in self.configuration("security_headers"):
             security_header.set_headers_for_input_output(input_output)
-        return input_output.respond(self._normalize_response(response_data), status_code)
+
+    def _stream_success_body(self, input_output, data, pagination):
+        """
+        Yields the JSON of a success response in chunks of roughly `_stream_chunk_size` bytes.
+
+        This has the same keys as `_normalize_response`, except that pagination comes after the data.
+        """
+        names = self._response_envelope_names()
+        encode = input_output.json_encoder().encode
+        chunk = bytearray(b"{")
+        chunk += encode(names["status"]) + b":" + encode(names["success"]) + b","
+        chunk += encode(names["error"]) + b':"",'
+        chunk += encode(names["input_errors"]) + b":{},"
+        chunk += encode(names["data"]) + b":["
+        separator = b""
+        for record in data:
+            chunk += separator + encode(record)
+            separator = b","
+            if len(chunk) >= self._stream_chunk_size:
+                yield bytes(chunk)
+                chunk = bytearray()
+        pagination_data = pagination() if pagination else {}
+        chunk += b"]," + encode(names["pagination"]) + b":" + encode(self._normalize_pagination(pagination_data))
+        yield bytes(chunk + b"}")
+
+    def _response_envelope_names(self):
+        """
+        Returns the (externally cased) names used in the response envelope.
+
+        These never change for a given configuration, so we work them out once instead of for every response.
+        """
+        if self._envelope_names is None:
+            self._envelope_names = {
+                name: self.auto_case_internal_column_name(name)
+                for name in [
+                    "status",
+                    "error",
+                    "data",
+                    "pagination",
+                    "input_errors",
+                    "number_results",
+                    "limit",
+                    "next_page",
+                    "success",
+                    "client_error",
+                ]
+            }
+        return self._envelope_names
 
     def _normalize_response(self, response_data):
         if not "status" in response_data:
             raise ValueError("Huh, status got left out somehow")
+        names = self._response_envelope_names()
+        status = response_data["status"]
         return {
-            self.auto_case_internal_column_name("status"): self.auto_case_internal_column_name(response_data["status"]),
-            self.auto_case_internal_column_name("error"): response_data.get("error", ""),
-            self.auto_case_internal_column_name("data"): response_data.get("data", []),
-            self.auto_case_internal_column_name("pagination"): self._normalize_pagination(
-                response_data.get("pagination", {})
-            ),
-            self.auto_case_internal_column_name("input_errors"): response_data.get("input_errors", {}),
+            names["status"]: names[status] if status in names else self.auto_case_internal_column_name(status),
+            names["error"]: response_data.get("error", ""),
+            names["data"]: response_data.get("data", []),
+            names["pagination"]: self._normalize_pagination(response_data.get("pagination", {})),
+            names["input_errors"]: response_data.get("input_errors", {}),
         }
 
     def _normalize_pagination(self, pagination):
         # pagination isn't always relevant so if it is completely empty then leave it that way
         if not pagination:
             return pagination
+        names = self._response_envelope_names()
         return {
-            self.auto_case_internal_column_name("number_results"): pagination.get("number_results", 0),
-            self.auto_case_internal_column_name("limit"): pagination.get("limit", 0),
-            self.auto_case_internal_column_name("next_page"): {
+            names["number_results"]: pagination.get("number_results", 0),
+            names["limit"]: pagination.get("limit", 0),
+            names["next_page"]: {
                 self.auto_case_internal_column_name(key): value
                 for (key, value) in pagination.get("next_page", {}).items()
             },
         }
 
-    def _model_as_json(self, model, input_output):
+    def _model_as_json(self, model, input_output, columns=None):
+        """
+        Converts the model to JSON.
+
+        Pass in `columns` (see `_columns_for_fields`) to only include some of the readable columns.
+        """
         if self.configuration("output_map"):
             return self._di.call_function(self.configuration("output_map"), model=model)
 
-        if self._as_json_map is None:
-            self._as_json_map = self._build_as_json_map(model)
+        if columns is not None:
+            return self._field_serializer(model, columns)(model)
+        if self._row_serializer is None:
+            self._row_serializer = self._build_row_serializer(model)
+        return self._row_serializer(model)
+
+    def _field_serializer(self, model, columns):
+        """
+        Returns the row serializer for a subset of the readable columns.
+
+        These are kept around (up to `_field_serializers_limit` of them) since clients tend to ask for the same
+        handful of fields over and over again.
+        """
+        if self._field_serializers is None:
+            self._field_serializers = {}
+        key = tuple(columns.keys())
+        serializer = self._field_serializers.get(key)
+        if serializer is None:
+            serializer = self._build_row_serializer(model, columns=columns)
+            if len(self._field_serializers) < self._field_serializers_limit:
+                self._field_serializers[key] = serializer
+        return serializer
+
+    def _columns_for_fields(self, fields):
+        """
+        Returns the readable columns requested by the client in the `fields` request parameter.
+
+        `fields` can be a comma-separated string or a list of (externally cased) column names.  The columns come back
+        in the usual order, regardless of the order they were requested in.  The id is always included in the
+        response, so asking for it is allowed but doesn't change anything.  Raises a ClientError for anything that
+        isn't a readable column.
+        """
+        if type(fields) == str:
+            fields = fields.split(",")
+        if type(fields) != list or [field for field in fields if type(field) != str]:
+            raise exceptions.ClientError("Invalid request: 'fields' should be a comma-separated list of column names")
+        readable_columns = self._get_readable_columns()
+        requested = set([self.id_column_name])
+        for field in fields:
+            field = field.strip()
+            if not field:
+                continue
+            if self.configuration("id_column_name") and field == self.auto_case_internal_column_name("id"):
+                continue
+            column_name = self.auto_case_column_name(field, False)
+            if column_name == self.id_column_name:
+                continue
+            if column_name not in readable_columns:
+                raise exceptions.ClientError(f"Invalid request: unknown field '{field}'")
+            requested.add(column_name)
+        return OrderedDict(
+            [(column_name, column) for (column_name, column) in readable_columns.items() if column_name in requested]
+        )
 
-        json = OrderedDict()
-        for output_name, column in self._as_json_map.items():
-            column_data = column.to_json(model)
-            if len(column_data) == 1:
-                json[output_name] = list(column_data.values())[0]
-            else:
-                for key, value in column_data.items():
-                    json[self.auto_case_column_name(key, True)] = value
-        return json
+    def _build_row_serializer(self, model, columns=None):
+        """
+        Returns a function that converts a model into its JSON representation for the readable columns (or just
+        the given ones).
 
-    def _build_as_json_map(self, model):
+        The work that doesn't depend on the record (which columns, what their output names are, how their values
+        are converted) is done once, here.  Columns with a `json_converter` are then serialized straight from their
+        values, and only the rest (e.g. relationships) go through `to_json`.
+        """
+        if columns is not None:
+            as_json_map = self._build_as_json_map(model, columns=columns)
+        else:
+            if self._as_json_map is None:
+                self._as_json_map = self._build_as_json_map(model)
+            as_json_map = self._as_json_map
+
+        plan = [(output_name, column, column.json_converter()) for (output_name, column) in as_json_map.items()]
+        column_names = [column.name for (output_name, column, converter) in plan if converter]
+
+        def serialize(model):
+            values = iter(model.get_many(column_names))
+            json = {}
+            for output_name, column, converter in plan:
+                if converter:
+                    json[output_name] = converter(next(values))
+                    continue
+                column_data = column.to_json(model)
+                if len(column_data) == 1:
+                    json[output_name] = next(iter(column_data.values()))
+                else:
+                    for key, value in column_data.items():
+                        json[self.auto_case_column_name(key, True)] = value
+            return json
+
+        return serialize
+
+    def _build_as_json_map(self, model, columns=None):
         conversion_map = {}
         if self.configuration("id_column_name"):
             conversion_map[self.auto_case_internal_column_name("id")] = model.columns()[self.id_column_name]
 
-        for column in self._get_readable_columns().values():
+        if columns is None:
+            columns = self._get_readable_columns()
+        for column in columns.values():
             conversion_map[self.auto_case_column_name(column.name, True)] = column
         return conversion_map
 
     def auto_case_internal_column_name(self, column_name):
         if self._configuration["external_casing"]:
-            return string.swap_casing(column_name, "snake_case", self._configuration["external_casing"])
+            return self._swap_casing(column_name, "snake_case", self._configuration["external_casing"])
         return column_name
 
     def auto_case_to_internal_column_name(self, column_name):
         if self._configuration["external_casing"]:
-            return string.swap_casing(column_name, self._configuration["external_casing"], "snake_case")
+            return self._swap_casing(column_name, self._configuration["external_casing"], "snake_case")
         return column_name
 
     def auto_case_column_name(self, column_name, internal_to_external):
         if not self._configuration["internal_casing"]:
             return column_name
         if internal_to_external:
-            return string.swap_casing(
+            return self._swap_casing(
                 column_name,
                 self._configuration["internal_casing"],
                 self._configuration["external_casing"],
             )
-        return string.swap_casing(
+        return self._swap_casing(
             column_name,
             self._configuration["external_casing"],
             self._configuration["internal_casing"],
         )
 
+    def _swap_casing(self, column_name, from_casing, to_casing):
+        """
+        A memoized string.swap_casing, since we convert the same handful of names over and over again.
+
+        The memo is bounded (by `_casing_memo_limit`) because some of the names come from the request.
+        """
+        if self._casing_memo is None:
+            self._casing_memo = {}
+        key = (column_name, from_casing, to_casing)
+        swapped = self._casing_memo.get(key)
+        if swapped is None:
+            swapped = string.swap_casing(column_name, from_casing, to_casing)
+            if len(self._casing_memo) < self._casing_memo_limit:
+                self._casing_memo[key] = swapped
+        return swapped
+
+    def _precompute_casings(self):
+        """
+        Works out the casing conversions for all the names we know about ahead of time
+        """
+        self._response_envelope_names()
+        if not self._configuration["external_casing"]:
+            return
+        for name in self._known_casing_names():
+            external_name = self.auto_case_column_name(name, True)
+            self.auto_case_column_name(external_name, False)
+            self.auto_case_to_internal_column_name(self.auto_case_internal_column_name(name))
+
+    def _known_casing_names(self):
+        """
+        Returns the (internal) names that the handler expects to convert to/from the external casing
+        """
+        columns = getattr(self, "_columns", None)
+        return list(columns.keys()) if columns else []
+
     @property
     def id_column_name(self) -> str:
         """
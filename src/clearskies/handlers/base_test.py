@@ -104,6 +104,39 @@ class BaseTest(unittest.TestCase):
         )
         self.assertEqual(200, code)
 
+    def test_envelope_casing(self):
+        handle = Handle(self.di)
+        handle.configure({"authentication": public(), "internal_casing": "snake_case", "external_casing": "camelCase"})
+        (data, code) = handle.success(self.reflect_output, [1], number_results=1, limit=10, next_page={"next_start": 1})
+        self.assertEqual(
+            {
+                "status": "success",
+                "error": "",
+                "data": [1],
+                "pagination": {"numberResults": 1, "limit": 10, "nextPage": {"nextStart": 1}},
+                "inputErrors": {},
+            },
+            data,
+        )
+        (data, code) = handle.error(self.reflect_output, "bad", 400)
+        self.assertEqual("clientError", data["status"])
+
+    def test_casing_memo(self):
+        handle = Handle(self.di)
+        handle._casing_memo_limit = 15
+        handle.configure({"authentication": public(), "internal_casing": "snake_case", "external_casing": "TitleCase"})
+        # the envelope names are worked out ahead of time
+        self.assertEqual("NextPage", handle._casing_memo[("next_page", "snake_case", "TitleCase")])
+
+        self.assertEqual("FirstName", handle.auto_case_column_name("first_name", True))
+        self.assertEqual("first_name", handle.auto_case_column_name("FirstName", False))
+        self.assertEqual("first_name", handle._casing_memo[("FirstName", "TitleCase", "snake_case")])
+
+        # but we stop remembering names after a while
+        for index in range(20):
+            self.assertEqual(f"Name{index}", handle.auto_case_internal_column_name(f"name{index}"))
+        self.assertEqual(15, len(handle._casing_memo))
+
     def test_pagination(self):
         handle = Handle(self.di)
         handle.configure({"authentication": public()})
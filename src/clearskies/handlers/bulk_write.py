@@ -0,0 +1,177 @@
+from .write import Write
+from .exceptions import InputError, ClientError
+from .. import autodoc
+from ..functional import string
+
+
+class BulkWrite(Write):
+    """
+    Creates and updates many records in one request.
+
+    The request body has a `records` key with a list of records.  Records with an `id` update the existing record
+    (which must match the `where` configuration and any authorization, just like with the Update handler) and
+    the rest are created.  Every record is validated just like with the Create and Update handlers, and any
+    input errors are reported by the (zero-based) index of the record in the request.
+
+    By default nothing is saved unless every record is valid.  With `partial_success` enabled, the valid records
+    are saved anyway, and the response has a result (with its own status) for each record, in order.  New records
+    are sent to the backend together (see Models.create_many), so it can insert them all at once.  Like with the
+    Create and Update handlers, the writeable columns for new and existing records can differ (see
+    `Column.additional_write_columns`).
+    """
+
+    _configuration_defaults = {
+        **Write._configuration_defaults,
+        "where": [],
+        "partial_success": False,
+        "max_records": 1000,
+    }
+
+    def __init__(self, di):
+        super().__init__(di)
+
+    def handle(self, input_output):
+        request_data = input_output.request_data()
+        records = (
+            request_data.get(self.auto_case_internal_column_name("records")) if type(request_data) == dict else None
+        )
+        if type(records) != list or [record for record in records if type(record) != dict]:
+            raise ClientError("Invalid request: 'records' should be a list of objects")
+        if len(records) > self.configuration("max_records"):
+            raise ClientError(
+                f"Invalid request: at most {self.configuration('max_records')} records may be saved at once"
+            )
+
+        id_name = self.auto_case_internal_column_name("id")
+        records = [self._map_input_names(record, is_create=not record.get(id_name)) for record in records]
+        existing = self._find_existing([record["id"] for record in records if record.get("id")], input_output)
+        input_errors = {}
+        creates = []
+        updates = []
+        for index, record in enumerate(records):
+            model = self._model.empty_model()
+            if record.get("id"):
+                model = existing.get(str(record["id"]))
+                if model is None:
+                    input_errors[str(index)] = {"id": "Not Found"}
+                    continue
+                record = {key: value for (key, value) in record.items() if key != "id"}
+            is_create = not model.exists
+            errors = {
+                **self._extra_column_errors(record, is_create=is_create),
+                **self._find_input_errors(model, record, input_output, is_create=is_create),
+            }
+            if errors:
+                input_errors[str(index)] = errors
+            elif model.exists:
+                updates.append((index, model, record))
+            else:
+                creates.append((index, record))
+
+        partial_success = self.configuration("partial_success")
+        if input_errors and not partial_success:
+            raise InputError(input_errors)
+
+        saved = {}
+        new_models = self._model.create_many([record for (index, record) in creates], columns=self._columns)
+        for (index, record), model in zip(creates, new_models):
+            saved[index] = model
+        for index, model, record in updates:
+            model.save(record, columns=self._get_writeable_columns(is_create=False))
+            saved[index] = model
+
+        if not partial_success:
+            return self.success(
+                input_output, [self._model_as_json(saved[index], input_output) for index in range(len(records))]
+            )
+
+        names = self._response_envelope_names()
+        results = []
+        for index in range(len(records)):
+            if index in saved:
+                results.append(
+                    {names["status"]: names["success"], names["data"]: self._model_as_json(saved[index], input_output)}
+                )
+            else:
+                results.append(
+                    {names["status"]: names["input_errors"], names["input_errors"]: input_errors[str(index)]}
+                )
+        return self.success(input_output, results)
+
+    def _find_existing(self, ids, input_output):
+        """
+        Looks up the records to update, a batch at a time, and returns them in a dictionary keyed by id.
+        """
+        id_column_name = self.id_column_name
+        existing = {}
+        for start in range(0, len(ids), 100):
+            models = self._model.where_condition(id_column_name, "in", ids[start : start + 100])
+            models = self._filter_models(models, input_output)
+            for model in models:
+                existing[str(model.get(id_column_name))] = model
+        return existing
+
+    def _check_configuration(self, configuration):
+        super()._check_configuration(configuration)
+        self._check_where_configuration(configuration)
+        error_prefix = f"Configuration error for {self.__class__.__name__}:"
+        max_records = configuration.get("max_records", 1)
+        if type(max_records) != int or max_records < 1:
+            raise ValueError(f"{error_prefix} 'max_records' should be a positive integer")
+
+    def _known_casing_names(self):
+        return [*super()._known_casing_names(), "records"]
+
+    def documentation(self):
+        nice_model = string.camel_case_to_words(self._model.__class__.__name__)
+        schema_model_name = string.camel_case_to_snake_case(self._model.__class__.__name__)
+        data_schema = self.documentation_data_schema()
+
+        authentication = self.configuration("authentication")
+        standard_error_responses = [
+            self.documentation_input_error_response(),
+        ]
+        if not getattr(authentication, "is_public", False):
+            standard_error_responses.append(self.documentation_access_denied_response())
+            if getattr(authentication, "can_authorize", False):
+                standard_error_responses.append(self.documentation_unauthorized_response())
+
+        id_label = "id" if self.configuration("id_column_name") else self.id_column_name
+        record = autodoc.schema.Object(
+            nice_model,
+            [
+                autodoc.schema.String(self.auto_case_internal_column_name(id_label)),
+                *[
+                    column.documentation(name=self.auto_case_column_name(column.name, True))
+                    for column in self._get_writeable_columns().values()
+                ],
+            ],
+        )
+
+        return [
+            autodoc.request.Request(
+                f"Create or update several {nice_model} records",
+                [
+                    self.documentation_success_response(
+                        autodoc.schema.Array(
+                            self.auto_case_internal_column_name("data"),
+                            autodoc.schema.Object(nice_model, children=data_schema, model_name=schema_model_name),
+                        ),
+                        description=f"The saved {nice_model} records",
+                    ),
+                    *standard_error_responses,
+                ],
+                relative_path=self.configuration("base_url"),
+                request_methods="POST",
+                parameters=[
+                    autodoc.request.JSONBody(
+                        autodoc.schema.Array(self.auto_case_internal_column_name("records"), record),
+                        description=f"The {nice_model} records to save: records with an {id_label} are updated",
+                        required=True,
+                    ),
+                ],
+                root_properties={
+                    "security": self.documentation_request_security(),
+                },
+            )
+        ]
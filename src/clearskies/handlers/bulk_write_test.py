@@ -0,0 +1,211 @@
+import unittest
+from .bulk_write import BulkWrite
+from ..column_types import String, Integer
+from ..input_requirements import Required, MaximumLength
+from ..authentication import Public
+from ..model import Model
+from ..contexts import test
+from collections import OrderedDict
+
+
+class User(Model):
+    def __init__(self, memory_backend, columns):
+        super().__init__(memory_backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict(
+            [
+                ("name", {"class": String, "input_requirements": [Required]}),
+                ("email", {"class": String, "input_requirements": [Required, (MaximumLength, 15)]}),
+                ("age", {"class": Integer}),
+            ]
+        )
+
+
+class Code(Model):
+    def __init__(self, memory_backend, columns):
+        super().__init__(memory_backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict(
+            [
+                ("id", {"class": String}),
+                ("name", {"class": String, "input_requirements": [Required]}),
+            ]
+        )
+
+
+class Name(String):
+    def additional_write_columns(self, is_create=False):
+        # new records can also say where they came from
+        if not is_create:
+            return {}
+        source = self.di.build(String, cache=False)
+        source.configure("source", {}, self.model_class)
+        return {"source": source}
+
+
+class Contact(Model):
+    def __init__(self, memory_backend, columns):
+        super().__init__(memory_backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict([("name", {"class": Name}), ("source", {"class": String})])
+
+
+class BulkWriteTest(unittest.TestCase):
+    def build(self, **config):
+        bulk_write = test(
+            {
+                "handler_class": BulkWrite,
+                "handler_config": {
+                    "model_class": User,
+                    "readable_columns": ["name", "email", "age"],
+                    "writeable_columns": ["name", "email", "age"],
+                    "authentication": Public(),
+                    **config,
+                },
+            }
+        )
+        users = bulk_write.build(User)
+        self.jane = users.create({"name": "Jane", "email": "j@example.com", "age": 20})
+        self.bob = users.create({"name": "Bob", "email": "b@example.com", "age": 30})
+        return (bulk_write, users)
+
+    def test_create_and_update(self):
+        (bulk_write, users) = self.build()
+        response = bulk_write(
+            body={
+                "records": [
+                    {"name": "Conor", "email": "c@example.com", "age": 10},
+                    {"id": self.jane.id, "age": 21},
+                    {"name": "Ronoc", "email": "r@example.com"},
+                ]
+            }
+        )
+        self.assertEqual(200, response[1])
+        self.assertEqual("success", response[0]["status"])
+        self.assertEqual(
+            [
+                {"name": "Conor", "email": "c@example.com", "age": 10},
+                {"name": "Jane", "email": "j@example.com", "age": 21},
+                {"name": "Ronoc", "email": "r@example.com", "age": None},
+            ],
+            response[0]["data"],
+        )
+        self.assertEqual(4, len(users))
+        self.assertEqual(21, users.find(f"id={self.jane.id}").age)
+
+    def test_awkward_ids(self):
+        bulk_write = test(
+            {
+                "handler_class": BulkWrite,
+                "handler_config": {
+                    "model_class": Code,
+                    "readable_columns": ["id", "name"],
+                    "writeable_columns": ["name"],
+                    "authentication": Public(),
+                },
+            }
+        )
+        codes = bulk_write.build(Code)
+        codes.create({"id": "a 'b', c", "name": "awkward"})
+        codes.create({"id": "a 'b'", "name": "also awkward"})
+        response = bulk_write(body={"records": [{"id": "a 'b', c", "name": "fine"}, {"id": "c", "name": "nope"}]})
+        self.assertEqual(200, response[1])
+        self.assertEqual({"1": {"id": "Not Found"}}, response[0]["input_errors"])
+
+        response = bulk_write(body={"records": [{"id": "a 'b', c", "name": "fine"}]})
+        self.assertEqual([{"id": "a 'b', c", "name": "fine"}], response[0]["data"])
+        self.assertEqual("also awkward", codes.find("name=also awkward").name)
+
+    def test_all_or_nothing(self):
+        (bulk_write, users) = self.build(where=["age>25"])
+        response = bulk_write(
+            body={
+                "records": [
+                    {"name": "Conor", "email": "c@example.com"},
+                    {"name": "Ronoc", "email": "too-long@example.com"},
+                    {"id": self.jane.id, "age": 21},
+                    {"id": self.bob.id, "age": 31},
+                ]
+            }
+        )
+        self.assertEqual("input_errors", response[0]["status"])
+        self.assertEqual(
+            {
+                "1": {"email": "'email' must be at most 15 characters long."},
+                "2": {"id": "Not Found"},
+            },
+            response[0]["input_errors"],
+        )
+        self.assertEqual(2, len(users))
+        self.assertEqual(30, users.find(f"id={self.bob.id}").age)
+
+    def test_partial_success(self):
+        (bulk_write, users) = self.build(
+            partial_success=True, internal_casing="snake_case", external_casing="camelCase"
+        )
+        response = bulk_write(
+            body={
+                "records": [
+                    {"name": "Conor", "email": "c@example.com"},
+                    {"name": "Ronoc", "email": "too-long@example.com"},
+                    {"id": self.bob.id, "age": 31, "color": "blue"},
+                    {"id": self.bob.id, "age": 32},
+                ]
+            }
+        )
+        self.assertEqual("success", response[0]["status"])
+        self.assertEqual(
+            [
+                {"status": "success", "data": {"name": "Conor", "email": "c@example.com", "age": None}},
+                {"status": "inputErrors", "inputErrors": {"email": "'email' must be at most 15 characters long."}},
+                {"status": "inputErrors", "inputErrors": {"color": "Input column 'color' is not an allowed column"}},
+                {"status": "success", "data": {"name": "Bob", "email": "b@example.com", "age": 32}},
+            ],
+            response[0]["data"],
+        )
+        self.assertEqual(3, len(users))
+
+    def test_invalid_request(self):
+        (bulk_write, users) = self.build(max_records=2)
+        response = bulk_write(body={"records": {"name": "Conor"}})
+        self.assertEqual(400, response[1])
+        self.assertEqual("Invalid request: 'records' should be a list of objects", response[0]["error"])
+        response = bulk_write(body={"records": [{"name": "a"}, {"name": "b"}, {"name": "c"}]})
+        self.assertEqual(400, response[1])
+        self.assertEqual("Invalid request: at most 2 records may be saved at once", response[0]["error"])
+
+    def test_create_and_update_columns(self):
+        bulk_write = test(
+            {
+                "handler_class": BulkWrite,
+                "handler_config": {
+                    "model_class": Contact,
+                    "readable_columns": ["name", "source"],
+                    "writeable_columns": ["name"],
+                    "authentication": Public(),
+                },
+            }
+        )
+        jane = bulk_write.build(Contact).create({"name": "Jane", "source": "import"})
+        response = bulk_write(
+            body={
+                "records": [
+                    {"name": "Bob", "source": "signup"},
+                    {"id": jane.id, "name": "Janet", "source": "signup"},
+                ]
+            }
+        )
+        self.assertEqual(200, response[1])
+        self.assertEqual(
+            {"1": {"source": "Input column 'source' is not an allowed column"}}, response[0]["input_errors"]
+        )
+
+        response = bulk_write(body={"records": [{"name": "Bob", "source": "signup"}, {"id": jane.id, "name": "Janet"}]})
+        self.assertEqual("success", response[0]["status"])
+        self.assertEqual(
+            [{"name": "Bob", "source": "signup"}, {"name": "Janet", "source": "import"}],
+            [{"name": record["name"], "source": record["source"]} for record in response[0]["data"]],
+        )
@@ -6,6 +6,9 @@ from .get import Get
 
 
 class Delete(Get):
+    _caches_responses = False
+    _invalidates_cached_responses = True
+
     _configuration_defaults = {
         "model": None,
         "model_class": None,
@@ -0,0 +1,163 @@
+import csv
+import io
+from .advanced_search import AdvancedSearch
+from .. import autodoc
+from ..functional import string
+
+
+class Export(AdvancedSearch):
+    """
+    Streams every matching record to the client as NDJSON (one JSON object per line) or CSV.
+
+    It takes the same configuration (wheres, joins, searchable/sortable columns, default sort, etc...) and the same
+    search and sort request parameters as AdvancedSearch, but there's no limit or pagination: the records are
+    fetched `batch_size` at a time until the end of the result set, and only one batch is ever held in memory.
+    When sorting by the id column (the default) each batch picks up after the last id of the previous one, so
+    every query is cheap regardless of how far into the result set it is.  When sorting by anything else we fall
+    back on the backend's own pagination, which (for the cursor backend) means offsets, so later batches get
+    slower as the export goes on.
+    """
+
+    expected_request_methods = ["GET", "POST"]
+    _caches_responses = False
+    formats = {
+        "ndjson": "application/x-ndjson; charset=UTF-8",
+        "csv": "text/csv; charset=UTF-8",
+    }
+
+    _configuration_defaults = {
+        **AdvancedSearch._configuration_defaults,
+        "format": "ndjson",
+        "batch_size": 1000,
+    }
+
+    def __init__(self, di):
+        super().__init__(di)
+
+    @property
+    def allowed_request_keys(self):
+        return ["sort", "where"]
+
+    def handle(self, input_output):
+        [models, limit, columns] = self._models_for_request(input_output)
+        if columns is None:
+            columns = self._get_readable_columns()
+        input_output.set_header("content-type", self.formats[self.configuration("format")])
+        if self.configuration("format") == "csv":
+            chunks = self._csv_chunks(models, input_output, columns)
+        else:
+            chunks = self._ndjson_chunks(models, input_output, columns)
+        return self.respond_stream(input_output, chunks, 200)
+
+    def check_request_data(self, request_data, query_parameters, pagination_data):
+        if pagination_data:
+            return "Invalid request: exports always include every matching record, so pagination is not allowed"
+        return super().check_request_data(request_data, query_parameters, pagination_data)
+
+    def _ndjson_chunks(self, models, input_output, columns):
+        encode = input_output.json_encoder().encode
+        for batch in self._batches(models, columns):
+            yield b"".join(
+                [encode(self._model_as_json(model, input_output, columns=columns)) + b"\n" for model in batch]
+            )
+
+    def _csv_chunks(self, models, input_output, columns):
+        encode = input_output.json_encoder().encode
+        buffer = io.StringIO()
+        writer = None
+        for batch in self._batches(models, columns):
+            for model in batch:
+                data = self._model_as_json(model, input_output, columns=columns)
+                if writer is None:
+                    writer = csv.DictWriter(buffer, fieldnames=list(data.keys()), extrasaction="ignore")
+                    writer.writeheader()
+                # CSV only has room for scalars, so anything else goes in as JSON
+                writer.writerow(
+                    {
+                        key: encode(value).decode("utf-8") if isinstance(value, (dict, list)) else value
+                        for (key, value) in data.items()
+                    }
+                )
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+        # with no records there's nothing to take the column names from, so fall back on the requested columns
+        if writer is None:
+            csv.writer(buffer).writerow([self.auto_case_column_name(column_name, True) for column_name in columns])
+            yield buffer.getvalue().encode("utf-8")
+
+    def _batches(self, models, columns):
+        batch_size = self.configuration("batch_size")
+        id_column_name = self.id_column_name
+        table_name = models.table_name()
+        if not models.query_sorts:
+            models = models.sort_by(id_column_name, "asc", primary_table=table_name)
+        sorts = models.query_sorts
+        by_id = len(sorts) == 1 and sorts[0]["column"] == id_column_name and sorts[0]["table"] in [None, table_name]
+        batch_models = models.limit(batch_size)
+        while True:
+            batch = list(batch_models)
+            if not batch:
+                return
+            for column in columns.values():
+                column.prefetch(batch)
+            yield batch
+
+            if by_id:
+                if len(batch) < batch_size:
+                    return
+                operator = ">" if sorts[0]["direction"].lower() == "asc" else "<"
+                last_id = batch[-1].get(id_column_name)
+                batch_models = models.where_condition(id_column_name, operator, [last_id], table=table_name)
+                batch_models = batch_models.limit(batch_size)
+                continue
+
+            next_page_data = batch_models.next_page_data()
+            if not next_page_data:
+                return
+            batch_models = batch_models.pagination(**next_page_data)
+
+    def _check_configuration(self, configuration):
+        super()._check_configuration(configuration)
+        error_prefix = f"Configuration error for {self.__class__.__name__}:"
+        if "format" in configuration and configuration["format"] not in self.formats:
+            raise ValueError(f"{error_prefix} 'format' should be one of '" + "', '".join(self.formats.keys()) + "'")
+        if "batch_size" in configuration:
+            batch_size = configuration["batch_size"]
+            if type(batch_size) != int or batch_size < 1:
+                raise ValueError(f"{error_prefix} 'batch_size' should be a positive integer")
+
+    def documentation(self):
+        nice_model = string.camel_case_to_words(self._model.__class__.__name__)
+
+        authentication = self.configuration("authentication")
+        standard_error_responses = []
+        if not getattr(authentication, "is_public", False):
+            standard_error_responses.append(self.documentation_access_denied_response())
+            if getattr(authentication, "can_authorize", False):
+                standard_error_responses.append(self.documentation_unauthorized_response())
+
+        if self.configuration("format") == "csv":
+            description = f"The matching {nice_model} records as CSV, with a header row"
+        else:
+            description = f"The matching {nice_model} records, one JSON object per line"
+
+        return [
+            autodoc.request.Request(
+                f"Export all matching {nice_model} records",
+                [
+                    autodoc.response.Response(200, autodoc.schema.String("body"), description=description),
+                    *standard_error_responses,
+                    self.documentation_generic_error_response(),
+                ],
+                relative_path=self.configuration("base_url"),
+                request_methods=self.expected_request_methods,
+                parameters=self.documentation_request_parameters(),
+                root_properties={
+                    "security": self.documentation_request_security(),
+                },
+            ),
+        ]
+
+    def documentation_json_pagination_parameters(self):
+        return []
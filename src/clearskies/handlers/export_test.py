@@ -0,0 +1,123 @@
+import csv
+import io
+import json
+import unittest
+from .export import Export
+from ..column_types import String, Integer, JSON
+from ..authentication import Public
+from ..model import Model
+from ..mocks import InputOutput
+from ..contexts import test
+from collections import OrderedDict
+
+
+class User(Model):
+    def __init__(self, memory_backend, columns):
+        super().__init__(memory_backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict(
+            [
+                ("id", {"class": String}),
+                ("name", {"class": String}),
+                ("age", {"class": Integer}),
+                ("tags", {"class": JSON}),
+            ]
+        )
+
+
+class ExportTest(unittest.TestCase):
+    def build(self, **config):
+        export = test(
+            {
+                "handler_class": Export,
+                "handler_config": {
+                    "model_class": User,
+                    "readable_columns": ["id", "name", "age"],
+                    "searchable_columns": ["name", "age"],
+                    "sortable_columns": ["name", "age"],
+                    "batch_size": 2,
+                    "authentication": Public(),
+                    **config,
+                },
+            }
+        )
+        users = export.build(User)
+        users.create({"id": "a", "name": "ronoc", "age": 6, "tags": ["x"]})
+        users.create({"id": "b", "name": "conor", "age": 8, "tags": {"level": 2}})
+        users.create({"id": "c", "name": "conor", "age": 15, "tags": ["x", "y"]})
+        users.create({"id": "d", "name": "ronoc", "age": 25, "tags": ["y"]})
+        users.create({"id": "e", "name": "ronoc", "age": 35, "tags": None})
+        return export
+
+    def test_ndjson(self):
+        export = self.build()
+        input_output = InputOutput()
+        response = export(input_output=input_output)
+        self.assertEqual(200, response[1])
+        self.assertEqual(
+            [
+                {"id": "a", "name": "ronoc", "age": 6},
+                {"id": "b", "name": "conor", "age": 8},
+                {"id": "c", "name": "conor", "age": 15},
+                {"id": "d", "name": "ronoc", "age": 25},
+                {"id": "e", "name": "ronoc", "age": 35},
+            ],
+            [json.loads(line) for line in response[0].splitlines()],
+        )
+        self.assertEqual("application/x-ndjson; charset=UTF-8", input_output.response["headers"]["CONTENT-TYPE"])
+
+    def test_awkward_ids(self):
+        export = test(
+            {
+                "handler_class": Export,
+                "handler_config": {
+                    "model_class": User,
+                    "readable_columns": ["id", "name"],
+                    "searchable_columns": ["name"],
+                    "batch_size": 1,
+                    "authentication": Public(),
+                },
+            }
+        )
+        users = export.build(User)
+        ids = ["a 'b', c", "a 'b', d", "a 'b', e"]
+        for id in ids:
+            users.create({"id": id, "name": "ronoc"})
+        response = export()
+        self.assertEqual(ids, [json.loads(line)["id"] for line in response[0].splitlines()])
+
+    def test_search_and_sort(self):
+        export = self.build()
+        response = export(
+            body={"where": [{"column": "name", "value": "ronoc"}], "sort": [{"column": "age", "direction": "desc"}]}
+        )
+        self.assertEqual(["e", "d", "a"], [json.loads(line)["id"] for line in response[0].splitlines()])
+
+        response = export(body={"limit": 5})
+        self.assertEqual(400, response[1])
+        response = export(query_parameters={"start": 2})
+        self.assertEqual(400, response[1])
+
+    def test_csv(self):
+        export = self.build(format="csv", readable_columns=["id", "age", "tags"], where=["age>7"])
+        input_output = InputOutput()
+        response = export(input_output=input_output)
+        self.assertEqual("text/csv; charset=UTF-8", input_output.response["headers"]["CONTENT-TYPE"])
+        self.assertEqual(
+            [
+                {"id": "b", "age": "8", "tags": '{"level": 2}'},
+                {"id": "c", "age": "15", "tags": '["x", "y"]'},
+                {"id": "d", "age": "25", "tags": '["y"]'},
+                {"id": "e", "age": "35", "tags": ""},
+            ],
+            list(csv.DictReader(io.StringIO(response[0]))),
+        )
+
+        response = export(body={"where": [{"column": "name", "value": "nobody"}]})
+        self.assertEqual("id,age,tags\r\n", response[0])
+
+    def test_configuration(self):
+        with self.assertRaises(ValueError) as context:
+            self.build(format="xml")()
+        self.assertIn("'format' should be one of 'ndjson', 'csv'", str(context.exception))
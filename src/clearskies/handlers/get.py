@@ -8,22 +8,36 @@ import inspect
 
 class Get(Base):
     _model = None
+    _caches_responses = True
 
     _configuration_defaults = {
         "model": None,
         "model_class": None,
         "readable_columns": None,
         "where": [],
+        "cache_ttl": 0,
     }
 
     def __init__(self, di):
         super().__init__(di)
 
     def handle(self, input_output):
-        model = self.fetch_model(input_output)
+        columns = self.get_requested_columns(input_output)
+        model = self.fetch_model(input_output, columns=columns)
         if type(model) == str:
             return self.error(input_output, model, 404)
-        return self.success(input_output, self._model_as_json(model, input_output))
+        return self.success(input_output, self._model_as_json(model, input_output, columns=columns))
+
+    def get_requested_columns(self, input_output):
+        """
+        Returns the columns requested via the `fields` query parameter, or None to return all the readable columns.
+        """
+        if self.configuration("output_map"):
+            return None
+        fields = input_output.get_query_parameters().get(self.auto_case_internal_column_name("fields"))
+        if fields is None:
+            return None
+        return self._columns_for_fields(fields)
 
     def get_model_id(self, input_output):
         routing_data = input_output.routing_data()
@@ -33,9 +47,14 @@ class Get(Base):
             return routing_data["id"]
         raise ValueError("I didn't receive the ID in my routing data.  I am probably misconfigured.")
 
-    def fetch_model(self, input_output):
+    def fetch_model(self, input_output, columns=None):
         id = self.get_model_id(input_output)
         models = self._model.where(f"{self.id_column_name}={id}")
+        if columns is not None and models.supports_n_plus_one():
+            backend_column_names = []
+            for column in columns.values():
+                backend_column_names.extend(column.backend_column_names())
+            models = models.select_columns(backend_column_names)
         for where in self.configuration("where"):
             if type(where) == str:
                 models = models.where(where)
@@ -62,6 +81,9 @@ class Get(Base):
 
         return model
 
+    def _known_casing_names(self):
+        return [*super()._known_casing_names(), "fields"]
+
     def _check_configuration(self, configuration):
         super()._check_configuration(configuration)
         error_prefix = "Configuration error for %s:" % (self.__class__.__name__)
@@ -81,6 +81,14 @@ class GetTest(unittest.TestCase):
         response = get(routing_data={"id": "6"}, authorization_data={"email": "bob@example.com"})
         self.assertEqual(404, response[1])
 
+    def test_fields(self):
+        response = self.get(routing_data={"id": "5"}, query_parameters={"fields": "name,age"})
+        self.assertEqual(200, response[1])
+        self.assertEqual({"id": "5", "name": "bob", "age": 25}, response[0]["data"])
+
+        response = self.get(routing_data={"id": "5"}, query_parameters={"fields": "name,nope"})
+        self.assertEqual(400, response[1])
+
     def test_not_found(self):
         response = self.get(routing_data={"id": "10"})
         self.assertEqual(404, response[1])
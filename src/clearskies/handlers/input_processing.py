@@ -6,29 +6,38 @@ from abc import abstractmethod
 class InputProcessing:
     _is_create = False
 
-    def _get_writeable_columns(self):
+    def _get_writeable_columns(self, is_create=None):
+        """
+        Returns the writeable columns, plus the additional columns they need when creating (or updating) a record.
+
+        `is_create` defaults to `_is_create`, and is only needed by handlers that both create and update records.
+        """
+        is_create = self._is_create if is_create is None else is_create
         if self._writeable_columns is None:
-            self._writeable_columns = self._get_rw_columns("writeable")
+            self._writeable_columns = {}
+        if is_create not in self._writeable_columns:
+            writeable_columns = self._get_rw_columns("writeable")
             additional_columns = OrderedDict()
-            for column in self._writeable_columns.values():
-                more_columns = column.additional_write_columns(is_create=self._is_create)
+            for column in writeable_columns.values():
+                more_columns = column.additional_write_columns(is_create=is_create)
                 for additional_column_name, additional_column in more_columns.items():
                     additional_columns[additional_column_name] = additional_column
             for additional_column_name, additional_column in additional_columns.items():
-                self._writeable_columns[additional_column_name] = additional_column
-        return self._writeable_columns
+                writeable_columns[additional_column_name] = additional_column
+            self._writeable_columns[is_create] = writeable_columns
+        return self._writeable_columns[is_create]
 
-    def _extra_column_errors(self, input_data):
+    def _extra_column_errors(self, input_data, is_create=None):
         input_errors = {}
-        allowed = self._get_writeable_columns()
+        allowed = self._get_writeable_columns(is_create=is_create)
         for column_name in input_data.keys():
             if column_name not in allowed:
                 input_errors[column_name] = f"Input column '{column_name}' is not an allowed column"
         return input_errors
 
-    def _find_input_errors(self, model, input_data, input_output):
+    def _find_input_errors(self, model, input_data, input_output, is_create=None):
         input_errors = {}
-        for column in self._get_writeable_columns().values():
+        for column in self._get_writeable_columns(is_create=is_create).values():
             input_errors = {
                 **input_errors,
                 **column.input_errors(model, input_data),
@@ -56,18 +65,7 @@ class InputProcessing:
         return input_errors
 
     def request_data(self, input_output, required=True):
-        # we have to map from internal names to external names, because case mapping
-        # isn't always one-to-one, so we want to do it exactly the same way that the documentation
-        # is built.
-        key_map = {self.auto_case_column_name(key, True): key for key in self._get_writeable_columns().keys()}
-        # in case the id comes up in the request body
-        key_map[self.auto_case_internal_column_name("id")] = "id"
-
-        # and make sure we don't drop any data along the way, because the input validation
-        # needs to return an error for unexpected data.
-        request_data = {
-            key_map.get(key, key): value for (key, value) in input_output.request_data(required=required).items()
-        }
+        request_data = self._map_input_names(input_output.request_data(required=required))
         # the parent handler should provide our resource id (we don't do any routing ourselves)
         # However, our update/etc handlers need to find the id easily, so I'm going to be lazy and
         # just dump it into the request.  I'll probably regret that.
@@ -77,3 +75,16 @@ class InputProcessing:
         if "id" in routing_data:
             request_data["id"] = routing_data["id"]
         return request_data
+
+    def _map_input_names(self, input_data, is_create=None):
+        # we have to map from internal names to external names, because case mapping
+        # isn't always one-to-one, so we want to do it exactly the same way that the documentation
+        # is built.
+        writeable_columns = self._get_writeable_columns(is_create=is_create)
+        key_map = {self.auto_case_column_name(key, True): key for key in writeable_columns.keys()}
+        # in case the id comes up in the request body
+        key_map[self.auto_case_internal_column_name("id")] = "id"
+
+        # and make sure we don't drop any data along the way, because the input validation
+        # needs to return an error for unexpected data.
+        return {key_map.get(key, key): value for (key, value) in input_data.items()}
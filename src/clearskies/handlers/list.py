@@ -1,4 +1,5 @@
 from .base import Base
+from . import exceptions
 from collections import OrderedDict
 from .. import autodoc
 from ..functional import string
@@ -12,6 +13,9 @@ class List(Base):
     _searchable_columns = None
     _readable_columns = None
     _prepared_models = None
+    _base_models = None
+    _stream_batch_size = 100
+    _caches_responses = True
     expected_request_methods = "GET"
 
     _configuration_defaults = {
@@ -27,13 +31,60 @@ class List(Base):
         "default_sort_direction": "asc",
         "default_limit": 100,
         "max_limit": 200,
+        "stream_response": False,
+        "cache_ttl": 0,
     }
 
     def __init__(self, di):
         super().__init__(di)
 
     def handle(self, input_output):
-        models = self._prepared_models.clone()
+        [models, limit, columns] = self._models_for_request(input_output)
+        if self.configuration("stream_response"):
+            number_results = len(models)
+            return self.success_stream(
+                input_output,
+                self._stream_models_as_json(models, input_output, columns=columns),
+                pagination=lambda: {
+                    "number_results": number_results,
+                    "limit": limit,
+                    "next_page": models.next_page_data(),
+                },
+            )
+
+        page = list(models)
+        for column in (columns if columns is not None else self._get_readable_columns()).values():
+            column.prefetch(page)
+        return self.success(
+            input_output,
+            [self._model_as_json(model, input_output, columns=columns) for model in page],
+            number_results=len(models),
+            limit=limit,
+            next_page=models.next_page_data(),
+        )
+
+    def _models_for_request(self, input_output):
+        """
+        Returns the models for the request (configured wheres, authorization, search, sort, and pagination), the
+        limit, and the columns requested via `fields` (or None to return all the readable columns).
+
+        Raises a ClientError if the request is invalid.
+        """
+        request_data = self.map_input_to_internal_names(input_output.request_data(False))
+        query_parameters = self.map_input_to_internal_names(input_output.get_query_parameters())
+        columns = None
+        # with an output_map we don't control the response, so 'fields' is left for check_request_data to reject
+        if not self.configuration("output_map"):
+            if "fields" in request_data and "fields" in query_parameters:
+                original_name = self.auto_case_internal_column_name("fields")
+                raise exceptions.ClientError(
+                    f"Ambiguous request: key '{original_name}' is present in both the JSON body and URL data"
+                )
+            fields = request_data.pop("fields", query_parameters.pop("fields", None))
+            if fields is not None:
+                columns = self._columns_for_fields(fields)
+
+        models = self._prepared_models.clone() if columns is None else self._models_for_columns(columns)
         for where in self.configuration("where"):
             if callable(where):
                 models = self._di.call_function(
@@ -49,15 +100,12 @@ class List(Base):
         authorization = self._configuration.get("authorization", None)
         if authorization and hasattr(authorization, "filter_models"):
             models = authorization.filter_models(models, input_output.get_authorization_data(), input_output)
-        request_data = self.map_input_to_internal_names(input_output.request_data(False))
-        query_parameters = self.map_input_to_internal_names(input_output.get_query_parameters())
         pagination_data = {}
         for key in self._model.allowed_pagination_keys():
             if key in request_data and key in query_parameters:
                 original_name = self.auto_case_internal_column_name(key)
-                return self.error(
-                    input_output,
-                    f"Ambiguous request: key '{original_name}' is present in both the JSON body and URL data",
+                raise exceptions.ClientError(
+                    f"Ambiguous request: key '{original_name}' is present in both the JSON body and URL data"
                 )
             if key in request_data:
                 pagination_data[key] = request_data[key]
@@ -68,7 +116,7 @@ class List(Base):
         if request_data or query_parameters or pagination_data:
             error = self.check_request_data(request_data, query_parameters, pagination_data)
             if error:
-                return self.error(input_output, error, 400)
+                raise exceptions.ClientError(error)
             [models, limit] = self.configure_models_from_request_data(
                 models, request_data, query_parameters, pagination_data
             )
@@ -78,14 +126,31 @@ class List(Base):
                 self.configuration("default_sort_direction"),
                 primary_table=models.table_name(),
             )
+        return [models, limit, columns]
 
-        return self.success(
-            input_output,
-            [self._model_as_json(model, input_output) for model in models],
-            number_results=len(models),
-            limit=limit,
-            next_page=models.next_page_data(),
-        )
+    def _models_for_columns(self, columns):
+        """
+        Returns the prepared models, but only loading what we need for the given columns.
+        """
+        models = self._base_models
+        if not models.supports_n_plus_one():
+            return models.clone()
+        for column in columns.values():
+            models = column.configure_n_plus_one(models)
+        backend_column_names = []
+        for column in columns.values():
+            backend_column_names.extend(column.backend_column_names())
+        return models.select_columns(backend_column_names)
+
+    def _stream_models_as_json(self, models, input_output, columns=None):
+        if columns is None:
+            columns = self._get_readable_columns()
+        # relationships are prefetched a batch at a time, so we never have more than one batch of models in memory
+        for batch in models.batches(self._stream_batch_size):
+            for column in columns.values():
+                column.prefetch(batch)
+            for model in batch:
+                yield self._model_as_json(model, input_output, columns=columns)
 
     def configure_models_from_request_data(self, models, request_data, query_parameters, pagination_data):
         limit = int(query_parameters.get("limit", self.configuration("default_limit")))
@@ -109,8 +174,19 @@ class List(Base):
     def internal_request_keys(self):
         return ["sort", "direction", "limit"]
 
+    def _known_casing_names(self):
+        return [
+            *super()._known_casing_names(),
+            *self.allowed_request_keys,
+            *self.internal_request_keys,
+            *self._model.allowed_pagination_keys(),
+            "fields",
+            "asc",
+            "desc",
+        ]
+
     def map_input_to_internal_names(self, input):
-        internal_request_keys = [*self.internal_request_keys, *self._model.allowed_pagination_keys()]
+        internal_request_keys = [*self.internal_request_keys, *self._model.allowed_pagination_keys(), "fields"]
         for key in internal_request_keys:
             mapped_key = self.auto_case_internal_column_name(key)
             if mapped_key != key and mapped_key in input:
@@ -205,6 +281,8 @@ class List(Base):
         if self.configuration("group_by"):
             self._prepared_models = self._prepared_models.group_by(self.configuration("group_by"))
         self._prepared_models = self._prepared_models.limit(self.configuration("default_limit"))
+        # requests for only some fields start from here, and load just what they need
+        self._base_models = self._prepared_models
 
         if self._prepared_models.supports_n_plus_one():
             for column in self._get_readable_columns().values():
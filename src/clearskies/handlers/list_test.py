@@ -1,10 +1,14 @@
+import json
 import unittest
 from .list import List
-from ..column_types import String, Integer
+from .create import Create
+from .update import Update
+from ..column_types import String, Integer, DateTime, BelongsTo
 from ..di import StandardDependencies
 from ..authentication import Public, SecretBearer, Authorization
 from ..model import Model
 from ..contexts import test
+from ..mocks import InputOutput
 from collections import OrderedDict
 
 
@@ -23,6 +27,50 @@ class User(Model):
         )
 
 
+class Initials(String):
+    def to_json(self, model):
+        name = model.get(self.name, silent=True)
+        return {self.name: name, f"{self.name}_initial": name[0].upper()}
+
+
+class Member(Model):
+    def __init__(self, memory_backend, columns):
+        super().__init__(memory_backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict(
+            [
+                ("id", {"class": String}),
+                ("full_name", {"class": Initials}),
+                ("joined_at", {"class": DateTime}),
+            ]
+        )
+
+
+class Status(Model):
+    def __init__(self, memory_backend, columns):
+        super().__init__(memory_backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict([("id", {"class": String}), ("name", {"class": String})])
+
+
+class Order(Model):
+    def __init__(self, memory_backend, columns):
+        super().__init__(memory_backend, columns)
+
+    def columns_configuration(self):
+        return OrderedDict(
+            [
+                ("id", {"class": String}),
+                (
+                    "status_id",
+                    {"class": BelongsTo, "parent_models_class": Status, "readable_parent_columns": ["name"]},
+                ),
+            ]
+        )
+
+
 class FilterAuth(Authorization):
     def filter_models(self, models, authorization_data, input_output):
         email = authorization_data.get("email")
@@ -175,6 +223,195 @@ class ListTest(unittest.TestCase):
         self.assertEqual({"id": "1", "awesome": "ronoc"}, response_data[0])
         self.assertEqual({"id": "2", "awesome": "conor"}, response_data[1])
 
+    def test_serializer_fallback(self):
+        list = test(
+            {
+                "handler_class": List,
+                "handler_config": {
+                    "model_class": Member,
+                    "readable_columns": ["full_name", "joined_at"],
+                    "searchable_columns": [],
+                    "default_sort_column": "id",
+                    "authentication": Public(),
+                    "internal_casing": "snake_case",
+                    "external_casing": "camelCase",
+                },
+            }
+        )
+        members = list.build(Member)
+        members.create({"id": "1", "full_name": "conor", "joined_at": "2023-02-03 04:05:06"})
+        members.create({"id": "2", "full_name": "jane", "joined_at": None})
+
+        response_data = list()[0]["data"]
+        self.assertEqual(
+            {"fullName": "conor", "fullNameInitial": "C", "joinedAt": "2023-02-03T04:05:06+00:00"},
+            response_data[0],
+        )
+        self.assertEqual({"fullName": "jane", "fullNameInitial": "J", "joinedAt": None}, response_data[1])
+
+    def test_stream_response(self):
+        # small enough that the body comes out in several chunks
+        class SmallChunkList(List):
+            _stream_batch_size = 2
+            _stream_chunk_size = 20
+
+        list = test(
+            {
+                "handler_class": SmallChunkList,
+                "handler_config": {
+                    "model_class": User,
+                    "readable_columns": ["id", "name", "age"],
+                    "searchable_columns": ["name"],
+                    "default_sort_column": "age",
+                    "default_limit": 3,
+                    "stream_response": True,
+                    "authentication": Public(),
+                },
+            }
+        )
+        users = list.build(User)
+        for user in self.users:
+            users.create(user.data)
+
+        response = list()
+        self.assertEqual(200, response[1])
+        self.assertEqual(
+            {
+                "status": "success",
+                "error": "",
+                "input_errors": {},
+                "data": [
+                    {"id": "1", "name": "ronoc", "age": 6},
+                    {"id": "2", "name": "conor", "age": 8},
+                    {"id": "5", "name": "conor", "age": 15},
+                ],
+                "pagination": {"number_results": 5, "next_page": {"start": 3}, "limit": 3},
+            },
+            json.loads(response[0]),
+        )
+
+    def test_response_cache(self):
+        list = test(
+            {
+                "handler_class": List,
+                "handler_config": {
+                    "model_class": User,
+                    "readable_columns": ["id", "name"],
+                    "searchable_columns": ["name"],
+                    "default_sort_column": "name",
+                    "authentication": Public(),
+                    "cache_ttl": 60,
+                },
+            }
+        )
+        users = list.build(User)
+        users.create({"id": "1", "name": "conor"})
+
+        input_output = InputOutput()
+        response = list(method="GET", input_output=input_output)
+        self.assertEqual([{"id": "1", "name": "conor"}], response[0]["data"])
+        etag = input_output.response["headers"]["ETAG"]
+
+        # changes behind our back aren't seen until the cache expires
+        users.create({"id": "2", "name": "ronoc"})
+        self.assertEqual(1, len(list(method="GET")[0]["data"]))
+        # but different requests are cached separately
+        self.assertEqual(2, len(list(method="GET", query_parameters={"limit": 5})[0]["data"]))
+
+        # the client already has the current version
+        self.assertEqual(("", 304), list(method="GET", headers={"If-None-Match": etag}))
+
+        # and saving through a handler for the same model invalidates the cache
+        create = list.build(Create)
+        create.configure(
+            {
+                "model_class": User,
+                "writeable_columns": ["name"],
+                "readable_columns": ["name"],
+                "authentication": Public(),
+            }
+        )
+        create_input_output = InputOutput()
+        create_input_output.set_body({"name": "bob"})
+        create(create_input_output)
+        response = list(method="GET", headers={"If-None-Match": etag})
+        self.assertEqual(200, response[1])
+        self.assertEqual(3, len(response[0]["data"]))
+
+    def test_response_cache_related_models(self):
+        list = test(
+            {
+                "handler_class": List,
+                "handler_config": {
+                    "model_class": Order,
+                    "readable_columns": ["status_id"],
+                    "default_sort_column": "id",
+                    "authentication": Public(),
+                    "cache_ttl": 60,
+                },
+            }
+        )
+        list.build(Status).create({"id": "1", "name": "pending"})
+        list.build(Order).create({"id": "1", "status_id": "1"})
+        response = list(method="GET")
+        self.assertEqual({"id": "1", "name": "pending"}, response[0]["data"][0]["status"])
+
+        # the list shows data from the statuses, so saving a status through a handler invalidates it too
+        update = list.build(Update)
+        update.configure(
+            {
+                "model_class": Status,
+                "writeable_columns": ["name"],
+                "readable_columns": ["name"],
+                "authentication": Public(),
+            }
+        )
+        update_input_output = InputOutput(body={"name": "shipped"})
+        update_input_output.set_routing_data({"id": "1"})
+        self.assertEqual(200, update(update_input_output)[1])
+        response = list(method="GET")
+        self.assertEqual({"id": "1", "name": "shipped"}, response[0]["data"][0]["status"])
+
+    def test_fields(self):
+        response = self.list(query_parameters={"fields": "age,name", "sort": "age", "direction": "asc", "limit": 2})
+        self.assertEqual(200, response[1])
+        self.assertEqual(
+            [{"id": "1", "name": "ronoc", "age": 6}, {"id": "2", "name": "conor", "age": 8}], response[0]["data"]
+        )
+        self.assertEqual({"number_results": 5, "next_page": {"start": 2}, "limit": 2}, response[0]["pagination"])
+
+        response = self.list(body={"fields": ["email"]})
+        self.assertEqual({"id": "1", "email": "cmancone1@example.com"}, response[0]["data"][0])
+
+        response = self.list(query_parameters={"fields": "name,password"})
+        self.assertEqual(400, response[1])
+        self.assertEqual("Invalid request: unknown field 'password'", response[0]["error"])
+
+        response = self.list(query_parameters={"fields": "name"}, body={"fields": "age"})
+        self.assertEqual(400, response[1])
+
+    def test_fields_casing(self):
+        list = test(
+            {
+                "handler_class": List,
+                "handler_config": {
+                    "model_class": Member,
+                    "readable_columns": ["full_name", "joined_at"],
+                    "searchable_columns": [],
+                    "default_sort_column": "full_name",
+                    "authentication": Public(),
+                    "internal_casing": "snake_case",
+                    "external_casing": "camelCase",
+                },
+            }
+        )
+        members = list.build(Member)
+        members.create({"id": "1", "full_name": "conor", "joined_at": "2023-01-02T03:04:05+00:00"})
+
+        response = list(query_parameters={"fields": "fullName"})
+        self.assertEqual(200, response[1])
+        self.assertEqual([{"fullName": "conor", "fullNameInitial": "C"}], response[0]["data"])
+
     def test_authorization(self):
         list = test(
             {
@@ -0,0 +1,60 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """
+    An in-process LRU cache of (normalized) handler responses, with a TTL per entry.
+
+    Each entry is tagged with the models classes it was read from, so that writes to any of them can invalidate
+    everything read from it.  A single instance is shared by all the handlers built by the same dependency
+    injection container (see `StandardDependencies.provide_response_cache`).
+    """
+
+    _entries = None
+    _lock = None
+
+    def __init__(self, max_entries=1000, clock=None):
+        self.max_entries = max_entries
+        self._clock = clock if clock is not None else time.monotonic
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns the cached response for the key, or None if it isn't cached or has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            (expires_at, tag, response) = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key, tags, response, ttl):
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, set(tags), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tag):
+        """
+        Removes everything cached for the given tag (i.e. models class).
+        """
+        with self._lock:
+            for key in [key for (key, entry) in self._entries.items() if tag in entry[1]]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
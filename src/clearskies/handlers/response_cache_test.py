@@ -0,0 +1,34 @@
+import unittest
+from .response_cache import ResponseCache
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 100
+        self.cache = ResponseCache(max_entries=2, clock=lambda: self.now)
+
+    def test_ttl(self):
+        self.cache.set("a", ["users"], ["response"], 10)
+        self.assertEqual(["response"], self.cache.get("a"))
+        self.now = 110
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(0, len(self.cache))
+
+    def test_lru(self):
+        self.cache.set("a", ["users"], "a", 10)
+        self.cache.set("b", ["users"], "b", 10)
+        self.cache.get("a")
+        self.cache.set("c", ["users"], "c", 10)
+        self.assertEqual("a", self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual("c", self.cache.get("c"))
+
+    def test_invalidate(self):
+        self.cache.set("a", ["users"], "a", 10)
+        self.cache.set("b", ["posts", "comments"], "b", 10)
+        self.cache.invalidate("users")
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual("b", self.cache.get("b"))
+        # any of the tags invalidates the entry
+        self.cache.invalidate("comments")
+        self.assertIsNone(self.cache.get("b"))
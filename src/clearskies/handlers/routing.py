@@ -57,6 +57,7 @@ class Routing(Base):
 
         self._check_configuration(configuration)
         self._configuration = self._finalize_configuration(self.apply_default_configuration(configuration))
+        self._envelope_names = None
 
     def _check_configuration(self, configuration):
         super()._check_configuration(configuration)
@@ -204,3 +204,26 @@ class SimpleSearchTest(unittest.TestCase):
             ],
             [param.location for param in all_doc.parameters],
         )
+
+    def test_response_cache_body(self):
+        simple_search = test(
+            {
+                "handler_class": SimpleSearch,
+                "handler_config": {
+                    "model_class": User,
+                    "readable_columns": ["id", "name"],
+                    "searchable_columns": ["name"],
+                    "default_sort_column": "name",
+                    "authentication": Public(),
+                    "cache_ttl": 60,
+                },
+            }
+        )
+        users = simple_search.build(User)
+        users.create({"id": "1", "name": "conor"})
+        users.create({"id": "2", "name": "ronoc"})
+        response = simple_search(method="GET", body={"name": "conor"})
+        self.assertEqual([{"id": "1", "name": "conor"}], response[0]["data"])
+        # the body is part of the search, so it has to be part of the cache key too
+        response = simple_search(method="GET", body={"name": "ronoc"})
+        self.assertEqual([{"id": "2", "name": "ronoc"}], response[0]["data"])
@@ -36,24 +36,7 @@ class Update(Write):
         if not model_id:
             return self.error(input_output, "Not Found", 404)
         id_column_name = self.id_column_name
-        models = self._model.where(f"{id_column_name}={model_id}")
-        for where in self.configuration("where"):
-            if type(where) == str:
-                models = models.where(where)
-            else:
-                models = self._di.call_function(
-                    where, models=models, input_output=input_output, routing_data=input_output.routing_data()
-                )
-        models = models.where_for_request(
-            models,
-            input_output.routing_data(),
-            input_output.get_authorization_data(),
-            input_output,
-            overrides=self.configuration("column_overrides"),
-        )
-        authorization = self._configuration.get("authorization", None)
-        if authorization and hasattr(authorization, "filter_models"):
-            models = authorization.filter_models(models, input_output.get_authorization_data(), input_output)
+        models = self._filter_models(self._model.where(f"{id_column_name}={model_id}"), input_output)
         model = models.first()
         if not model.exists and not self._configuration.get("upsert"):
             return self.error(input_output, "Not Found", 404)
@@ -77,20 +60,7 @@ class Update(Write):
 
     def _check_configuration(self, configuration):
         super()._check_configuration(configuration)
-        error_prefix = "Configuration error for %s:" % (self.__class__.__name__)
-        if "where" in configuration:
-            if not hasattr(configuration["where"], "__iter__") or type(configuration["where"]) == str:
-                raise ValueError(
-                    f"{error_prefix} 'where' should be an iterable of coditions or callables "
-                    + ", not "
-                    + str(type(configuration["where"])),
-                )
-            for index, where in enumerate(configuration["where"]):
-                if type(where) != str and not callable(where):
-                    raise ValueError(
-                        f"{error_prefix} 'where' entry should be a string with a condition or a callable that filters models "
-                        + f", but entry #{index+1} is neither of these",
-                    )
+        self._check_where_configuration(configuration)
 
     def documentation(self):
         nice_model = string.camel_case_to_words(self._model.__class__.__name__)
@@ -15,6 +15,7 @@ class Write(Base, InputProcessing):
     _authentication = None
     _writeable_columns = None
     _readable_columns = None
+    _invalidates_cached_responses = True
 
     _configuration_defaults = {
         "model": None,
@@ -96,6 +97,45 @@ class Write(Base, InputProcessing):
             if column_name not in self._columns:
                 raise KeyError(f"{error_prefix} specified readable column '{column_name}' does not exist")
 
+    def _check_where_configuration(self, configuration):
+        error_prefix = "Configuration error for %s:" % (self.__class__.__name__)
+        if "where" in configuration:
+            if not hasattr(configuration["where"], "__iter__") or type(configuration["where"]) == str:
+                raise ValueError(
+                    f"{error_prefix} 'where' should be an iterable of coditions or callables "
+                    + ", not "
+                    + str(type(configuration["where"])),
+                )
+            for index, where in enumerate(configuration["where"]):
+                if type(where) != str and not callable(where):
+                    raise ValueError(
+                        f"{error_prefix} 'where' entry should be a string with a condition or a callable that filters models "
+                        + f", but entry #{index+1} is neither of these",
+                    )
+
+    def _filter_models(self, models, input_output):
+        """
+        Restricts the models to the ones that can be changed: the 'where' configuration plus any authorization.
+        """
+        for where in self.configuration("where"):
+            if type(where) == str:
+                models = models.where(where)
+            else:
+                models = self._di.call_function(
+                    where, models=models, input_output=input_output, routing_data=input_output.routing_data()
+                )
+        models = models.where_for_request(
+            models,
+            input_output.routing_data(),
+            input_output.get_authorization_data(),
+            input_output,
+            overrides=self.configuration("column_overrides"),
+        )
+        authorization = self._configuration.get("authorization", None)
+        if authorization and hasattr(authorization, "filter_models"):
+            models = authorization.filter_models(models, input_output.get_authorization_data(), input_output)
+        return models
+
     def _get_rw_columns(self, rw_type):
         column_names = self.configuration("columns")
         if column_names is None:
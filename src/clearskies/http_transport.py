@@ -0,0 +1,150 @@
+import threading
+import time
+import weakref
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+
+class HttpTransport(HTTPAdapter):
+    """
+    A requests transport adapter with default timeouts, optional keep-alive, and per-host statistics.
+
+    Statistics are kept for every host the adapter talks to, and can be fetched with `stats`:
+
+    ```
+    requests = di.build("requests", cache=True)
+    print(requests.get_adapter("https://").stats())
+    ```
+
+    For each host this returns the number of requests and errors, the total, average, and maximum latency (in seconds),
+    and how many requests opened a new connection versus reusing a pooled one.  A high number of new connections
+    usually means that `pool_maxsize` is too small for the number of concurrent requests.
+
+    With a `rate_limiter` (see RateLimiter), every request waits for its turn, and responses saying that the host is
+    overloaded (429 or 503, limited to `retry_statuses` and `retry_methods` if given) are retried up to
+    `rate_limit_retries` times once the host is available again - after the `Retry-After` the host asked for, or with
+    exponential backoff (`backoff_factor`) if it didn't say.
+    """
+
+    _timeout = None
+    _keep_alive = True
+    _rate_limiter = None
+    _rate_limit_retries = 0
+    _backoff_factor = 0
+    _retry_statuses = None
+    _retry_methods = None
+    _stats = None
+    _stats_lock = None
+    _sockets = None
+
+    def __init__(
+        self,
+        timeout=None,
+        keep_alive=True,
+        rate_limiter=None,
+        rate_limit_retries=0,
+        backoff_factor=0,
+        retry_statuses=None,
+        retry_methods=None,
+        **kwargs,
+    ):
+        self._timeout = timeout
+        self._keep_alive = keep_alive
+        self._rate_limiter = rate_limiter
+        self._rate_limit_retries = rate_limit_retries
+        self._backoff_factor = backoff_factor
+        self._retry_statuses = retry_statuses
+        self._retry_methods = retry_methods
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+        self._sockets = weakref.WeakSet()
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self._timeout
+        if not self._keep_alive:
+            request.headers["Connection"] = "close"
+
+        host = urlparse(request.url).netloc
+        attempt = 0
+        while True:
+            response = self._send(host, request, timeout=timeout, **kwargs)
+            if attempt >= self._rate_limit_retries or not self._should_retry(request, response):
+                return response
+            # the rate limiter already paused the host if we were told how long to wait, otherwise we back off
+            if self._rate_limiter.retry_after(response) is None:
+                self._rate_limiter.pause(host, self._backoff_factor * (2**attempt))
+            attempt += 1
+            response.close()
+
+    def _should_retry(self, request, response):
+        if not self._rate_limiter or response.status_code not in self._rate_limiter.overloaded_statuses:
+            return False
+        if self._retry_statuses is not None and response.status_code not in self._retry_statuses:
+            return False
+        return self._retry_methods is None or request.method.upper() in self._retry_methods
+
+    def _send(self, host, request, timeout=None, **kwargs):
+        started_at = self._rate_limiter.acquire(host) if self._rate_limiter else None
+        start = time.monotonic()
+        try:
+            response = super().send(request, timeout=timeout, **kwargs)
+        except Exception:
+            self._record(host, time.monotonic() - start, None, error=True)
+            if self._rate_limiter:
+                self._rate_limiter.release(host, started_at)
+            raise
+        self._record(host, time.monotonic() - start, self._is_new_connection(response), error=False)
+        if self._rate_limiter:
+            self._rate_limiter.release(host, started_at, response)
+        return response
+
+    def _is_new_connection(self, response):
+        """
+        Returns whether the response came over a socket we haven't used before (or None if we can't tell)
+
+        Connection objects are recycled by the pool even when they have to reconnect, so we track the sockets instead.
+        """
+        connection = getattr(response.raw, "_connection", None)
+        sock = getattr(connection, "sock", None) if connection else None
+        if sock is None:
+            return None
+        with self._stats_lock:
+            is_new = sock not in self._sockets
+            self._sockets.add(sock)
+        return is_new
+
+    def _record(self, host, latency, new_connection, error=False):
+        with self._stats_lock:
+            if host not in self._stats:
+                self._stats[host] = {
+                    "requests": 0,
+                    "errors": 0,
+                    "new_connections": 0,
+                    "reused_connections": 0,
+                    "total_time": 0.0,
+                    "max_time": 0.0,
+                }
+            stats = self._stats[host]
+            stats["requests"] += 1
+            stats["total_time"] += latency
+            stats["max_time"] = max(stats["max_time"], latency)
+            if error:
+                stats["errors"] += 1
+            if new_connection is True:
+                stats["new_connections"] += 1
+            elif new_connection is False:
+                stats["reused_connections"] += 1
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                host: {**stats, "average_time": stats["total_time"] / stats["requests"] if stats["requests"] else 0}
+                for (host, stats) in self._stats.items()
+            }
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats = {}
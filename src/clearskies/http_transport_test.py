@@ -0,0 +1,88 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+import unittest
+
+import requests
+
+from .di import StandardDependencies
+from .http_transport import HttpTransport
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    rate_limited = 0
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(0.5)
+        if self.path == "/rate-limited" and Handler.rate_limited:
+            Handler.rate_limited -= 1
+            self.send_response(429)
+            self.send_header("Retry-After", "0.2")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b'{"status": "success"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class HttpTransportTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.host = f"127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_stats(self):
+        session = StandardDependencies().build("requests")
+        for i in range(3):
+            self.assertEqual({"status": "success"}, session.get(f"http://{self.host}/").json())
+        stats = session.get_adapter("http://").stats()[self.host]
+        self.assertEqual(3, stats["requests"])
+        self.assertEqual(0, stats["errors"])
+        self.assertEqual(1, stats["new_connections"])
+        self.assertEqual(2, stats["reused_connections"])
+        self.assertGreaterEqual(stats["max_time"], stats["average_time"])
+
+    def test_no_keep_alive(self):
+        session = requests.Session()
+        session.mount("http://", HttpTransport(keep_alive=False))
+        for i in range(2):
+            session.get(f"http://{self.host}/")
+        stats = session.get_adapter("http://").stats()[self.host]
+        self.assertEqual(2, stats["new_connections"])
+
+    def test_configured_timeout(self):
+        di = StandardDependencies()
+        di.bind("requests_configuration", {"timeout": 0.1, "retries": 0})
+        session = di.build("requests")
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            session.get(f"http://{self.host}/slow")
+        self.assertEqual(1, session.get_adapter("http://").stats()[self.host]["errors"])
+        # a timeout on the request itself takes precedence
+        self.assertEqual(200, session.get(f"http://{self.host}/slow", timeout=5).status_code)
+
+    def test_retry_after(self):
+        Handler.rate_limited = 2
+        session = StandardDependencies().build("requests")
+        start = time.monotonic()
+        self.assertEqual(200, session.get(f"http://{self.host}/rate-limited").status_code)
+        self.assertGreaterEqual(time.monotonic() - start, 0.4)
+        self.assertEqual(3, session.get_adapter("http://").stats()[self.host]["requests"])
+
+        Handler.rate_limited = 2
+        di = StandardDependencies()
+        di.bind("requests_configuration", {"retries": 1})
+        self.assertEqual(429, di.build("requests").get(f"http://{self.host}/rate-limited").status_code)
@@ -1,11 +1,14 @@
 from .cli import CLI
 from .input_output import InputOutput
+from .json_encoder import JsonEncoder, OrjsonEncoder
 from .wsgi import WSGI
 from . import exceptions
 
 __all__ = [
     "CLI",
     "InputOutput",
+    "JsonEncoder",
+    "OrjsonEncoder",
     "WSGI",
     "exceptions",
 ]
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from ..handlers.exceptions import ClientError
+from .json_encoder import JsonEncoder
 import json
 
+_default_json_encoder = JsonEncoder()
+
 
 class InputOutput(ABC):
     _response_headers = None
@@ -10,11 +13,30 @@ class InputOutput(ABC):
     _body_loaded_as_json = False
     _routing_data = None
     _authorization_data = None
+    _json_encoder = None
 
     @abstractmethod
     def respond(self, body, status_code=200):
         pass
 
+    def respond_stream(self, chunks, status_code=200):
+        """
+        Sends a response body that is built up as it goes, from an iterable of byte strings.
+
+        Contexts that can send the body to the client piece by piece (e.g. WSGI) override this.  Everything else
+        just collects the chunks and responds normally.
+        """
+        return self.respond(b"".join(chunks).decode("utf-8"), status_code)
+
+    def respond_json(self, body, encoded_body, status_code=200):
+        """
+        Sends a JSON response whose encoding (from `json_encoder()`) has already been worked out.
+
+        Contexts that send the body as bytes (e.g. WSGI) override this to use the encoded body instead of
+        encoding it again.  Everything else just responds normally.
+        """
+        return self.respond(body, status_code)
+
     def error(self, body):
         return self.respond(body, 400)
 
@@ -24,6 +46,15 @@ class InputOutput(ABC):
     def configure(self):
         pass
 
+    def set_json_encoder(self, json_encoder):
+        """
+        Sets the object used to turn response bodies into JSON (see JsonEncoder)
+        """
+        self._json_encoder = json_encoder
+
+    def json_encoder(self):
+        return self._json_encoder if self._json_encoder is not None else _default_json_encoder
+
     def has_header(self, key):
         if self._response_headers is None:
             return False
@@ -0,0 +1,47 @@
+import json
+
+
+class JsonEncoder:
+    """
+    Turns response bodies into JSON bytes, using the standard library.
+
+    This is the default encoder for input/outputs.  To use a different one, bind an object with an
+    `encode(body) -> bytes` method to the `json_encoder` dependency name, e.g.:
+
+    ```
+    clearskies.contexts.wsgi(application, bindings={"json_encoder": clearskies.input_outputs.OrjsonEncoder()})
+    ```
+    """
+
+    _encoder = None
+
+    def __init__(self, ensure_ascii=True, compact=False):
+        # the encoder is configured once rather than on every call to json.dumps
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=ensure_ascii,
+            separators=(",", ":") if compact else None,
+        )
+
+    def encode(self, body):
+        return self._encoder.encode(body).encode("utf-8")
+
+
+class OrjsonEncoder:
+    """
+    Turns response bodies into JSON bytes with orjson, which is much faster than the standard library.
+
+    orjson produces bytes directly, so there's no intermediate string.  Note that the output is always compact, and
+    unlike the standard library, orjson natively serializes datetimes, UUIDs, and dataclasses.  It requires the
+    orjson package (`pip install orjson`).
+    """
+
+    _orjson = None
+
+    def __init__(self):
+        # by importing orjson here, instead of at the top of the file, it is only needed if this encoder is used
+        import orjson
+
+        self._orjson = orjson
+
+    def encode(self, body):
+        return self._orjson.dumps(body)
@@ -1,6 +1,5 @@
 from .input_output import InputOutput
 import urllib, urllib.parse
-import json
 
 
 class WSGI(InputOutput):
@@ -31,9 +30,20 @@ class WSGI(InputOutput):
         elif type(body) == str:
             final_body = body.encode("utf-8")
         else:
-            final_body = json.dumps(body).encode("utf-8")
+            final_body = self.json_encoder().encode(body)
         return [final_body]
 
+    def respond_json(self, body, encoded_body, status_code=200):
+        return self.respond(encoded_body, status_code)
+
+    def respond_stream(self, chunks, status_code=200):
+        if not self.has_header("content-type"):
+            self.set_header("content-type", "application/json; charset=UTF-8")
+
+        # the WSGI server iterates over the chunks and sends each one as it is produced
+        self._start_response(f"{status_code} Ok", [header for header in self._response_headers.items()])
+        return chunks
+
     def has_body(self):
         return bool(self.get_body())
 
@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import MagicMock, call
+from .json_encoder import JsonEncoder
 from .wsgi import WSGI
 from io import BytesIO
 
@@ -17,6 +18,36 @@ class WSGITest(unittest.TestCase):
             "200 Ok", [("JANE", "kay"), ("HEY", "sup"), ("CONTENT-TYPE", "application/json; charset=UTF-8")]
         )
 
+    def test_json_encoder(self):
+        wsgi = WSGI({}, MagicMock())
+        self.assertEqual([b'{"name": "caf\\u00e9"}'], wsgi.respond({"name": "café"}, 200))
+
+        wsgi = WSGI({}, MagicMock())
+        wsgi.set_json_encoder(JsonEncoder(ensure_ascii=False, compact=True))
+        self.assertEqual(['{"name":"café","ids":[1,2]}'.encode("utf-8")], wsgi.respond({"name": "café", "ids": [1, 2]}))
+
+    def test_respond_json(self):
+        wsgi = WSGI({}, MagicMock())
+        self.assertEqual(
+            [b'{"already": "encoded"}'], wsgi.respond_json({"name": "bob"}, b'{"already": "encoded"}', 200)
+        )
+
+    def test_respond_stream(self):
+        start_response = MagicMock()
+        wsgi = WSGI({}, start_response)
+        produced = []
+
+        def chunks():
+            for chunk in [b"[1,", b"2]"]:
+                produced.append(chunk)
+                yield chunk
+
+        response = wsgi.respond_stream(chunks(), 200)
+        start_response.assert_called_with("200 Ok", [("CONTENT-TYPE", "application/json; charset=UTF-8")])
+        # nothing is produced until the server asks for it
+        self.assertEqual([], produced)
+        self.assertEqual([b"[1,", b"2]"], list(response))
+
     def test_environment(self):
         start_response = MagicMock()
         wsgi = WSGI(
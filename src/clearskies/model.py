@@ -83,6 +83,33 @@ class Model(Models):
 
         return self.get_transformed_from_data(column_name, self._data, silent=silent)
 
+    def get_many(self: Self, column_names):
+        """
+        Returns a list with the values of the given columns, just like calling `model.get(column_name, silent=True)`
+        for each of them, but with less overhead (which adds up when serializing a lot of records)
+        """
+        if not self.exists:
+            return [None] * len(column_names)
+
+        data = self._data
+        transformed = self._transformed
+        columns = self.columns()
+        values = []
+        for column_name in column_names:
+            if column_name in transformed:
+                values.append(transformed[column_name])
+                continue
+            value = data.get(column_name)
+            if value is None:
+                # the slow path checks for columns that can provide the value
+                values.append(self.get_transformed_from_data(column_name, data, silent=True))
+                continue
+            if column_name in columns:
+                value = self._backend.column_from_backend(columns[column_name], value)
+            transformed[column_name] = value
+            values.append(value)
+        return values
+
     def get_transformed_from_data(self: Self, column_name, data, cache=True, check_providers=True, silent=False):
         if cache and column_name in self._transformed:
             return self._transformed[column_name]
@@ -133,6 +160,22 @@ class Model(Models):
 
         Executes an update if the model corresponds to a record already, or an insert if not
         """
+        save = self._start_save(data, columns=columns)
+        if self.exists:
+            new_data = self._backend.update(self._data[self.id_column_name], save["to_save"], self)
+        else:
+            new_data = self._backend.create(save["to_save"], self)
+        self._finish_save(save, new_data)
+        return True
+
+    def _start_save(self: Self, data, columns=None):
+        """
+        Runs everything that happens before a save hits the backend, and returns the state needed to finish it.
+
+        The data to send to the backend is under the `to_save` key.  Once the backend is done, pass the state and
+        the record returned by the backend to `_finish_save`.  This split is what lets Models.create_many send
+        several records to the backend at once.
+        """
         if not len(data):
             raise ValueError("You have to pass in something to save!")
         save_columns = self.columns()
@@ -148,10 +191,19 @@ class Model(Models):
 
         [to_save, temporary_data] = self.columns_to_backend(data, save_columns)
         to_save = self.to_backend(to_save, save_columns)
-        if self.exists:
-            new_data = self._backend.update(self._data[self.id_column_name], to_save, self)
-        else:
-            new_data = self._backend.create(to_save, self)
+        return {
+            "data": data,
+            "old_data": old_data,
+            "to_save": to_save,
+            "temporary_data": temporary_data,
+            "save_columns": save_columns,
+        }
+
+    def _finish_save(self: Self, save, new_data) -> None:
+        data = save["data"]
+        save_columns = save["save_columns"]
+        temporary_data = save["temporary_data"]
+        old_data = save["old_data"]
         id = self._backend.column_from_backend(save_columns[self.id_column_name], new_data[self.id_column_name])
 
         # if we had any temporary columns add them back in
@@ -171,8 +223,6 @@ class Model(Models):
         self.columns_save_finished(save_columns)
         self.save_finished()
 
-        return True
-
     def is_changing(self: Self, key, data) -> bool:
         """
         Returns True/False to denote if the given column is being modified by the active save operation
@@ -167,6 +167,16 @@ class ModelTest(unittest.TestCase):
             user.blah
         self.assertEqual("\"Unknown column 'blah' requested from model 'User'\"", str(context.exception))
 
+    def test_get_many(self):
+        backend = type("", (), {"column_from_backend": lambda self, column, value: column.from_backend(value)})()
+        user = User(backend, self.columns)
+        user.data = {"id": 5, "name": "hey", "age": "10", "birth_date": None}
+        self.assertEqual(
+            [5, 10, "hey blahblah", None, None],
+            user.get_many(["id", "age", "blahbblah", "birth_date", "unknown"]),
+        )
+        self.assertEqual([None, None], User(backend, self.columns).get_many(["id", "name"]))
+
     def test_get_simple_empty(self):
         user = User("cursor", self.columns)
         self.assertEqual(False, user.exists)
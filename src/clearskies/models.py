@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from .condition_parser import ConditionParser
 from typing import Any, Callable, Dict, List, Tuple, Iterator
 
@@ -111,6 +113,18 @@ class Models(ABC, ConditionParser):
         self._next_page_data = None
         return self
 
+    def select_columns(self: Self, column_names: List[str]) -> Self:
+        """
+        Loads only the given columns of our table (plus the id) instead of all of them.
+
+        The column names are backend column names (see Column.backend_column_names).  Anything else already being
+        selected (e.g. columns from joined tables) is kept.
+        """
+        table_name = self.get_table_name()
+        id_column_name = self.get_id_column_name()
+        column_names = [id_column_name, *[name for name in column_names if name != id_column_name]]
+        return self.select_all(False).select(", ".join([f"{table_name}.{name}" for name in column_names]))
+
     def select_all(self: Self, select_all=True) -> Self:
         return self.clone().select_all_in_place(select_all=select_all)
 
@@ -134,6 +148,24 @@ class Models(ABC, ConditionParser):
         self.must_recount = True
         return self
 
+    def where_condition(self: Self, column: str, operator: str, values: List[Any], table: str = "") -> Self:
+        """
+        Adds a condition built from its parts (see ConditionParser.build_condition) and returns a new Models object.
+
+        Use this instead of `where` when the values come from elsewhere (e.g. the client), since they aren't parsed
+        out of a string: `models.where_condition("id", "in", ids)`
+        """
+        return self.clone().where_condition_in_place(column, operator, values, table=table)
+
+    def where_condition_in_place(self: Self, column: str, operator: str, values: List[Any], table: str = "") -> Self:
+        condition = self.build_condition(column, operator, values, table=table)
+        self._validate_column(condition["column"], "filter", table=condition["table"])
+        self.query_wheres.append(condition)
+        self.must_rexecute = True
+        self._next_page_data = None
+        self.must_recount = True
+        return self
+
     def join(self: Self, join: str) -> Self:
         return self.clone().join_in_place(join)
 
@@ -287,19 +319,100 @@ class Models(ABC, ConditionParser):
             self.empty_model(),
             next_page_data=self._next_page_data,
         )
-        models = iter([self.model(row) for row in raw_rows])
-        return models
+        # backends may stream their records, so build the models as we go
+        return (self.model(row) for row in raw_rows)
+
+    def batches(self: Self, batch_size: int = 100) -> Iterator[List[Self]]:
+        """
+        Yields the matching models in lists of up to `batch_size`, building each batch as the backend returns records.
 
-    def paginate_all(self: Self) -> List[Self]:
+        This is the same query as iterating over the models, but only one batch has to be held at a time (as long as
+        the backend streams its records: see Backend.records).  As with iteration, `next_page_data` is available once
+        all the batches have been consumed.
+        """
+        iterator = self.__iter__()
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    async def fetch_async(self: Self) -> List[Self]:
+        """
+        Returns the matching models (i.e. what you get by iterating over the models) without blocking the event loop.
+
+        The backend has to support this (see Backend.records_async): otherwise the query still blocks.
+        """
+        self._next_page_data = {}
+        raw_rows = await self._backend.records_async(
+            self.query_configuration,
+            self.empty_model(),
+            next_page_data=self._next_page_data,
+        )
+        return [self.model(row) for row in raw_rows]
+
+    async def count_async(self: Self) -> int:
+        """
+        Returns the number of matching models (i.e. `len(models)`) without blocking the event loop.
+        """
+        if self.must_recount:
+            self.count = await self._backend.count_async(self.query_configuration, self.empty_model())
+            self.must_recount = False
+        return self.count
+
+    def paginate_all(self: Self, concurrency: int = 1) -> List[Self]:
+        """
+        Returns all matching models, fetching every page.
+
+        By default pages are fetched one after another.  Set `concurrency` to fetch up to that many pages at once
+        from backends that can predict their upcoming pages (see Backend.predict_next_pages), e.g. APIs with
+        offset-based pagination.  Results stay in order, and we stop at the first page that doesn't have a next page.
+        """
         next_models = self.clone()
         results = list(next_models.__iter__())
         next_page_data = next_models.next_page_data()
+        if concurrency > 1 and next_page_data:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results.extend(self._paginate_concurrently(executor, next_models, next_page_data, concurrency))
+            return results
+
         while next_page_data:
             next_models = next_models.clone().pagination(**next_page_data)
             results.extend(next_models.__iter__())
             next_page_data = next_models.next_page_data()
         return results
 
+    def _paginate_concurrently(self: Self, executor, next_models, next_page_data, concurrency: int) -> List[Self]:
+        results = []
+        while next_page_data:
+            paginations = self._backend.predict_next_pages(next_models.query_configuration, next_page_data, concurrency)
+            if not paginations:
+                next_models = next_models.clone().pagination(**next_page_data)
+                results.extend(next_models.__iter__())
+                next_page_data = next_models.next_page_data()
+                continue
+
+            pages = [next_models.clone().pagination(**pagination) for pagination in paginations]
+            futures = [executor.submit(lambda page: list(page.__iter__()), page) for page in pages]
+            for page, future in zip(pages, futures):
+                results.extend(future.result())
+                next_models = page
+                next_page_data = page.next_page_data()
+                if not next_page_data:
+                    # anything past the last page will come back empty anyway
+                    for future in futures:
+                        future.cancel()
+                    break
+        return results
+
+    def prefetch(self: Self, column_name: str, values: List[Any]) -> None:
+        """
+        Lets the backend know that records matching each of the given values are about to be looked up one by one.
+
+        See Backend.prefetch
+        """
+        self._backend.prefetch(self.empty_model(), column_name, values)
+
     def model(self: Self, data) -> Self:
         model = self._build_model()
         model.data = data
@@ -317,6 +430,22 @@ class Models(ABC, ConditionParser):
         empty.save(data)
         return empty
 
+    def create_many(self: Self, records: List[Dict[str, Any]], columns=None) -> List[Self]:
+        """
+        Creates a new model for each of the given data dictionaries and returns them, in the same order.
+
+        Each model goes through the same hooks as `create`, but the records are sent to the backend together
+        (see Backend.create_many), which is much faster for backends that can insert several records at once.
+        """
+        if not records:
+            return []
+        models = [self.model({}) for record in records]
+        saves = [model._start_save(record, columns=columns) for (model, record) in zip(models, records)]
+        new_records = self._backend.create_many([save["to_save"] for save in saves], models[0])
+        for model, save, new_data in zip(models, saves, new_records):
+            model._finish_save(save, new_data)
+        return models
+
     def first(self: Self) -> Self:
         iter = self.__iter__()
         try:
@@ -1,6 +1,8 @@
+import asyncio
 import unittest
 from unittest.mock import MagicMock, call
 from .models import Models
+from .backends import ApiBackend
 from .model import Model
 from .di import StandardDependencies
 from . import column_types
@@ -237,3 +239,92 @@ class TestModels(unittest.TestCase):
         )
         self.assertEqual({"start": 5}, call_configuration["pagination"])
         self.assertEqual("users", call_configuration["table_name"])
+
+    def paginated_api_backend(self, number_records):
+        records = [{"id": index + 1, "age": index} for index in range(number_records)]
+        requested_starts = []
+
+        def request(method, url, headers={}, json={}, auth=None):
+            start = json.get("start", 0)
+            requested_starts.append(start)
+            data = records[start : start + json["limit"]]
+            return type("", (), {"ok": True, "json": lambda: {"data": data}})
+
+        backend = ApiBackend(type("", (), {"request": staticmethod(request)})())
+        backend.configure(url="https://example.com")
+        return [backend, requested_starts]
+
+    def test_paginate_all(self):
+        [backend, requested_starts] = self.paginated_api_backend(7)
+        users = Users(backend, self.columns).limit(2).paginate_all()
+        self.assertEqual([1, 2, 3, 4, 5, 6, 7], [user.id for user in users])
+        self.assertEqual([0, 2, 4, 6], requested_starts)
+
+    def test_paginate_all_concurrently(self):
+        [backend, requested_starts] = self.paginated_api_backend(7)
+        users = Users(backend, self.columns).limit(2).paginate_all(concurrency=3)
+        self.assertEqual([1, 2, 3, 4, 5, 6, 7], [user.id for user in users])
+        self.assertEqual([0, 2, 4, 6], sorted(requested_starts))
+
+        # a full last page means we fetch one page too many, and possibly a few more that get thrown away
+        [backend, requested_starts] = self.paginated_api_backend(8)
+        users = Users(backend, self.columns).limit(2).paginate_all(concurrency=3)
+        self.assertEqual([1, 2, 3, 4, 5, 6, 7, 8], [user.id for user in users])
+        self.assertEqual([0, 2, 4, 6, 8], sorted(requested_starts)[:5])
+
+    def test_predict_next_pages(self):
+        [backend, requested_starts] = self.paginated_api_backend(0)
+        self.assertEqual(
+            [{"start": 10}, {"start": 20}],
+            backend.predict_next_pages({"limit": 10, "pagination": {"start": 0}}, {"start": 10}, 2),
+        )
+        self.assertEqual(None, backend.predict_next_pages({"limit": 10, "pagination": {}}, {"start": 50}, 2))
+        self.assertEqual(None, backend.predict_next_pages({"limit": 10, "pagination": {}}, {"cursor": "asdf"}, 2))
+
+    def test_fetch_and_count_async(self):
+        [backend, requested_starts] = self.paginated_api_backend(3)
+        users = Users(backend, self.columns).limit(2)
+        self.assertEqual([1, 2], [user.id for user in asyncio.run(users.fetch_async())])
+        self.assertEqual({"start": 2}, users.next_page_data())
+
+        backend.count = MagicMock(return_value=3)
+        self.assertEqual(3, asyncio.run(users.count_async()))
+
+    def test_create_many(self):
+        backend = type(
+            "",
+            (),
+            {
+                "create_many": MagicMock(return_value=[{"id": 1, "last_name": "a"}, {"id": 2, "last_name": "b"}]),
+                "column_to_backend": lambda self, column, data: column.to_backend(data),
+                "column_from_backend": lambda self, column, value: column.from_backend(value),
+            },
+        )()
+        users = Users(backend, self.columns)
+        created = users.create_many([{"last_name": "a"}, {"last_name": "b"}])
+        self.assertEqual([1, 2], [user.id for user in created])
+        self.assertEqual(["a", "b"], [user.last_name for user in created])
+        # everything went to the backend at once, after going through the column hooks
+        [records, model] = backend.create_many.call_args.args
+        self.assertEqual(["a", "b"], [record["last_name"] for record in records])
+        self.assertIn("created", records[0])
+
+    def test_select_columns(self):
+        users = Users("cursor", self.columns).select("posts.title AS post_title").select_columns(["age", "id"])
+        self.assertFalse(users.query_configuration["select_all"])
+        self.assertEqual(["posts.title AS post_title", "users.id, users.age"], users.query_configuration["selects"])
+
+    def test_where_condition(self):
+        users = Users("cursor", self.columns).where_condition("last_name", "in", ["o'neil", "smith, jr"])
+        self.assertEqual(
+            {
+                "table": "",
+                "column": "last_name",
+                "operator": "IN",
+                "values": ["o'neil", "smith, jr"],
+                "parsed": "`last_name` IN (%s, %s)",
+            },
+            users.query_configuration["wheres"][0],
+        )
+        users = users.where_condition("id", ">", [5], table="users")
+        self.assertEqual("users.id>%s", users.query_configuration["wheres"][1]["parsed"])
@@ -0,0 +1,157 @@
+import email.utils
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Client-side, per-host rate limiting for outgoing HTTP requests.
+
+    Every request waits in `acquire` until its host allows it, and reports back with `release`.  Three things are
+    taken into account:
+
+     1. A token bucket: if `requests_per_second` is set, each host gets that many requests per second, with bursts of
+        up to `burst` requests.
+     2. The server's rate limit headers: a `Retry-After` header (on a 429 or 503), or an exhausted
+        `X-RateLimit-Remaining`/`RateLimit-Remaining` with its corresponding `Reset` header, pauses all requests to
+        that host until the given time (but never for more than `max_wait` seconds).
+     3. Adaptive (AIMD) concurrency: if `max_concurrency` is set, the number of requests in flight to each host is
+        limited.  The limit is halved whenever the host says it is overloaded (429 or 503) and grows back by one
+        request for each round of successful requests, so it settles just below what the host can sustain.
+
+    Since the state is shared by all threads using the limiter, a rate limited host slows everyone down at once
+    instead of each thread running into the limit on its own.
+    """
+
+    overloaded_statuses = [429, 503]
+
+    requests_per_second = None
+    burst = None
+    max_concurrency = None
+    max_wait = None
+    _hosts = None
+    _condition = None
+
+    def __init__(self, requests_per_second=None, burst=None, max_concurrency=None, max_wait=60):
+        self.requests_per_second = requests_per_second
+        self.burst = burst if burst else max(1, requests_per_second if requests_per_second else 1)
+        self.max_concurrency = max_concurrency
+        self.max_wait = max_wait
+        self._hosts = {}
+        self._condition = threading.Condition()
+
+    def acquire(self, host):
+        """
+        Waits until a request to the given host is allowed, and returns the time it started (for `release`)
+        """
+        with self._condition:
+            state = self._host(host)
+            while True:
+                now = time.monotonic()
+                if state["paused_until"] > now:
+                    self._condition.wait(state["paused_until"] - now)
+                    continue
+                if self.max_concurrency and state["in_flight"] >= int(state["concurrency"]):
+                    self._condition.wait()
+                    continue
+                if self.requests_per_second:
+                    state["tokens"] = min(
+                        self.burst, state["tokens"] + (now - state["updated_at"]) * self.requests_per_second
+                    )
+                    state["updated_at"] = now
+                    if state["tokens"] < 1:
+                        self._condition.wait((1 - state["tokens"]) / self.requests_per_second)
+                        continue
+                    state["tokens"] -= 1
+                state["in_flight"] += 1
+                return now
+
+    def release(self, host, started_at, response=None):
+        """
+        Records the outcome of a request started with `acquire`.  `response` is None if the request failed outright.
+        """
+        with self._condition:
+            state = self._host(host)
+            state["in_flight"] -= 1
+            if response is not None:
+                if response.status_code in self.overloaded_statuses:
+                    # only back off once for all the requests that were already in flight when the host got overloaded
+                    if started_at >= state["decreased_at"]:
+                        state["concurrency"] = max(1, state["concurrency"] / 2)
+                        state["decreased_at"] = time.monotonic()
+                    delay = self.retry_after(response)
+                elif self.max_concurrency:
+                    state["concurrency"] = min(self.max_concurrency, state["concurrency"] + 1 / state["concurrency"])
+                    delay = self._rate_limit_reset(response)
+                else:
+                    delay = self._rate_limit_reset(response)
+                if delay:
+                    self._pause(state, delay)
+            self._condition.notify_all()
+
+    def pause(self, host, seconds):
+        """
+        Holds all requests to the given host for the given number of seconds
+        """
+        with self._condition:
+            self._pause(self._host(host), seconds)
+            self._condition.notify_all()
+
+    def concurrency(self, host):
+        """
+        Returns the current concurrency limit for the given host (or None if concurrency isn't limited)
+        """
+        if not self.max_concurrency:
+            return None
+        with self._condition:
+            return int(self._host(host)["concurrency"])
+
+    def retry_after(self, response):
+        """
+        Returns the number of seconds the `Retry-After` header of the response asks us to wait (or None)
+        """
+        value = (getattr(response, "headers", None) or {}).get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _rate_limit_reset(self, response):
+        """
+        Returns how long to wait if the response says we have used up our rate limit (or None)
+        """
+        headers = getattr(response, "headers", None) or {}
+        for prefix in ["X-RateLimit-", "RateLimit-"]:
+            remaining = headers.get(f"{prefix}Remaining")
+            if remaining is None:
+                continue
+            try:
+                if float(remaining) > 0:
+                    return None
+                reset = float(headers.get(f"{prefix}Reset", 1))
+            except ValueError:
+                return None
+            # the reset time is sometimes a number of seconds, and sometimes a unix timestamp
+            return max(0, reset - time.time()) if reset > 1_000_000_000 else reset
+        return None
+
+    def _pause(self, state, seconds):
+        state["paused_until"] = max(state["paused_until"], time.monotonic() + min(seconds, self.max_wait))
+
+    def _host(self, host):
+        if host not in self._hosts:
+            self._hosts[host] = {
+                "tokens": self.burst,
+                "updated_at": time.monotonic(),
+                "paused_until": 0,
+                "in_flight": 0,
+                "concurrency": self.max_concurrency if self.max_concurrency else 1,
+                "decreased_at": 0,
+            }
+        return self._hosts[host]
@@ -0,0 +1,78 @@
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from .rate_limiter import RateLimiter
+
+
+class RateLimiterTest(unittest.TestCase):
+    def response(self, status_code=200, headers=None):
+        return SimpleNamespace(status_code=status_code, headers=headers or {})
+
+    def test_token_bucket(self):
+        limiter = RateLimiter(requests_per_second=20, burst=2)
+        start = time.monotonic()
+        for i in range(4):
+            limiter.release("example.com", limiter.acquire("example.com"), self.response())
+        # two requests in the burst, and then two more at 20 per second
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+        # other hosts have their own bucket
+        start = time.monotonic()
+        limiter.release("other.com", limiter.acquire("other.com"), self.response())
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    def test_retry_after(self):
+        limiter = RateLimiter()
+        self.assertEqual(2, limiter.retry_after(self.response(429, {"Retry-After": "2"})))
+        retry_at = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 30))
+        self.assertAlmostEqual(30, limiter.retry_after(self.response(429, {"Retry-After": retry_at})), delta=2)
+        self.assertEqual(None, limiter.retry_after(self.response(429)))
+
+        limiter.release("example.com", limiter.acquire("example.com"), self.response(429, {"Retry-After": "0.1"}))
+        start = time.monotonic()
+        limiter.acquire("example.com")
+        self.assertGreaterEqual(time.monotonic() - start, 0.08)
+
+    def test_rate_limit_headers(self):
+        limiter = RateLimiter(max_wait=0.1)
+        response = self.response(headers={"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "30"})
+        limiter.release("example.com", limiter.acquire("example.com"), response)
+        start = time.monotonic()
+        started_at = limiter.acquire("example.com")
+        self.assertLess(time.monotonic() - start, 0.05)
+
+        # out of requests until the reset time, but we never wait for more than max_wait
+        response = self.response(headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 30)})
+        limiter.release("example.com", started_at, response)
+        start = time.monotonic()
+        limiter.acquire("example.com")
+        self.assertGreaterEqual(time.monotonic() - start, 0.08)
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_adaptive_concurrency(self):
+        limiter = RateLimiter(max_concurrency=8)
+        self.assertEqual(8, limiter.concurrency("example.com"))
+
+        # several requests get rejected at once, but that only counts as one decrease
+        started = [limiter.acquire("example.com") for i in range(4)]
+        for started_at in started:
+            limiter.release("example.com", started_at, self.response(429))
+        self.assertEqual(4, limiter.concurrency("example.com"))
+
+        # and we grow back by (about) one for each round of successful requests
+        for i in range(5):
+            limiter.release("example.com", limiter.acquire("example.com"), self.response())
+        self.assertEqual(5, limiter.concurrency("example.com"))
+
+    def test_concurrency_limit(self):
+        limiter = RateLimiter(max_concurrency=1)
+        started_at = limiter.acquire("example.com")
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: acquired.set() if limiter.acquire("example.com") else None)
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+        limiter.release("example.com", started_at, self.response())
+        self.assertTrue(acquired.wait(1))
+        thread.join()